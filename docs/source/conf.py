@@ -30,7 +30,11 @@ autodoc_mock_imports = [
     "networkx",
     "numpy",
     "osgeo",
+    "osmium",
     "pandas",
+    "pyarrow",
+    "pyogrio",
+    "pyproj",
     "rasterio",
     "requests",
     "scipy",
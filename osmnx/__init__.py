@@ -18,6 +18,7 @@ from .elevation import add_node_elevations_google as add_node_elevations_google
 from .elevation import add_node_elevations_raster as add_node_elevations_raster
 from .features import features_from_address as features_from_address
 from .features import features_from_bbox as features_from_bbox
+from .features import features_from_pbf as features_from_pbf
 from .features import features_from_place as features_from_place
 from .features import features_from_point as features_from_point
 from .features import features_from_polygon as features_from_polygon
@@ -26,12 +27,17 @@ from .geocoder import geocode as geocode
 from .geocoder import geocode_to_gdf as geocode_to_gdf
 from .graph import graph_from_address as graph_from_address
 from .graph import graph_from_bbox as graph_from_bbox
+from .graph import graph_from_pbf as graph_from_pbf
 from .graph import graph_from_place as graph_from_place
 from .graph import graph_from_point as graph_from_point
 from .graph import graph_from_polygon as graph_from_polygon
 from .graph import graph_from_xml as graph_from_xml
+from .io import load_graph_parquet as load_graph_parquet
+from .io import load_graph_snapshot as load_graph_snapshot
 from .io import load_graphml as load_graphml
 from .io import save_graph_geopackage as save_graph_geopackage
+from .io import save_graph_parquet as save_graph_parquet
+from .io import save_graph_snapshot as save_graph_snapshot
 from .io import save_graph_xml as save_graph_xml
 from .io import save_graphml as save_graphml
 from .plot import plot_figure_ground as plot_figure_ground
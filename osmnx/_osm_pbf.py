@@ -0,0 +1,341 @@
+"""
+Read OSM PBF files.
+
+For file format information see https://wiki.openstreetmap.org/wiki/PBF_Format
+"""
+
+from __future__ import annotations
+
+import logging as lg
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from . import utils
+
+# osmium is an optional dependency for reading OSM PBF files
+osmium: Any
+try:
+    import osmium
+except ImportError:  # pragma: no cover
+    osmium = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+
+# matches one Overpass QL tag filter clause, such as ["highway"],
+# [!"highway"], ["highway"="primary"], ["area"!~"yes"], ["name"~"^Main",i] or
+# [~"^addr:.*$"~"^Foo$"], with single, double, or no quotes around key/value
+_CLAUSE_REGEX = re.compile(
+    r"""\[\s*(?P<neg>!)?\s*(?P<keyre>~)?\s*(?P<kq>["']?)(?P<key>.*?)(?P=kq)\s*"""
+    r"""(?:(?P<op>!=|!~|=|~)\s*(?P<vq>["']?)(?P<val>.*?)(?P=vq)\s*"""
+    r"""(?P<icase>,\s*i)?)?\s*\]""",
+)
+
+# OSM element types as named by osmium relation members and by Overpass
+_MEMBER_TYPES = {"n": "node", "w": "way", "r": "relation"}
+
+
+def _tag_filter(way_filter: str) -> tuple[Callable[[dict[str, str]], bool], set[str]]:
+    """
+    Create a tag-matching function from an Overpass QL tag filter.
+
+    Supports the tag filter clauses OSMnx uses in its network type filters
+    and that users commonly pass as custom filters: key existence/absence,
+    (in)equality, and (negated) regular expression matches of values or of
+    keys and values, optionally case-insensitive. All clauses must match, as
+    when they are chained in an Overpass query.
+
+    Parameters
+    ----------
+    way_filter
+        The Overpass QL tag filter, such as `'["highway"]["area"!~"yes"]'`.
+
+    Returns
+    -------
+    matcher, required_keys
+        Function returning True if a `tag:value` dict matches the filter, and
+        a set of keys of which a matching element must have at least one (or
+        an empty set if there is no such constraint).
+    """
+    clauses = []
+    pos = 0
+    for match in _CLAUSE_REGEX.finditer(way_filter):
+        clause = _parse_clause(match) if way_filter[pos : match.start()].strip() == "" else None
+        if clause is None:
+            break
+        clauses.append(clause)
+        pos = match.end()
+
+    if way_filter[pos:].strip() != "":
+        msg = f"Cannot apply filter {way_filter!r} to a PBF file: unsupported syntax."
+        raise ValueError(msg)
+
+    # any key that must be present lets osmium skip non-matching elements
+    required_keys = next(({k} for k, op, _ in clauses if op in {"present", "=", "~"}), set())
+
+    def matcher(tags: dict[str, str]) -> bool:
+        return all(_clause_matches(tags, *clause) for clause in clauses)
+
+    return matcher, required_keys
+
+
+def _parse_clause(match: re.Match[str]) -> tuple[Any, str, Any] | None:
+    """
+    Parse one Overpass QL tag filter clause into a (key, op, value) tuple.
+
+    Parameters
+    ----------
+    match
+        The clause matched by `_CLAUSE_REGEX`.
+
+    Returns
+    -------
+    clause
+        The clause tuple, or None if it uses an unsupported combination.
+    """
+    neg, keyre, key, op, val, icase = match.group("neg", "keyre", "key", "op", "val", "icase")
+    flags = re.IGNORECASE if icase else 0
+    if keyre:
+        return (re.compile(key), "keyre", re.compile(val, flags)) if op == "~" else None
+    if neg:
+        return (key, "absent", None) if op is None else None
+    if op is None:
+        return (key, "present", None)
+    if op in {"~", "!~"}:
+        return (key, op, re.compile(val, flags))
+    return (key, op, val)
+
+
+def _clause_matches(tags: dict[str, str], key: Any, op: str, val: Any) -> bool:  # noqa: ANN401
+    """
+    Determine if an element's tags match one parsed tag filter clause.
+
+    Parameters
+    ----------
+    tags
+        The element's `tag:value` dict.
+    key
+        The clause's key, or compiled key regex if `op` is "keyre".
+    op
+        The clause's operator.
+    val
+        The clause's value, compiled value regex, or None.
+
+    Returns
+    -------
+    matches
+    """
+    if op == "keyre":
+        return any(key.search(k) and val.search(v) for k, v in tags.items())
+    value = tags.get(key)
+    if op in {"present", "absent"}:
+        return (value is not None) == (op == "present")
+    if op == "=":
+        return bool(value == val)
+    if op == "!=":
+        return bool(value != val)
+    if op == "~":
+        return value is not None and val.search(value) is not None
+    return value is None or val.search(value) is None
+
+
+def _processor(filepath: str | Path, entities: Any) -> Any:  # noqa: ANN401
+    """
+    Create an osmium file processor over some OSM entity types in a file.
+
+    libosmium decompresses and decodes the file's blobs in parallel on its own
+    thread pool while the processor is iterated.
+
+    Parameters
+    ----------
+    filepath
+        Path to file containing OSM PBF data.
+    entities
+        The osmium entity types to read from the file.
+
+    Returns
+    -------
+    processor
+    """
+    return osmium.FileProcessor(str(Path(filepath)), entities)
+
+
+def _tags(obj: Any) -> dict[str, str]:  # noqa: ANN401
+    """
+    Get an osmium OSM object's tags as a `tag:value` dict.
+
+    Parameters
+    ----------
+    obj
+        The osmium node, way, or relation.
+
+    Returns
+    -------
+    tags
+    """
+    # most nodes have no tags, and checking the length is much cheaper than
+    # iterating over an empty osmium tag list
+    tag_list = obj.tags
+    return {tag.k: tag.v for tag in tag_list} if len(tag_list) > 0 else {}
+
+
+def _network_elements_from_pbf(
+    filepath: str | Path,
+    way_filter: str,
+) -> Iterator[dict[str, Any]]:
+    """
+    Read the ways matching a filter and their nodes from an OSM PBF file.
+
+    The file is read twice: first for the ways matching the filter, then for
+    just the nodes those ways reference, so unrelated nodes are never turned
+    into Python objects. As in sorted OSM files, the nodes are yielded before
+    the ways that use them.
+
+    Parameters
+    ----------
+    filepath
+        Path to file containing OSM PBF data.
+    way_filter
+        The Overpass QL filter the ways must match.
+
+    Yields
+    ------
+    element
+        An Overpass-like node or way element.
+    """
+    matcher, required_keys = _tag_filter(way_filter)
+
+    processor = _processor(filepath, osmium.osm.WAY)
+    if len(required_keys) > 0:
+        processor = processor.with_filter(osmium.filter.KeyFilter(*required_keys))
+
+    ways = []
+    node_ids: set[int] = set()
+    for way in processor:
+        tags = _tags(way)
+        if matcher(tags):
+            nodes = [n.ref for n in way.nodes]
+            node_ids.update(nodes)
+            ways.append({"type": "way", "id": way.id, "nodes": nodes, "tags": tags})
+
+    msg = f"Read ways from {str(filepath)!r}, now reading their {len(node_ids):,} nodes"
+    utils.log(msg, level=lg.INFO)
+
+    processor = _processor(filepath, osmium.osm.NODE).with_filter(osmium.filter.IdFilter(node_ids))
+    for node in processor:
+        location = node.location
+        tags = _tags(node)
+        yield {
+            "type": "node",
+            "id": node.id,
+            "lat": location.lat,
+            "lon": location.lon,
+            "tags": tags,
+        }
+    yield from ways
+
+
+def _feature_elements_from_pbf(
+    filepath: str | Path,
+    query_tag_keys: set[str],
+) -> Iterator[dict[str, Any]]:
+    """
+    Read the elements with query tag keys and their members from a PBF file.
+
+    The file is read three times, for relations, ways, then nodes, so that
+    only the elements with any of the query tag keys (or with any tags at
+    all, if no query tag keys are passed) and the elements that compose
+    their geometries are turned into Python objects.
+
+    Parameters
+    ----------
+    filepath
+        Path to file containing OSM PBF data.
+    query_tag_keys
+        The keys of the tags used to query for matching features.
+
+    Yields
+    ------
+    element
+        An Overpass-like relation, way, or node element.
+    """
+
+    def _matches(tags: dict[str, str]) -> bool:
+        if len(query_tag_keys) == 0:
+            return len(tags) > 0
+        return len(query_tag_keys & tags.keys()) > 0
+
+    way_ids: set[int] = set()
+    for relation in _processor(filepath, osmium.osm.RELATION):
+        tags = _tags(relation)
+        if _matches(tags):
+            members = [
+                {"type": _MEMBER_TYPES[m.type], "ref": m.ref, "role": m.role}
+                for m in relation.members
+            ]
+            way_ids.update(m["ref"] for m in members if m["type"] == "way")
+            yield {"type": "relation", "id": relation.id, "members": members, "tags": tags}
+
+    node_ids: set[int] = set()
+    for way in _processor(filepath, osmium.osm.WAY):
+        tags = _tags(way)
+        if way.id in way_ids or _matches(tags):
+            nodes = [n.ref for n in way.nodes]
+            node_ids.update(nodes)
+            yield {"type": "way", "id": way.id, "nodes": nodes, "tags": tags}
+
+    for node in _processor(filepath, osmium.osm.NODE):
+        tags = _tags(node)
+        if node.id in node_ids or _matches(tags):
+            location = node.location
+            yield {
+                "type": "node",
+                "id": node.id,
+                "lat": location.lat,
+                "lon": location.lon,
+                "tags": tags,
+            }
+
+
+def _overpass_json_from_pbf(
+    filepath: str | Path,
+    *,
+    way_filter: str | None = None,
+    query_tag_keys: set[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Read OSM PBF data from file and return Overpass-like JSON.
+
+    If `way_filter` is passed, read only the ways matching it and their nodes,
+    like an Overpass network query. Otherwise, read the elements matching
+    `query_tag_keys` and their members, like an Overpass features query.
+
+    Parameters
+    ----------
+    filepath
+        Path to file containing OSM PBF data.
+    way_filter
+        The Overpass QL filter the ways must match.
+    query_tag_keys
+        The keys of the tags used to query for matching features.
+
+    Returns
+    -------
+    response_json
+        An Overpass-like JSON response whose "elements" value is a lazy
+        iterator that reads the file as it is consumed (only once).
+    """
+    # check up front: the elements are read lazily, so a missing osmium would
+    # otherwise only surface (as an unhelpful error) once they are consumed
+    if osmium is None:  # pragma: no cover
+        msg = "osmium must be installed as an optional dependency to read OSM PBF files."
+        raise ImportError(msg)
+
+    if way_filter is not None:
+        elements = _network_elements_from_pbf(filepath, way_filter)
+    else:
+        elements = _feature_elements_from_pbf(filepath, query_tag_keys or set())
+    return {"elements": elements}
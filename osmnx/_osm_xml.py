@@ -13,17 +13,13 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import TextIO
 from warnings import warn
-from xml.etree.ElementTree import Element
-from xml.etree.ElementTree import ElementTree
-from xml.etree.ElementTree import SubElement
-from xml.etree.ElementTree import parse as etree_parse
-from xml.sax import parse as sax_parse
-from xml.sax.handler import ContentHandler
+from xml.parsers.expat import ParserCreate
+from xml.sax.saxutils import quoteattr
 
 import networkx as nx
+import numpy as np
 import pandas as pd
 
-from . import convert
 from . import projection
 from . import settings
 from . import truncate
@@ -32,9 +28,8 @@ from ._errors import GraphSimplificationError
 from ._version import __version__ as osmnx_version
 
 if TYPE_CHECKING:
-    from xml.sax.xmlreader import AttributesImpl
-
-    import geopandas as gpd
+    from collections.abc import Iterable
+    from collections.abc import Iterator
 
 
 # default values for standard "node" and "way" XML subelement attributes
@@ -59,57 +54,105 @@ ROOT_ATTR_DEFAULTS = {
 }
 
 
-class _OSMContentHandler(ContentHandler):
-    """
-    SAX content handler for OSM XML.
+# identify node/way/relation attrs to convert from string to numeric
+_FLOAT_ATTRS = ("lat", "lon")
+_INT_ATTRS = ("changeset", "id", "uid", "version")
 
-    Builds an Overpass-like response JSON object in self.object. For format
-    notes, see https://wiki.openstreetmap.org/wiki/OSM_XML and
-    https://overpass-api.de
-    """
+# number of characters to read from the file and feed to the parser at a time
+_CHUNK_SIZE = 2**20
 
-    def __init__(self) -> None:
-        self._element: dict[str, Any] | None = None
-        self.object: dict[str, Any] = {"elements": []}
 
-    def startElement(self, name: str, attrs: AttributesImpl) -> None:  # noqa: N802
-        # identify node/way/relation attrs to convert from string to numeric
-        float_attrs = {"lat", "lon"}
-        int_attrs = {"changeset", "id", "uid", "version"}
+def _iter_xml_elements(filepath: str | Path, encoding: str) -> Iterator[dict[str, Any]]:
+    """
+    Stream OSM XML data from file as Overpass-like JSON elements.
 
-        if name == "osm":
-            self.object.update({k: v for k, v in attrs.items() if k in ROOT_ATTR_DEFAULTS})
+    The file is fed to an expat parser in chunks, and each node, way, and
+    relation element is yielded as soon as it is complete, so the file never
+    has to be held in memory as a whole. For format notes, see
+    https://wiki.openstreetmap.org/wiki/OSM_XML and https://overpass-api.de
 
-        elif name in {"node", "way"}:
-            self._element = dict(type=name, tags={}, **attrs)
-            if name == "way":
-                self._element["nodes"] = []
-            self._element.update({k: float(v) for k, v in attrs.items() if k in float_attrs})
-            self._element.update({k: int(v) for k, v in attrs.items() if k in int_attrs})
+    Parameters
+    ----------
+    filepath
+        Path to file containing OSM XML data.
+    encoding
+        The XML file's character encoding.
 
-        elif name == "relation":
-            self._element = dict(type=name, tags={}, members=[], **attrs)
-            self._element.update({k: int(v) for k, v in attrs.items() if k in int_attrs})
+    Yields
+    ------
+    element
+        An Overpass-like node, way, or relation element.
+    """
+    elements: list[dict[str, Any]] = []
+    element: dict[str, Any] = {}
+
+    def _start(name: str, attrs: dict[str, str]) -> None:
+        nonlocal element
+        # check the most common element names first: this is the hot loop
+        if name == "nd":
+            element["nodes"].append(int(attrs["ref"]))
 
         elif name == "tag":
-            self._element["tags"].update({attrs["k"]: attrs["v"]})  # type: ignore[index]
+            element["tags"][attrs["k"]] = attrs["v"]
 
-        elif name == "nd":
-            self._element["nodes"].append(int(attrs["ref"]))  # type: ignore[index]
+        elif name in {"node", "way", "relation"}:
+            element = _new_element(name, attrs)
+            elements.append(element)
 
         elif name == "member":
-            self._element["members"].append(  # type: ignore[index]
-                {k: (int(v) if k == "ref" else v) for k, v in attrs.items()},
-            )
+            element["members"].append({k: (int(v) if k == "ref" else v) for k, v in attrs.items()})
+
+    parser = ParserCreate()
+    parser.StartElementHandler = _start
 
-    def endElement(self, name: str) -> None:  # noqa: N802
-        if name in {"node", "way", "relation"}:
-            self.object["elements"].append(self._element)
+    with _opener(Path(filepath), encoding) as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            parser.Parse(chunk, False)  # noqa: FBT003
+            # every element but the last one started is complete: hand those
+            # off so they don't accumulate in memory while parsing the rest
+            if len(elements) > 1:
+                last = elements.pop()
+                yield from elements
+                elements.clear()
+                elements.append(last)
+        parser.Parse("", True)  # noqa: FBT003
+    yield from elements
+
+
+def _new_element(name: str, attrs: dict[str, str]) -> dict[str, Any]:
+    """
+    Create an Overpass-like node, way, or relation element from XML attrs.
 
+    Parameters
+    ----------
+    name
+        The XML element's name: "node", "way", or "relation".
+    attrs
+        The XML element's attributes.
 
-def _overpass_json_from_xml(filepath: str | Path, encoding: str) -> dict[str, Any]:
+    Returns
+    -------
+    element
     """
-    Read OSM XML data from file and return Overpass-like JSON.
+    element: dict[str, Any]
+    if name == "relation":
+        element = {"type": name, "tags": {}, "members": [], **attrs}
+    else:
+        element = {"type": name, "tags": {}, **attrs}
+        if name == "way":
+            element["nodes"] = []
+        for k in _FLOAT_ATTRS:
+            if k in attrs:
+                element[k] = float(attrs[k])
+    for k in _INT_ATTRS:
+        if k in attrs:
+            element[k] = int(attrs[k])
+    return element
+
+
+def _opener(filepath: Path, encoding: str) -> TextIO:
+    """
+    Open an OSM XML file for reading, handling bz2 or regular XML.
 
     Parameters
     ----------
@@ -120,36 +163,89 @@ def _overpass_json_from_xml(filepath: str | Path, encoding: str) -> dict[str, An
 
     Returns
     -------
-    response_json
-        A parsed JSON response from the Overpass API.
+    f
+    """
+    if filepath.suffix == ".bz2":
+        return bz2.open(filepath, mode="rt", encoding=encoding)
+
+    # otherwise just open it if it's not bz2
+    return filepath.open(encoding=encoding)
+
+
+def _read_root_attrs(filepath: Path, encoding: str) -> dict[str, str]:
     """
+    Read the attributes of an OSM XML file's "osm" root element.
+
+    Only the start of the file is parsed, until the root element is found.
 
-    # open the XML file, handling bz2 or regular XML
-    def _opener(filepath: Path, encoding: str) -> TextIO:
-        if filepath.suffix == ".bz2":
-            return bz2.open(filepath, mode="rt", encoding=encoding)
+    Parameters
+    ----------
+    filepath
+        Path to file containing OSM XML data.
+    encoding
+        The XML file's character encoding.
+
+    Returns
+    -------
+    root_attrs
+    """
+    roots: list[tuple[str, dict[str, str]]] = []
+
+    def _start(name: str, attrs: dict[str, str]) -> None:
+        if len(roots) == 0:
+            roots.append((name, attrs))
+
+    parser = ParserCreate()
+    parser.StartElementHandler = _start
+    with _opener(filepath, encoding) as f:
+        while len(roots) == 0 and (chunk := f.read(_CHUNK_SIZE)):
+            parser.Parse(chunk, False)  # noqa: FBT003
+    return next((attrs for name, attrs in roots if name == "osm"), {})
+
+
+def _overpass_json_from_xml(
+    filepath: str | Path,
+    encoding: str,
+    *,
+    stream: bool = False,
+) -> dict[str, Any]:
+    """
+    Read OSM XML data from file and return Overpass-like JSON.
 
-        # otherwise just open it if it's not bz2
-        return filepath.open(encoding=encoding)
+    Parameters
+    ----------
+    filepath
+        Path to file containing OSM XML data.
+    encoding
+        The XML file's character encoding.
+    stream
+        If True, the "elements" value is a lazy iterator that parses the file
+        as it is consumed (only once) rather than a list of all the elements.
+        This lets callers convert elements as they arrive without holding
+        the whole file's elements in memory.
 
+    Returns
+    -------
+    response_json
+        A parsed JSON response from the Overpass API.
+    """
     # warn if this XML file was generated by OSMnx itself
-    with _opener(Path(filepath), encoding) as f:
-        root_attrs = etree_parse(f).getroot().attrib  # noqa: S314
-        if "generator" in root_attrs and "OSMnx" in root_attrs["generator"]:
-            msg = (
-                "The XML file you are loading appears to have been generated "
-                "by OSMnx: this use case is not supported and may not behave "
-                "as expected. To save/load graphs to/from disk for later use "
-                "in OSMnx, use the `io.save_graphml` and `io.load_graphml` "
-                "functions instead. Refer to the documentation for details."
-            )
-            warn(msg, category=UserWarning, stacklevel=2)
-
-    # parse the XML to Overpass-like JSON
-    with _opener(Path(filepath), encoding) as f:
-        handler = _OSMContentHandler()
-        sax_parse(f, handler)  # noqa: S317
-        return handler.object
+    root_attrs = _read_root_attrs(Path(filepath), encoding)
+    if "generator" in root_attrs and "OSMnx" in root_attrs["generator"]:
+        msg = (
+            "The XML file you are loading appears to have been generated "
+            "by OSMnx: this use case is not supported and may not behave "
+            "as expected. To save/load graphs to/from disk for later use "
+            "in OSMnx, use the `io.save_graphml` and `io.load_graphml` "
+            "functions instead. Refer to the documentation for details."
+        )
+        warn(msg, category=UserWarning, stacklevel=2)
+
+    # parse the XML to Overpass-like JSON, with the root element's attributes
+    elements = _iter_xml_elements(filepath, encoding)
+    response_json: dict[str, Any] = {"elements": elements if stream else list(elements)}
+    response_json.update({k: v for k, v in root_attrs.items() if k in ROOT_ATTR_DEFAULTS})
+    return response_json
 
 
 def _save_graph_xml(
@@ -211,140 +307,251 @@ def _save_graph_xml(
     filepath = Path(settings.data_folder) / "graph.osm" if filepath is None else Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    # convert graph to node/edge gdfs and create dict of spatial bounds
-    gdf_nodes, gdf_edges = convert.graph_to_gdfs(G, fill_edge_geometry=False)
-    coords = [str(round(c, PRECISION)) for c in gdf_nodes.unary_union.bounds]
+    # create dict of spatial bounds from the nodes' coordinates
+    xs = np.array([x for _, x in G.nodes(data="x")], dtype=float)
+    ys = np.array([y for _, y in G.nodes(data="y")], dtype=float)
+    coords = [str(round(c, PRECISION)) for c in (xs.min(), ys.min(), xs.max(), ys.max())]
     bounds = dict(zip(["minlon", "minlat", "maxlon", "maxlat"], coords))
 
-    # add default values (if missing) for standard attrs
-    for gdf in (gdf_nodes, gdf_edges):
-        for col, value in ATTR_DEFAULTS.items():
-            if col not in gdf.columns:
-                gdf[col] = value
-            else:
-                gdf[col] = gdf[col].fillna(value)
-
-    # transform nodes gdf to meet OSM XML spec
-    # 1) reset index (osmid) then rename osmid, x, and y columns
-    # 2) round lat/lon coordinates
-    # 3) drop unnecessary geometry column
-    gdf_nodes = gdf_nodes.reset_index().rename(columns={"osmid": "id", "x": "lon", "y": "lat"})
-    gdf_nodes[["lon", "lat"]] = gdf_nodes[["lon", "lat"]].round(PRECISION)
-    gdf_nodes = gdf_nodes.drop(columns=["geometry"])
-
-    # transform edges gdf to meet OSM XML spec
-    # 1) fill and convert oneway bools to strings
-    # 2) rename osmid column (but keep (u, v, k) index for processing)
-    # 3) drop unnecessary geometry column
-    if "oneway" in gdf_edges.columns:
-        gdf_edges["oneway"] = gdf_edges["oneway"].fillna(ONEWAY).replace({True: "yes", False: "no"})
-    gdf_edges = gdf_edges.rename(columns={"osmid": "id"}).drop(columns=["geometry"])
-
-    # create parent XML element then add bounds, nodes, ways as subelements
-    element = Element("osm", attrib=ROOT_ATTR_DEFAULTS)
-    _ = SubElement(element, "bounds", attrib=bounds)
-    _add_nodes_xml(element, gdf_nodes)
-    _add_ways_xml(element, gdf_edges, way_tag_aggs)
-
-    # write to disk
-    ElementTree(element).write(filepath, encoding=encoding, xml_declaration=True)
+    # round lat/lon coordinates of nodes to meet OSM XML spec
+    lonlats = zip(np.round(xs, PRECISION).tolist(), np.round(ys, PRECISION).tolist())
+
+    # stream the root element, its bounds, then nodes and ways to the file,
+    # serializing each element as it is created rather than building a tree.
+    # write to a temporary file then rename it, so an error mid-write can't
+    # leave a partial file behind
+    temp_path = filepath.with_name(f"{filepath.name}.temp")
+    try:
+        with temp_path.open("w", encoding=encoding, errors="xmlcharrefreplace") as f:
+            f.write(f"<?xml version='1.0' encoding='{encoding}'?>\n")
+            f.write(f"<osm{_xml_attrs(ROOT_ATTR_DEFAULTS)}><bounds{_xml_attrs(bounds)} />")
+            _write_nodes_xml(f, G, lonlats)
+            _write_ways_xml(f, G, way_tag_aggs, ONEWAY)
+            f.write("</osm>")
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    temp_path.replace(filepath)
+
     msg = f"Saved graph as OSM XML file at {str(filepath)!r}"
     utils.log(msg, level=lg.INFO)
 
 
-def _add_nodes_xml(
-    parent: Element,
-    gdf_nodes: gpd.GeoDataFrame,
+def _xml_attrs(attrs: dict[str, str]) -> str:
+    """
+    Serialize a dict of XML attributes, escaping and quoting their values.
+
+    Parameters
+    ----------
+    attrs
+        The XML element's attribute names and string values.
+
+    Returns
+    -------
+    attrs_str
+        The serialized attributes, each preceded by a space.
+    """
+    return "".join(f" {k}={quoteattr(v)}" for k, v in attrs.items())
+
+
+def _notna(value: Any) -> bool:  # noqa: ANN401
+    """
+    Determine if a graph attribute value is present and not null.
+
+    Parameters
+    ----------
+    value
+        The attribute value, or None if the attribute is missing.
+
+    Returns
+    -------
+    notna
+        True if the value is a list (e.g., after node consolidation) or a
+        non-null scalar.
+    """
+    return isinstance(value, list) or (value is not None and pd.notna(value))
+
+
+def _write_nodes_xml(
+    f: TextIO,
+    G: nx.MultiDiGraph,
+    coords: Iterable[tuple[float, float]],
 ) -> None:
     """
-    Add graph nodes as subelements of an XML parent element.
+    Write graph nodes as "node" XML elements to an open file.
 
     Parameters
     ----------
-    parent
-        The XML parent element.
-    gdf_nodes
-        A GeoDataFrame of graph nodes.
+    f
+        The open OSM XML file.
+    G
+        The graph being saved.
+    coords
+        The nodes' rounded (lon, lat) coordinates, in the graph's node order.
 
     Returns
     -------
     None
     """
-    node_tags = set(settings.useful_tags_node)
-    node_attrs = {"id", "lat", "lon"}.union(ATTR_DEFAULTS)
-
-    # add each node attrs dict as a SubElement of parent
-    for node in gdf_nodes.to_dict(orient="records"):
-        attrs = {k: str(node[k]) for k in node_attrs if pd.notna(node[k])}
-        node_element = SubElement(parent, "node", attrib=attrs)
-
-        # add each node tag dict as its own SubElement of the node SubElement
-        # for vals that are non-null (or list if node consolidation was done)
-        tags = (
-            {"k": k, "v": str(node[k])}
-            for k in node_tags & node.keys()
-            if isinstance(node[k], list) or pd.notna(node[k])
+    node_tags = settings.useful_tags_node
+
+    for (node, data), (lon, lat) in zip(G.nodes(data=True), coords):
+        # add each node's attrs, filling any missing standard attrs
+        attrs = {"id": str(node), "lat": str(lat), "lon": str(lon)}
+        for k, default in ATTR_DEFAULTS.items():
+            value = data.get(k)
+            attrs[k] = str(value) if _notna(value) else default
+
+        # add each node tag with a non-null value as its own "tag" subelement
+        tags = "".join(
+            f"<tag{_xml_attrs({'k': k, 'v': str(data[k])})} />"
+            for k in node_tags
+            if _notna(data.get(k))
         )
-        for tag in tags:
-            _ = SubElement(node_element, "tag", attrib=tag)
+        if tags == "":
+            f.write(f"<node{_xml_attrs(attrs)} />")
+        else:
+            f.write(f"<node{_xml_attrs(attrs)}>{tags}</node>")
 
 
-def _add_ways_xml(
-    parent: Element,
-    gdf_edges: gpd.GeoDataFrame,
+def _write_ways_xml(
+    f: TextIO,
+    G: nx.MultiDiGraph,
     way_tag_aggs: dict[str, Any] | None,
+    oneway: bool,  # noqa: FBT001
 ) -> None:
     """
-    Add graph edges (grouped as ways) as subelements of an XML parent element.
+    Write graph edges (grouped as ways) as "way" XML elements to an open file.
+
+    Edges are grouped into ways by their OSM way "osmid" in one pass over the
+    graph. Each way's node sequence is found by walking its edges from the
+    way's start node, falling back to `_sort_nodes` for ways whose edges do
+    not form a single simple path (such as loops).
 
     Parameters
     ----------
-    parent
-        The XML parent element.
-    gdf_edges
-        A GeoDataFrame of graph edges with OSM way "id" column for grouping
-        edges into ways.
+    f
+        The open OSM XML file.
+    G
+        The graph being saved.
     way_tag_aggs
         Keys are OSM way tag keys and values are aggregation functions
         (anything accepted as an argument by `pandas.agg`). Allows user to
         aggregate graph edge attribute values into single OSM way values. If
         None, or if some tag's key does not exist in the dict, the way
         attribute will be assigned the value of the first edge of the way.
+    oneway
+        Default "oneway" value used to fill this tag where missing.
 
     Returns
     -------
     None
     """
-    way_tags = set(settings.useful_tags_way)
-    way_attrs = list({"id"}.union(ATTR_DEFAULTS))
-
-    for osmid, way in gdf_edges.groupby("id"):
-        # STEP 1: add the way and its attrs as a "way" subelement of the
-        # parent element
-        attrs = way[way_attrs].iloc[0].astype(str).to_dict()
-        way_element = SubElement(parent, "way", attrib=attrs)
-
-        # STEP 2: add the way's edges' node IDs as "nd" subelements of the
-        # "way" subelement. if way contains more than 1 edge, sort the nodes
-        # topologically, otherwise just add node "u" then "v" from index.
-        if len(way) == 1:
-            nodes = way.index[0][:2]
-        else:
-            nodes = _sort_nodes(nx.MultiDiGraph(way.index.to_list()), osmid)
-        for node in nodes:
-            _ = SubElement(way_element, "nd", attrib={"ref": str(node)})
-
-        # STEP 3: add way's edges' tags as "tag" subelements of the "way"
-        # subelement. if an agg function was provided for a tag, apply it to
-        # the values of the edges in the way. if no agg function was provided
-        # for a tag, just use the value from first edge in way.
-        for tag in way_tags.intersection(way.columns):
-            if way_tag_aggs is not None and tag in way_tag_aggs:
-                value = way[tag].agg(way_tag_aggs[tag])
+    # group the edges' positions in the graph's edge order by OSM way ID, and
+    # find which way tags any edge has
+    ways: dict[Any, list[int]] = {}
+    edges = list(G.edges(keys=True, data=True))
+    edge_tags: set[str] = set()
+    for i, (_, _, _, data) in enumerate(edges):
+        edge_tags.update(data)
+        osmid = data.get("osmid")
+        if _notna(osmid):
+            ways.setdefault(osmid, []).append(i)
+    way_tags = [tag for tag in settings.useful_tags_way if tag in edge_tags]
+
+    def _value(data: dict[str, Any], tag: str) -> Any:  # noqa: ANN401
+        value = data.get(tag)
+        if tag == "oneway":
+            # fill and convert oneway bools to strings
+            value = oneway if not _notna(value) else value
+            if isinstance(value, (bool, np.bool_)):
+                value = "yes" if value else "no"
+        return value
+
+    # if an agg function was provided for a tag, put all the edges' values
+    # for it in a column so each way can aggregate its own slice of them
+    aggs = {} if way_tag_aggs is None else way_tag_aggs
+    agg_cols = {
+        tag: pd.Series([_value(data, tag) for _, _, _, data in edges])
+        for tag in way_tags
+        if tag in aggs
+    }
+
+    for osmid in sorted(ways):
+        positions = ways[osmid]
+        way_edges = [edges[i] for i in positions]
+        first = way_edges[0][3]
+
+        # add the way's attrs from its first edge, filling any missing ones
+        attrs = {"id": str(osmid)}
+        for k, default in ATTR_DEFAULTS.items():
+            value = first.get(k)
+            attrs[k] = str(value) if _notna(value) else default
+        parts = [f"<way{_xml_attrs(attrs)}>"]
+
+        # add the way's edges' node IDs in order as "nd" subelements
+        nodes = _way_nodes([(u, v, k) for u, v, k, _ in way_edges], osmid)
+        parts.extend(f'<nd ref="{node}" />' for node in nodes)
+
+        # add way's edges' tags as "tag" subelements. if an agg function was
+        # provided for a tag, apply it to the values of the edges in the way.
+        # if no agg function was provided for a tag, just use the value from
+        # first edge in way.
+        for tag in way_tags:
+            if tag in agg_cols:
+                value = agg_cols[tag].iloc[np.asarray(positions, dtype=np.int64)].agg(aggs[tag])
             else:
-                value = way[tag].iloc[0]
-            if pd.notna(value):
-                _ = SubElement(way_element, "tag", attrib={"k": tag, "v": str(value)})
+                value = _value(first, tag)
+            if _notna(value):
+                parts.append(f"<tag{_xml_attrs({'k': tag, 'v': str(value)})} />")
+
+        parts.append("</way>")
+        f.write("".join(parts))
+
+
+def _way_nodes(edges: list[tuple[int, int, int]], osmid: int) -> list[int]:
+    """
+    Order the nodes of an OSM way from its edges.
+
+    If the edges form a single simple path, walk it from its start node:
+    this is the path's unique topological order. Otherwise, fall back to the
+    `_sort_nodes` function.
+
+    Parameters
+    ----------
+    edges
+        The way's (u, v, k) edges.
+    osmid
+        The OSM way ID.
+
+    Returns
+    -------
+    ordered_nodes
+        The way's node IDs in order.
+    """
+    if len(edges) == 1:
+        return list(edges[0][:2])
+
+    succ: dict[int, int] = {}
+    targets: set[int] = set()
+    for u, v, _ in edges:
+        if u in succ or v in targets:
+            # a node branches or merges here: not a single simple path
+            break
+        succ[u] = v
+        targets.add(v)
+    else:
+        starts = succ.keys() - targets
+        if len(starts) == 1:
+            node = starts.pop()
+            ordered_nodes = [node]
+            while node in succ:
+                node = succ[node]
+                ordered_nodes.append(node)
+            if len(ordered_nodes) == len(edges) + 1:
+                return ordered_nodes
+
+    return _sort_nodes(nx.MultiDiGraph(edges), osmid)
 
 
 def _sort_nodes(G: nx.MultiDiGraph, osmid: int) -> list[int]:
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import itertools
+import logging as lg
+import multiprocessing as mp
+from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import overload
 from warnings import warn
 
 import networkx as nx
 import numpy as np
 import numpy.typing as npt
+import pandas as pd
 
+from . import convert
+from . import io
 from . import projection
+from . import utils
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 # scipy is an optional dependency for entropy calculation
 try:
@@ -108,16 +120,26 @@ def add_edge_bearings(G: nx.MultiDiGraph) -> nx.MultiDiGraph:
         msg = "Graph must be unprojected to add edge bearings."
         raise ValueError(msg)
 
-    # extract edge IDs and corresponding coordinates from their nodes
-    uvk = [(u, v, k) for u, v, k in G.edges if u != v]
-    x = G.nodes(data="x")
-    y = G.nodes(data="y")
-    coords = np.array([(y[u], x[u], y[v], x[v]) for u, v, k in uvk])
-
-    # calculate bearings then set as edge attributes
-    bearings = calculate_bearing(coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3])
-    values = zip(uvk, bearings)
-    nx.set_edge_attributes(G, dict(values), name="bearing")
+    # extract edges' endpoints and node coordinates into arrays, then gather
+    # every edge's endpoint coordinates with one indexed lookup
+    if G.number_of_edges() == 0:  # pragma: no cover
+        return G
+    u, v, data = zip(*G.edges(data=True))
+    nodes = pd.Index(G.nodes)
+    x = np.array([x for _, x in G.nodes(data="x")], dtype=float)
+    y = np.array([y for _, y in G.nodes(data="y")], dtype=float)
+    u_idx = nodes.get_indexer(u)
+    v_idx = nodes.get_indexer(v)
+
+    # calculate bearings of all non-self-loop edges in one vectorized call
+    mask = u_idx != v_idx
+    u_idx = u_idx[mask]
+    v_idx = v_idx[mask]
+    bearings = calculate_bearing(y[u_idx], x[u_idx], y[v_idx], x[v_idx])
+
+    # then set them as edge attributes directly on the edges' data dicts
+    for d, bearing in zip(itertools.compress(data, mask), bearings):
+        d["bearing"] = bearing
 
     return G
 
@@ -173,6 +195,148 @@ def orientation_entropy(
     return entropy
 
 
+def orientation_entropies(
+    graphs: Iterable[nx.MultiGraph | nx.MultiDiGraph | str | Path],
+    *,
+    num_bins: int = 36,
+    min_length: float = 0,
+    weight: str | None = None,
+    undirected: bool = False,
+    cpus: int | None = 1,
+) -> pd.DataFrame:
+    """
+    Calculate the orientation entropies of many graphs.
+
+    Batched version of `orientation_entropy` for analyzing many graphs at
+    once, such as thousands of cities' street networks. Each graph can be a
+    graph object or a path to a GraphML file saved by `io.save_graphml`,
+    which gets loaded with `io.load_graphml` by the process that analyzes it.
+    Graphs whose edges lack `bearing` attributes get them calculated with
+    `add_edge_bearings` (without modifying the graphs passed in). The graphs
+    are consumed lazily in chunks of `cpus` graphs, so only about one graph
+    per CPU core is held in memory at a time when passing a generator or a
+    list of filepaths.
+
+    Parameters
+    ----------
+    graphs
+        Unprojected graphs or paths to their saved GraphML files.
+    num_bins
+        Number of bins. For example, if `num_bins=36` is provided, then each
+        bin will represent 10 degrees around the compass.
+    min_length
+        Ignore edges with "length" attributes less than `min_length`. Useful
+        to ignore the noise of many very short edges.
+    weight
+        If None, apply equal weight for each bearing. Otherwise, weight edges'
+        bearings by this (non-null) edge attribute. For example, if "length"
+        is provided, each edge's bearing observation will be weighted by its
+        "length" attribute value.
+    undirected
+        If True, convert each graph to an undirected MultiGraph with
+        `convert.to_undirected` before extracting its bidirectional edge
+        bearings. Otherwise, analyze each graph as it is: MultiGraph edge
+        bearings will be bidirectional and MultiDiGraph edge bearings will be
+        directional.
+    cpus
+        How many CPU cores to use. If None, use all available.
+
+    Returns
+    -------
+    entropies
+        Tidy (long) results with one row per graph per bin, and columns for
+        the graph's position in `graphs` ("graph"), the bin's center in
+        degrees ("bin"), the bin's bearing count ("count"), and the graph's
+        orientation entropy ("entropy", repeated on each of its bins' rows).
+    """
+    # check if we were able to import scipy
+    if scipy is None:  # pragma: no cover
+        msg = "scipy must be installed as an optional dependency to calculate entropy."
+        raise ImportError(msg)
+
+    if cpus is None:
+        cpus = mp.cpu_count()
+    cpus = min(cpus, mp.cpu_count())
+    msg = f"Calculating orientation entropies with {cpus} CPUs..."
+    utils.log(msg, level=lg.INFO)
+
+    # if single-threading, calculate each graph's bin counts one at a time
+    all_bin_counts = []
+    if cpus == 1:
+        all_bin_counts = [
+            _graph_bin_counts(graph, num_bins, min_length, weight, undirected) for graph in graphs
+        ]
+
+    # if multi-threading, calculate graphs' bin counts in parallel, consuming
+    # the graphs in chunks of one graph per CPU so we never hold more than
+    # that many graphs in memory at once (beyond what the caller holds)
+    else:
+        graphs = iter(graphs)
+        with mp.get_context("spawn").Pool(cpus) as pool:
+            while chunk := list(itertools.islice(graphs, cpus)):
+                args = ((graph, num_bins, min_length, weight, undirected) for graph in chunk)
+                all_bin_counts.extend(pool.starmap_async(_graph_bin_counts, args).get())
+
+    # bin centers depend only on the number of bins, so compute them once
+    num_split_bins = num_bins * 2
+    bin_centers = (np.arange(num_split_bins + 1) * 360 / num_split_bins)[0:-1:2]
+    counts = np.array(all_bin_counts, dtype=float).reshape(-1, num_bins)
+    num_graphs = len(counts)
+
+    entropies = pd.DataFrame(
+        {
+            "graph": np.repeat(np.arange(num_graphs), num_bins),
+            "bin": np.tile(bin_centers, num_graphs),
+            "count": counts.ravel(),
+            "entropy": np.repeat(scipy.stats.entropy(counts, axis=1), num_bins),
+        },
+    )
+    msg = f"Calculated orientation entropies of {num_graphs:,} graphs"
+    utils.log(msg, level=lg.INFO)
+    return entropies
+
+
+def _graph_bin_counts(
+    graph: nx.MultiGraph | nx.MultiDiGraph | str | Path,
+    num_bins: int,
+    min_length: float,
+    weight: str | None,
+    undirected: bool,  # noqa: FBT001
+) -> npt.NDArray[np.float64]:
+    """
+    Load a graph if necessary then compute its bearings' bin counts.
+
+    Parameters
+    ----------
+    graph
+        Unprojected graph or path to its saved GraphML file.
+    num_bins
+        Number of bins for the bearing histogram.
+    min_length
+        Ignore edges with `length` attributes less than `min_length`.
+    weight
+        If None, apply equal weight for each bearing. Otherwise, weight edges'
+        bearings by this (non-null) edge attribute.
+    undirected
+        If True, convert the graph to an undirected MultiGraph first.
+
+    Returns
+    -------
+    bin_counts
+        Counts of bearings per bin.
+    """
+    # load the graph if it's a filepath, and make sure its edges have bearings
+    # without mutating the caller's graph object
+    loaded = isinstance(graph, (str, Path))
+    G = io.load_graphml(graph) if loaded else graph
+    if any("bearing" not in d for u, v, d in G.edges(data=True) if u != v):
+        G = add_edge_bearings(G if loaded else G.copy())
+    if undirected and G.is_directed():
+        G = convert.to_undirected(G)
+    bin_counts, _ = _bearings_distribution(G, num_bins, min_length, weight)
+    return bin_counts
+
+
 def _extract_edge_bearings(
     G: nx.MultiGraph | nx.MultiDiGraph,
     min_length: float,
@@ -209,18 +373,17 @@ def _extract_edge_bearings(
     if projection.is_projected(G.graph["crs"]):  # pragma: no cover
         msg = "Graph must be unprojected to analyze edge bearings."
         raise ValueError(msg)
-    bearings = []
-    weights = []
-    for u, v, data in G.edges(data=True):
-        # ignore self-loops and any edges below min_length
-        if u != v and data["length"] >= min_length:
-            bearings.append(data["bearing"])
-            weights.append(data[weight] if weight is not None else 1.0)
-
-    # drop any nulls
-    bearings_array = np.array(bearings)
-    weights_array = np.array(weights)
-    keep_idx = ~np.isnan(bearings_array)
+    # extract the lengths, bearings, and weights of all non-self-loop edges
+    # into arrays in one pass, as self-loops have no bearings
+    values = [
+        (d["length"], d["bearing"], 1.0 if weight is None else d[weight])
+        for u, v, d in G.edges(data=True)
+        if u != v
+    ]
+    lengths, bearings_array, weights_array = np.array(values, dtype=float).reshape(-1, 3).T
+
+    # ignore any edges below min_length and drop any nulls
+    keep_idx = (lengths >= min_length) & ~np.isnan(bearings_array)
     bearings_array = bearings_array[keep_idx]
     weights_array = weights_array[keep_idx]
     if nx.is_directed(G):
@@ -11,9 +11,14 @@ from warnings import warn
 
 import geopandas as gpd
 import networkx as nx
+import numpy as np
 import pandas as pd
 from shapely import LineString
 from shapely import Point
+from shapely import get_coordinates
+from shapely import get_num_coordinates
+from shapely import linestrings
+from shapely import points
 
 from . import utils
 
@@ -154,8 +159,8 @@ def graph_to_gdfs(
 
         if node_geometry:
             # convert node x/y attributes to Points for geometry column
-            node_geoms = (Point(d["x"], d["y"]) for d in data)
-            gdf_nodes = gpd.GeoDataFrame(data, index=uvk, crs=crs, geometry=list(node_geoms))
+            node_geoms = points([d["x"] for d in data], [d["y"] for d in data])
+            gdf_nodes = gpd.GeoDataFrame(data, index=uvk, crs=crs, geometry=node_geoms)
         else:
             gdf_nodes = gpd.GeoDataFrame(data, index=uvk)
 
@@ -367,15 +372,21 @@ def to_undirected(G: nx.MultiDiGraph) -> nx.MultiGraph:
     G = G.copy()
 
     # set from/to nodes before making graph undirected
+    missing_geom = []
     for u, v, d in G.edges(data=True):
         d["from"] = u
         d["to"] = v
-
-        # add geometry if missing, to compare parallel edges' geometries
         if "geometry" not in d:
-            point_u = (G.nodes[u]["x"], G.nodes[u]["y"])
-            point_v = (G.nodes[v]["x"], G.nodes[v]["y"])
-            d["geometry"] = LineString([point_u, point_v])
+            missing_geom.append((u, v, d))
+
+    # add geometry if missing, to compare parallel edges' geometries
+    if len(missing_geom) > 0:
+        coords = [
+            ((G.nodes[u]["x"], G.nodes[u]["y"]), (G.nodes[v]["x"], G.nodes[v]["y"]))
+            for u, v, _ in missing_geom
+        ]
+        for (_, _, d), geom in zip(missing_geom, linestrings(coords)):
+            d["geometry"] = geom
 
     # increment parallel edges' keys so we don't retain only one edge of sets
     # of true parallel edges when we convert from MultiDiGraph to MultiGraph
@@ -389,20 +400,23 @@ def to_undirected(G: nx.MultiDiGraph) -> nx.MultiGraph:
 
     # the previous operation added all directed edges from G as undirected
     # edges in Gu. we now have duplicate edges for each bidirectional parallel
-    # edge or self-loop. so, look through the edges and remove any duplicates.
+    # edge or self-loop. so, in one pass over the parallel edges, hash each
+    # edge's endpoints, osmid(s), and direction-independent geometry key, and
+    # flag every edge whose hash matches an earlier edge's as a duplicate
+    adj = Gu.adj
+    parallel = [(u, v, k, d) for u, v, k, d in Gu.edges(keys=True, data=True) if len(adj[u][v]) > 1]
+    geom_keys = _geometry_keys([d.get("geometry") for _, _, _, d in parallel])
+    seen = set()
     duplicate_edges = set()
-    for u1, v1, key1, data1 in Gu.edges(keys=True, data=True):
-        # if we haven't already flagged this edge as a duplicate
-        if (u1, v1, key1) not in duplicate_edges:
-            # look at every other edge between u and v, one at a time
-            for key2 in Gu[u1][v1]:
-                # don't compare this edge to itself
-                if key1 != key2:
-                    # compare the first edge's data to the second's
-                    # if they match up, flag the duplicate for removal
-                    data2 = Gu.edges[u1, v1, key2]
-                    if _is_duplicate_edge(data1, data2):
-                        duplicate_edges.add((u1, v1, key2))
+    for (u, v, k, d), geom_key in zip(parallel, geom_keys):
+        # if the osmid contains multiple values (due to simplification), then
+        # compare it as a set to see if it contains the same values
+        osmid = frozenset(d["osmid"]) if isinstance(d["osmid"], list) else d["osmid"]
+        edge_hash = (u, v, osmid, geom_key)
+        if edge_hash in seen:
+            duplicate_edges.add((u, v, k))
+        else:
+            seen.add(edge_hash)
 
     Gu.remove_edges_from(duplicate_edges)
     msg = "Converted MultiDiGraph to undirected MultiGraph"
@@ -411,72 +425,38 @@ def to_undirected(G: nx.MultiDiGraph) -> nx.MultiGraph:
     return Gu
 
 
-def _is_duplicate_edge(data1: dict[str, Any], data2: dict[str, Any]) -> bool:
+def _geometry_keys(geoms: list[LineString | None]) -> list[bytes | None]:
     """
-    Check if two graph edge data dicts have the same `osmid` and `geometry`.
-
-    Parameters
-    ----------
-    data1
-        The first edge's attribute data.
-    data2
-        The second edge's attribute data.
-
-    Returns
-    -------
-    is_dupe
-    """
-    is_dupe = False
-
-    # if either edge's osmid contains multiple values (due to simplification)
-    # compare them as sets to see if they contain the same values
-    osmid1 = set(data1["osmid"]) if isinstance(data1["osmid"], list) else data1["osmid"]
-    osmid2 = set(data2["osmid"]) if isinstance(data2["osmid"], list) else data2["osmid"]
+    Make hashable keys of LineString geometries that ignore their direction.
 
-    # if they contain the same osmid or set of osmids (due to simplification)
-    if osmid1 == osmid2:
-        # if both edges have geometry attributes and they match each other
-        if ("geometry" in data1) and ("geometry" in data2):
-            if _is_same_geometry(data1["geometry"], data2["geometry"]):
-                is_dupe = True
-
-        # if neither edge has a geometry attribute
-        elif ("geometry" not in data1) and ("geometry" not in data2):
-            is_dupe = True
-
-        # if one edge has geometry attribute but the other doesn't: not dupes
-        else:
-            pass
-
-    return is_dupe
-
-
-def _is_same_geometry(ls1: LineString, ls2: LineString) -> bool:
-    """
-    Determine if two LineString geometries are the same (in either direction).
-
-    Check both the normal and reversed orders of their constituent points.
+    Two geometries get the same key if their coordinates are the same in
+    either the same or reversed order. Each key is the bytes of the
+    geometry's coordinates, in whichever of the two directions sorts first.
 
     Parameters
     ----------
-    ls1
-        The first LineString geometry.
-    ls2
-        The second LineString geometry.
+    geoms
+        The LineString geometries, or None for edges without geometries.
 
     Returns
     -------
-    is_same
+    geom_keys
+        The geometries' keys, or None for edges without geometries.
     """
-    # extract coordinates from each LineString geometry
-    geom1 = [tuple(coords) for coords in ls1.xy]
-    geom2 = [tuple(coords) for coords in ls2.xy]
-
-    # reverse the first LineString's coordinates' direction
-    geom1_r = [tuple(reversed(coords)) for coords in ls1.xy]
-
-    # if second geometry matches first in either direction, return True
-    return geom2 in (geom1, geom1_r)
+    has_geom = [geom is not None for geom in geoms]
+    geom_keys: list[bytes | None] = [None] * len(geoms)
+    if not any(has_geom):
+        return geom_keys
+
+    # get all the geometries' coordinates at once, then split them up. add
+    # zero to make negative zeros positive so their bytes compare as floats do
+    lines = list(itertools.compress(geoms, has_geom))
+    coords = get_coordinates(lines) + 0.0
+    splits = np.cumsum(get_num_coordinates(lines))[:-1]
+    line_keys = (min(c.tobytes(), c[::-1].tobytes()) for c in np.split(coords, splits))
+    for i, key in zip(itertools.compress(range(len(geoms)), has_geom), line_keys):
+        geom_keys[i] = key
+    return geom_keys
 
 
 def _update_edge_keys(G: nx.MultiDiGraph) -> nx.MultiDiGraph:
@@ -500,23 +480,22 @@ def _update_edge_keys(G: nx.MultiDiGraph) -> nx.MultiDiGraph:
     # identify all the edges that are duplicates based on a sorted combination
     # of their origin, destination, and key. that is, edge uv will match edge vu
     # as a duplicate, but only if they have the same key
-    edges = graph_to_gdfs(G, nodes=False, fill_edge_geometry=False)
-    edges["uvk"] = ["_".join([*sorted([str(u), str(v)]), str(k)]) for u, v, k in edges.index]
-    mask = edges["uvk"].duplicated(keep=False)
-    dupes = edges[mask].dropna(subset=["geometry"])
-
-    different_streets = []
-    groups = dupes[["geometry", "uvk"]].groupby("uvk")
-
-    # for each group of duplicate edges
-    for _, group in groups:
-        # for each pair of edges within this group
-        for geom1, geom2 in itertools.combinations(group["geometry"], 2):
-            # if they don't have the same geometry, flag them as different
-            # streets: flag edge uvk, but not edge vuk, otherwise we would
-            # increment both their keys and they'll still duplicate each other
-            if not _is_same_geometry(geom1, geom2):
-                different_streets.append(group.index[0])
+    groups: dict[tuple[frozenset[int], int], list[tuple[int, int, int]]] = {}
+    geoms = {}
+    for u, v, k, geom in G.edges(keys=True, data="geometry"):
+        if geom is not None:
+            groups.setdefault((frozenset((u, v)), k), []).append((u, v, k))
+            geoms[u, v, k] = geom
+    dupes = [group for group in groups.values() if len(group) > 1]
+
+    # key each duplicate edge's geometry in a direction-independent way
+    edges = list(itertools.chain.from_iterable(dupes))
+    geom_keys = dict(zip(edges, _geometry_keys([geoms[e] for e in edges])))
+
+    # if a group's geometries aren't all the same, flag the group's first edge
+    # as a different street: flag edge uvk, but not edge vuk, otherwise we
+    # would increment both their keys and they'll still duplicate each other
+    different_streets = [group[0] for group in dupes if len({geom_keys[e] for e in group}) > 1]
 
     # for each unique different street, increment its key to make it unique
     for u, v, k in set(different_streets):
@@ -10,10 +10,12 @@ from typing import overload
 import networkx as nx
 import numpy as np
 import numpy.typing as npt
+import pandas as pd
 from shapely import Point
 from shapely.strtree import STRtree
 
 from . import convert
+from . import io
 from . import projection
 from . import utils
 
@@ -235,13 +237,13 @@ def add_edge_lengths(
 
 # if X and Y are floats and return_dist is not provided (defaults False)
 @overload
-def nearest_nodes(G: nx.MultiDiGraph, X: float, Y: float) -> int: ...
+def nearest_nodes(G: nx.MultiDiGraph | io.GraphSnapshot, X: float, Y: float) -> int: ...
 
 
 # if X and Y are floats and return_dist is provided/False
 @overload
 def nearest_nodes(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     X: float,
     Y: float,
     *,
@@ -252,7 +254,7 @@ def nearest_nodes(
 # if X and Y are floats and return_dist is provided/True
 @overload
 def nearest_nodes(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     X: float,
     Y: float,
     *,
@@ -263,7 +265,7 @@ def nearest_nodes(
 # if X and Y are iterable and return_dist is not provided (defaults False)
 @overload
 def nearest_nodes(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     X: Iterable[float],
     Y: Iterable[float],
 ) -> npt.NDArray[np.int64]: ...
@@ -272,7 +274,7 @@ def nearest_nodes(
 # if X and Y are iterable and return_dist is provided/False
 @overload
 def nearest_nodes(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     X: Iterable[float],
     Y: Iterable[float],
     *,
@@ -283,7 +285,7 @@ def nearest_nodes(
 # if X and Y are iterable and return_dist is provided/True
 @overload
 def nearest_nodes(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     X: Iterable[float],
     Y: Iterable[float],
     *,
@@ -292,7 +294,7 @@ def nearest_nodes(
 
 
 def nearest_nodes(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     X: float | Iterable[float],
     Y: float | Iterable[float],
     *,
@@ -314,12 +316,14 @@ def nearest_nodes(
     neighbor search, which requires that scipy is installed as an optional
     dependency. If it is unprojected, this uses a ball tree for haversine
     nearest neighbor search, which requires that scikit-learn is installed as
-    an optional dependency.
+    an optional dependency. `G` can also be a `GraphSnapshot` from
+    `io.load_graph_snapshot`, in which case its node coordinate arrays are
+    searched.
 
     Parameters
     ----------
     G
-        Graph in which to find nearest nodes.
+        Graph or graph snapshot in which to find nearest nodes.
     X
         The points' x (longitude) coordinates, in same CRS/units as graph and
         containing no nulls.
@@ -350,7 +354,10 @@ def nearest_nodes(
         msg = "`X` and `Y` cannot contain nulls."
         raise ValueError(msg)
 
-    nodes = convert.graph_to_gdfs(G, edges=False, node_geometry=False)[["x", "y"]]
+    if isinstance(G, io.GraphSnapshot):
+        nodes = pd.DataFrame({"x": G.x, "y": G.y}, index=pd.Index(G.osmid, name="osmid"))
+    else:
+        nodes = convert.graph_to_gdfs(G, edges=False, node_geometry=False)[["x", "y"]]
     nn_array: npt.NDArray[np.int64]
     dist_array: npt.NDArray[np.float64]
 
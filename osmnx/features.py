@@ -16,21 +16,23 @@ Refer to the Getting Started guide for usage limitations.
 from __future__ import annotations
 
 import logging as lg
+import multiprocessing as mp
+from itertools import chain
 from typing import TYPE_CHECKING
 from typing import Any
 
 import geopandas as gpd
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
+import shapely
 from shapely import LineString
-from shapely import MultiLineString
 from shapely import MultiPolygon
-from shapely import Point
 from shapely import Polygon
+from shapely import STRtree
 from shapely.errors import GEOSException
-from shapely.ops import linemerge
-from shapely.ops import polygonize
-from shapely.ops import unary_union
 
+from . import _osm_pbf
 from . import _osm_xml
 from . import _overpass
 from . import geocoder
@@ -47,6 +49,9 @@ if TYPE_CHECKING:
 # define what types of OSM relations we currently handle
 _RELATION_TYPES = {"boundary", "multipolygon"}
 
+# a valid polygon ring needs at least 4 coords (its first and last are equal)
+_MIN_RING_COORDS = 4
+
 # OSM tags to determine if closed ways should be polygons, based on JSON from
 # https://wiki.openstreetmap.org/wiki/Overpass_turbo/Polygon_Features
 _POLYGON_FEATURES: dict[str, dict[str, str | set[str]]] = {
@@ -333,6 +338,7 @@ def features_from_xml(
     polygon: Polygon | MultiPolygon | None = None,
     tags: dict[str, bool | str | list[str]] | None = None,
     encoding: str = "utf-8",
+    cpus: int | None = 1,
 ) -> gpd.GeoDataFrame:
     """
     Create a GeoDataFrame of OSM features from data in an OSM XML file.
@@ -352,6 +358,9 @@ def features_from_xml(
         Spatial boundaries to optionally filter the final GeoDataFrame.
     encoding
         The OSM XML file's character encoding.
+    cpus
+        How many CPU cores to use to build multipolygon relations' geometries.
+        If None, use all available.
 
     Returns
     -------
@@ -364,18 +373,65 @@ def features_from_xml(
         polygon = Polygon()
 
     # transmogrify OSM XML file to JSON then create GeoDataFrame from it
-    response_jsons = [_osm_xml._overpass_json_from_xml(filepath, encoding)]
-    gdf = _create_gdf(response_jsons, polygon, tags)
+    response_jsons = [_osm_xml._overpass_json_from_xml(filepath, encoding, stream=True)]
+    gdf = _create_gdf(response_jsons, polygon, tags, cpus=cpus)
 
     # drop misc element attrs that might have been added from OSM XML file
     to_drop = set(gdf.columns) & {"changeset", "timestamp", "uid", "user", "version"}
     return gdf.drop(columns=list(to_drop))
 
 
+def features_from_pbf(
+    filepath: str | Path,
+    *,
+    polygon: Polygon | MultiPolygon | None = None,
+    tags: dict[str, bool | str | list[str]] | None = None,
+    cpus: int | None = 1,
+) -> gpd.GeoDataFrame:
+    """
+    Create a GeoDataFrame of OSM features from data in an OSM PBF file.
+
+    Because this function creates a GeoDataFrame of features from an OSM PBF
+    file that has already been downloaded (i.e., no query is made to the
+    Overpass API), the `polygon` and `tags` arguments are optional. If they
+    are None, filtering will be skipped. Only the elements that have any of
+    the `tags` keys, and the elements composing their geometries, are read
+    from the file. Reading PBF files requires the `osmium` package to be
+    installed.
+
+    Parameters
+    ----------
+    filepath
+        Path to file containing OSM PBF data.
+    tags
+        Query tags to optionally filter the final GeoDataFrame.
+    polygon
+        Spatial boundaries to optionally filter the final GeoDataFrame.
+    cpus
+        How many CPU cores to use to build multipolygon relations' geometries.
+        If None, use all available.
+
+    Returns
+    -------
+    gdf
+    """
+    # if tags or polygon is None, create an empty object to skip filtering
+    if tags is None:
+        tags = {}
+    if polygon is None:
+        polygon = Polygon()
+
+    # read the OSM PBF file's matching elements then create GeoDataFrame
+    response_jsons = [_osm_pbf._overpass_json_from_pbf(filepath, query_tag_keys=set(tags))]
+    return _create_gdf(response_jsons, polygon, tags, cpus=cpus)
+
+
 def _create_gdf(
     response_jsons: Iterable[dict[str, Any]],
     polygon: Polygon | MultiPolygon,
     tags: dict[str, bool | str | list[str]],
+    *,
+    cpus: int | None = 1,
 ) -> gpd.GeoDataFrame:
     """
     Convert Overpass API JSON responses to a GeoDataFrame of features.
@@ -388,6 +444,9 @@ def _create_gdf(
         Spatial boundaries to optionally filter the final GeoDataFrame.
     tags
         Query tags to optionally filter the final GeoDataFrame.
+    cpus
+        How many CPU cores to use to build multipolygon relations' geometries.
+        If None, use all available.
 
     Returns
     -------
@@ -410,7 +469,7 @@ def _create_gdf(
 
     # convert the elements into a GeoDataFrame of features
     idx = ["element", "id"]
-    features = _process_features(elements, set(tags.keys()))
+    features = _process_features(elements, set(tags.keys()), cpus=cpus)
     gdf = gpd.GeoDataFrame(features, geometry="geometry", crs=settings.default_crs).set_index(idx)
     return _filter_features(gdf, polygon, tags)
 
@@ -418,6 +477,8 @@ def _create_gdf(
 def _process_features(
     elements: list[dict[str, Any]],
     query_tag_keys: set[str],
+    *,
+    cpus: int | None = 1,
 ) -> list[dict[str, Any]]:
     """
     Convert node/way/relation elements into features with geometries.
@@ -428,6 +489,9 @@ def _process_features(
         The node/way/relation elements retrieved from the server.
     query_tag_keys
         The keys of the tags used to query for matching features.
+    cpus
+        How many CPU cores to use to build multipolygon relations' geometries.
+        If None, use all available.
 
     Returns
     -------
@@ -435,7 +499,6 @@ def _process_features(
     """
     nodes = []  # all nodes, including ones that just compose ways
     feature_nodes = []  # nodes that possibly match our query tags
-    node_coords = {}  # hold node lon,lat tuples to create way geoms
     ways = []  # all ways, including ones that just compose relations
     feature_ways = []  # ways that possibly match our query tags
     way_geoms = {}  # hold way geoms to create relation geoms
@@ -452,31 +515,36 @@ def _process_features(
         elif et == "relation" and element.get("tags", {}).get("type") in _RELATION_TYPES:
             relations.append(element)
 
-    # extract all nodes' coords, then add to features any nodes with tags that
-    # match the passed query tags, or with any tags if no query tags passed
+    # hold all nodes' lon,lat coords in arrays sorted by node ID, to look up
+    # the coords of ways' nodes in bulk when creating way geoms
+    node_ids = np.array([node["id"] for node in nodes], dtype=np.int64)
+    node_coords = np.array([(node["lon"], node["lat"]) for node in nodes], dtype=float)
+    order = np.argsort(node_ids, kind="stable")
+    node_ids, node_coords = node_ids[order], node_coords.reshape(-1, 2)[order]
+
+    # add to features any nodes with tags that match the passed query tags, or
+    # with any tags if no query tags passed, then create their points in bulk
+    match_any_tags = len(query_tag_keys) == 0
+    feature_coords = []
     for node in nodes:
-        node_coords[node["id"]] = (node["lon"], node["lat"])
-        if (len(query_tag_keys) == 0 and len(node.get("tags", {}).keys()) > 0) or (
-            len(query_tag_keys & node.get("tags", {}).keys()) > 0
-        ):
+        tags = node.get("tags", {})
+        if (match_any_tags and len(tags) > 0) or not query_tag_keys.isdisjoint(tags):
             node["element"] = node.pop("type")
-            node["geometry"] = Point(node.pop("lon"), node.pop("lat"))
-            node.update(node.pop("tags"))
+            feature_coords.append((node.pop("lon"), node.pop("lat")))
             feature_nodes.append(node)
+    points = shapely.points(np.array(feature_coords, dtype=float).reshape(-1, 2))
+    for node, point in zip(feature_nodes, points):
+        node["geometry"] = point
+        node.update(node.pop("tags"))
 
     # build all ways' geometries, then add to features any ways with tags that
     # match the passed query tags, or with any tags if no query tags passed
-    for way in ways:
-        way["geometry"] = _build_way_geometry(
-            way["id"],
-            way.pop("nodes"),
-            way.get("tags", {}),
-            node_coords,
-        )
-        way_geoms[way["id"]] = way["geometry"]
-        if (len(query_tag_keys) == 0 and len(way.get("tags", {}).keys()) > 0) or (
-            len(query_tag_keys & way.get("tags", {}).keys()) > 0
-        ):
+    for way, geom in zip(ways, _build_way_geometries(ways, node_ids, node_coords)):
+        del way["nodes"]
+        way["geometry"] = geom
+        way_geoms[way["id"]] = geom
+        tags = way.get("tags", {})
+        if (match_any_tags and len(tags) > 0) or not query_tag_keys.isdisjoint(tags):
             way["element"] = way.pop("type")
             way.update(way.pop("tags"))
             feature_ways.append(way)
@@ -485,7 +553,9 @@ def _process_features(
     for relation in relations:
         relation["element"] = "relation"
         relation.update(relation.pop("tags"))
-        relation["geometry"] = _build_relation_geometry(relation.pop("members"), way_geoms)
+    geoms = _build_relation_geometries(relations, way_geoms, cpus)
+    for relation, geom in zip(relations, geoms):
+        relation["geometry"] = geom
 
     features = [*feature_nodes, *feature_ways, *relations]
     if len(features) == 0:
@@ -495,6 +565,113 @@ def _process_features(
     return features
 
 
+def _build_way_geometries(
+    ways: list[dict[str, Any]],
+    node_ids: npt.NDArray[np.int64],
+    node_coords: npt.NDArray[np.float64],
+) -> list[LineString | Polygon]:
+    """
+    Build ways' geometries in bulk from their constituent nodes' coordinates.
+
+    Looks up all the ways' node coordinates at once, then creates the ways'
+    LineStrings and Polygons in bulk from the flat coordinates array and a
+    ragged index array of the way each coordinate belongs to. Ways that cannot
+    be built this way (such as ways with missing nodes) are passed one at a
+    time to `_build_way_geometry`.
+
+    Parameters
+    ----------
+    ways
+        The way elements, with their "nodes" lists of node IDs.
+    node_ids
+        Sorted OSM node IDs.
+    node_coords
+        The `(lon, lat)` coordinates of the nodes in `node_ids`.
+
+    Returns
+    -------
+    geometries
+        The ways' geometries, in the order of `ways`.
+    """
+    # flatten all the ways' node refs, labeling each with its way's index
+    counts = np.array([len(way["nodes"]) for way in ways], dtype=np.int64)
+    refs = np.fromiter(chain.from_iterable(way["nodes"] for way in ways), dtype=np.int64)
+    way_idx = np.repeat(np.arange(len(ways)), counts)
+
+    # find each node ref's position in the sorted node IDs, if it's there
+    pos = np.searchsorted(node_ids, refs).clip(max=max(len(node_ids) - 1, 0))
+    found = node_ids[pos] == refs if len(node_ids) > 0 else np.zeros(len(refs), dtype=bool)
+    complete = np.bincount(way_idx[~found], minlength=len(ways)) == 0
+
+    # ways need enough coords to make a valid LineString or Polygon ring
+    is_polygon = np.array(
+        [_is_polygon_way(way["nodes"], way.get("tags", {})) for way in ways],
+        dtype=bool,
+    )
+    valid = complete & (counts >= np.where(is_polygon, 4, 2))
+
+    def _coords(
+        mask: npt.NDArray[np.bool_],
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+        # get the coords of the masked ways, and for each coord the index of
+        # its way among the masked ways (renumbered to be contiguous from 0)
+        coords_mask = mask[way_idx]
+        indices = np.cumsum(mask, dtype=np.int64)[way_idx[coords_mask]] - 1
+        return node_coords[pos[coords_mask]], indices
+
+    geoms = np.empty(len(ways), dtype=object)
+    lines = valid & ~is_polygon
+    if lines.any():
+        coords, indices = _coords(lines)
+        geoms[lines] = shapely.linestrings(coords, indices=indices)
+    polygons = valid & is_polygon
+    if polygons.any():
+        coords, indices = _coords(polygons)
+        geoms[polygons] = shapely.polygons(shapely.linearrings(coords, indices=indices))
+
+    # fall back to building invalid ways one at a time, to log the reason
+    starts = np.cumsum(counts) - counts
+    for i in np.flatnonzero(~valid):
+        way = ways[i]
+        way_slice = slice(starts[i], starts[i] + counts[i])
+        way_pos = pos[way_slice][found[way_slice]]
+        way_coords = dict(zip(node_ids[way_pos].tolist(), map(tuple, node_coords[way_pos])))
+        geoms[i] = _build_way_geometry(way["id"], way["nodes"], way.get("tags", {}), way_coords)
+
+    return geoms.tolist()
+
+
+def _is_polygon_way(way_nodes: list[int], way_tags: dict[str, Any]) -> bool:
+    """
+    Determine if a way's geometry should be a Polygon rather than LineString.
+
+    A way is a LineString by default, but if it's a closed way and it's not
+    tagged area=no, check if any of its tags denote it as a polygon instead.
+
+    Parameters
+    ----------
+    way_nodes
+        The way's constituent nodes.
+    way_tags
+        The way's tags.
+
+    Returns
+    -------
+    is_polygon
+    """
+    if way_nodes[0] == way_nodes[-1] and way_tags.get("area") != "no":
+        for tag in way_tags.keys() & _POLYGON_FEATURES.keys():
+            rule = _POLYGON_FEATURES[tag]["polygon"]
+            values = _POLYGON_FEATURES[tag].get("values", set())
+            if (
+                rule == "all"
+                or (rule == "passlist" and way_tags[tag] in values)
+                or (rule == "blocklist" and way_tags[tag] not in values)
+            ):
+                return True
+    return False
+
+
 def _build_way_geometry(
     way_id: int,
     way_nodes: list[int],
@@ -517,26 +694,13 @@ def _build_way_geometry(
     way_tags
         The way's tags.
     node_coords
-        Keyed by OSM node ID with values of `(lat, lon)` coordinate tuples.
+        Keyed by OSM node ID with values of `(lon, lat)` coordinate tuples.
 
     Returns
     -------
     geometry
     """
-    # a way is a LineString by default, but if it's a closed way and it's not
-    # tagged area=no, check if any of its tags denote it as a polygon instead
-    geom_type = LineString
-    if way_nodes[0] == way_nodes[-1] and way_tags.get("area") != "no":
-        for tag in way_tags.keys() & _POLYGON_FEATURES.keys():
-            rule = _POLYGON_FEATURES[tag]["polygon"]
-            values = _POLYGON_FEATURES[tag].get("values", set())
-            if (
-                rule == "all"
-                or (rule == "passlist" and way_tags[tag] in values)
-                or (rule == "blocklist" and way_tags[tag] not in values)
-            ):
-                geom_type = Polygon
-                break
+    geom_type = Polygon if _is_polygon_way(way_nodes, way_tags) else LineString
 
     # create the way geometry from its constituent nodes' coordinates
     try:
@@ -547,6 +711,57 @@ def _build_way_geometry(
         return geom_type()
 
 
+def _build_relation_geometries(
+    relations: list[dict[str, Any]],
+    way_geoms: dict[int, LineString | Polygon],
+    cpus: int | None,
+) -> list[Polygon | MultiPolygon]:
+    """
+    Build relations' geometries, optionally in parallel.
+
+    Relations are independent of each other once their member ways' geometries
+    are built, so if `cpus` is greater than 1 their geometries are built in
+    parallel by a pool of worker processes, each relation being sent only its
+    own member ways' geometries.
+
+    Parameters
+    ----------
+    relations
+        The relations, whose "members" are popped.
+    way_geoms
+        Keyed by OSM way ID with values of their geometries.
+    cpus
+        How many CPU cores to use. If None, use all available.
+
+    Returns
+    -------
+    geometries
+        The relations' geometries, in the order of `relations`.
+    """
+    args = []
+    for relation in relations:
+        members = relation.pop("members")
+        refs = (m["ref"] for m in members if m["type"] == "way" and m["ref"] in way_geoms)
+        args.append((members, {ref: way_geoms[ref] for ref in refs}))
+
+    # determine how many cpu cores to use
+    if cpus is None:
+        cpus = mp.cpu_count()
+    cpus = min(cpus, mp.cpu_count())
+
+    # if single-threading, build each relation's geometry one at a time
+    if cpus == 1 or len(args) <= 1:
+        return [_build_relation_geometry(*arg) for arg in args]
+
+    # if multi-threading, build relations' geometries in parallel
+    with mp.get_context("spawn").Pool(cpus) as pool:
+        geoms: list[Polygon | MultiPolygon] = pool.starmap_async(
+            _build_relation_geometry,
+            args,
+        ).get()
+    return geoms
+
+
 def _build_relation_geometry(
     members: list[dict[str, Any]],
     way_geoms: dict[int, LineString | Polygon],
@@ -573,41 +788,122 @@ def _build_relation_geometry(
     -------
     geometry
     """
-    inner_linestrings = []
-    outer_linestrings = []
-    inner_polygons = []
-    outer_polygons = []
+    linestrings: dict[str, list[LineString]] = {"outer": [], "inner": []}
+    polygons: dict[str, list[Polygon]] = {"outer": [], "inner": []}
 
-    # sort member geometries by member role and geometry type
+    # sort member geometries by member role and geometry type, skipping any
+    # member ways missing from the data (such as in clipped extracts) or whose
+    # geometries could not be built
     for member in members:
-        if member["type"] == "way":
-            geom = way_geoms[member["ref"]]
-            role = member["role"]
-            if role == "outer" and geom.geom_type == "LineString":
-                outer_linestrings.append(geom)
-            elif role == "outer" and geom.geom_type == "Polygon":
-                outer_polygons.append(geom)
-            elif role == "inner" and geom.geom_type == "LineString":
-                inner_linestrings.append(geom)
-            elif role == "inner" and geom.geom_type == "Polygon":
-                inner_polygons.append(geom)
-
-    # merge/polygonize outer linestring fragments then add to outer polygons
-    merged_outer_linestrings = linemerge(outer_linestrings)
-    if merged_outer_linestrings.geom_type == "LineString":
-        merged_outer_linestrings = MultiLineString([merged_outer_linestrings])
-    for merged_outer_linestring in merged_outer_linestrings.geoms:
-        outer_polygons += polygonize(merged_outer_linestring)
-
-    # merge/polygonize inner linestring fragments then add to inner polygons
-    merged_inner_linestrings = linemerge(inner_linestrings)
-    if merged_inner_linestrings.geom_type == "LineString":
-        merged_inner_linestrings = MultiLineString([merged_inner_linestrings])
-    for merged_inner_linestring in merged_inner_linestrings.geoms:
-        inner_polygons += polygonize(merged_inner_linestring)
-
-    # remove holes from polygons, if any, then retun
-    return _remove_polygon_holes(outer_polygons, inner_polygons)
+        role = member["role"]
+        if member["type"] == "way" and role in linestrings:
+            geom = way_geoms.get(member["ref"])
+            if geom is None or geom.is_empty:
+                continue
+            if geom.geom_type == "LineString":
+                linestrings[role].append(geom)
+            elif geom.geom_type == "Polygon":
+                polygons[role].append(geom)
+
+    # merge linestring fragments into closed rings then add to polygons
+    for role, role_linestrings in linestrings.items():
+        polygons[role].extend(_assemble_rings(role_linestrings))
+
+    # remove holes from polygons, if any, then return
+    return _remove_polygon_holes(polygons["outer"], polygons["inner"])
+
+
+def _assemble_rings(linestrings: list[LineString]) -> list[Polygon]:
+    """
+    Merge linestring fragments end to end into the polygons of closed rings.
+
+    Hashes each fragment's end coordinates, then walks from each unused
+    fragment to an unused fragment sharing its current end coordinate
+    (reversing that fragment if needed) until the ring closes. If the walk
+    returns to a vertex already in the ring other than its start, such as
+    where two rings touch, the sub-ring it closed is split off as its own
+    ring. Fragments that cannot be closed into a ring are dropped.
+
+    Parameters
+    ----------
+    linestrings
+        The linestring fragments, such as a relation's outer member ways.
+
+    Returns
+    -------
+    polygons
+    """
+    fragments = [list(linestring.coords) for linestring in linestrings]
+    ends: dict[tuple[float, ...], list[int]] = {}
+    rings = []
+    used = [False] * len(fragments)
+    for i, coords in enumerate(fragments):
+        if coords[0] == coords[-1]:
+            # this fragment is already a closed ring by itself
+            used[i] = True
+            rings.append(coords)
+        else:
+            ends.setdefault(coords[0], []).append(i)
+            ends.setdefault(coords[-1], []).append(i)
+
+    for i, coords in enumerate(fragments):
+        if used[i]:
+            continue
+        used[i] = True
+        ring: list[tuple[float, ...]] = []
+        positions: dict[tuple[float, ...], int] = {}
+        _extend_ring(ring, positions, coords, rings)
+        while ring[-1] != ring[0]:
+            j = next((j for j in ends[ring[-1]] if not used[j]), None)
+            if j is None:
+                # dead end: this ring cannot be closed
+                break
+            used[j] = True
+            fragment = fragments[j]
+            new_coords = fragment[1:] if fragment[0] == ring[-1] else fragment[-2::-1]
+            _extend_ring(ring, positions, new_coords, rings)
+        else:
+            rings.append(ring)
+
+    return [Polygon(ring) for ring in rings if len(ring) >= _MIN_RING_COORDS]
+
+
+def _extend_ring(
+    ring: list[tuple[float, ...]],
+    positions: dict[tuple[float, ...], int],
+    coords: list[tuple[float, ...]],
+    rings: list[list[tuple[float, ...]]],
+) -> None:
+    """
+    Append coordinates to a ring being walked, splitting off closed sub-rings.
+
+    Parameters
+    ----------
+    ring
+        The ring's coordinates so far, extended in place.
+    positions
+        Each of the ring's vertices' positions in the ring, updated in place.
+    coords
+        The coordinates to append to the ring.
+    rings
+        The closed rings, to which any sub-rings split off are appended.
+
+    Returns
+    -------
+    None
+    """
+    for coord in coords:
+        n = positions.get(coord)
+        if n is not None and n > 0:
+            # the walk returned to a vertex inside the ring, so split off the
+            # sub-ring it closed and carry on walking from that vertex
+            rings.append([*ring[n:], coord])
+            for vertex in ring[n + 1 :]:
+                positions.pop(vertex, None)
+            del ring[n + 1 :]
+        else:
+            positions.setdefault(coord, len(ring))
+            ring.append(coord)
 
 
 def _remove_polygon_holes(
@@ -617,7 +913,9 @@ def _remove_polygon_holes(
     """
     Subtract inner holes from outer polygons.
 
-    This allows possible island polygons within a larger polygon's holes.
+    This allows possible island polygons within a larger polygon's holes. An
+    STRtree of the inner polygons finds which inner polygons each outer
+    polygon contains, then each outer polygon's holes are subtracted at once.
 
     Parameters
     ----------
@@ -630,18 +928,21 @@ def _remove_polygon_holes(
     -------
     geometry
     """
-    if len(inner_polygons) == 0:
-        # if there are no holes to remove, geom is the union of outer polygons
-        geometry = unary_union(outer_polygons)
-    else:
-        # otherwise, remove from each outer poly each inner poly it contains
-        polygons_with_holes = []
-        for outer in outer_polygons:
-            for inner in inner_polygons:
-                if outer.contains(inner):
-                    outer = outer.difference(inner)  # noqa: PLW2901
-            polygons_with_holes.append(outer)
-        geometry = unary_union(polygons_with_holes)
+    polygons = np.empty(len(outer_polygons), dtype=object)
+    polygons[:] = outer_polygons
+
+    if len(inner_polygons) > 0 and len(outer_polygons) > 0:
+        # find each (outer, inner) pair where the outer contains the inner,
+        # sorted by outer, then subtract the union of each outer's inners
+        outer_idx, inner_idx = STRtree(inner_polygons).query(polygons, predicate="contains")
+        if len(outer_idx) > 0:
+            holed, starts = np.unique(outer_idx, return_index=True)
+            inners = np.array(inner_polygons, dtype=object)[inner_idx]
+            holes = [shapely.union_all(group) for group in np.split(inners, starts[1:])]
+            polygons[holed] = shapely.difference(polygons[holed], holes)
+
+    # the geom is the union of the (possibly holed) outer polygons
+    geometry = shapely.union_all(polygons)
 
     # ensure returned geometry is a Polygon or MultiPolygon
     if isinstance(geometry, (Polygon, MultiPolygon)):
@@ -6,17 +6,22 @@ Refer to the Getting Started guide for usage limitations.
 
 from __future__ import annotations
 
+import copy
 import logging as lg
 from collections.abc import Iterable
 from itertools import groupby
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from warnings import warn
 
 import networkx as nx
+import numpy as np
+import shapely
 from shapely import MultiPolygon
 from shapely import Polygon
 
+from . import _osm_pbf
 from . import _osm_xml
 from . import _overpass
 from . import distance
@@ -34,8 +39,12 @@ from ._version import __version__
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Iterator
     from pathlib import Path
 
+# number of streamed node elements to test against a clipping polygon at once
+_CLIP_BATCH_SIZE = 10_000
+
 
 def graph_from_bbox(
     bbox: tuple[float, float, float, float],
@@ -502,6 +511,8 @@ def graph_from_xml(
     simplify: bool = True,
     retain_all: bool = False,
     encoding: str = "utf-8",
+    polygon: Polygon | MultiPolygon | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
 ) -> nx.MultiDiGraph:
     """
     Create a graph from data in an OSM XML file.
@@ -515,6 +526,10 @@ def graph_from_xml(
     settings to configure which OSM node/way tags are added as graph node/edge
     attributes.
 
+    Pass a `polygon` or `bbox` to build the graph only within that area: nodes
+    outside it are dropped while the file is parsed, so memory use and run
+    time depend on the area of interest rather than the size of the file.
+
     Parameters
     ----------
     filepath
@@ -528,13 +543,23 @@ def graph_from_xml(
         False, retain only the largest weakly connected component.
     encoding
         The OSM XML file's character encoding.
+    polygon
+        If not None, only retain nodes within this geometry, and the edges
+        between them. Coordinates should be in unprojected latitude-longitude
+        degrees (EPSG:4326).
+    bbox
+        If not None, only retain nodes within this bounding box, as `(north,
+        south, east, west)`, and the edges between them. Cannot be passed
+        together with `polygon`.
 
     Returns
     -------
     G
     """
-    # transmogrify file of OSM XML data into JSON
-    response_jsons = [_osm_xml._overpass_json_from_xml(filepath, encoding)]
+    # transmogrify file of OSM XML data into JSON, streaming its elements so
+    # they are converted to nodes/paths as they are parsed from the file
+    response_json = _osm_xml._overpass_json_from_xml(filepath, encoding, stream=True)
+    response_jsons = [_clip_response_json(response_json, polygon, bbox)]
 
     # create graph using this response JSON
     G = _create_graph(response_jsons, bidirectional)
@@ -552,6 +577,184 @@ def graph_from_xml(
     return G
 
 
+def graph_from_pbf(
+    filepath: str | Path,
+    *,
+    network_type: str = "all",
+    simplify: bool = True,
+    retain_all: bool = False,
+    custom_filter: str | None = None,
+    polygon: Polygon | MultiPolygon | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
+) -> nx.MultiDiGraph:
+    """
+    Create a graph from data in an OSM PBF file.
+
+    This function reads a local .osm.pbf extract (such as one from Geofabrik)
+    without making any request to the Overpass API, keeping only the ways
+    that match a pre-defined `network_type` or your own `custom_filter`, like
+    the functions that download graphs do, plus the nodes those ways use.
+    Reading PBF files requires the `osmium` package to be installed.
+
+    Use the `settings` module's `useful_tags_node` and `useful_tags_way`
+    settings to configure which OSM node/way tags are added as graph node/edge
+    attributes.
+
+    Parameters
+    ----------
+    filepath
+        Path to file containing OSM PBF data.
+    network_type
+        {"all", "all_public", "bike", "drive", "drive_service", "walk"}
+        What type of street network to retrieve if `custom_filter` is None.
+    simplify
+        If True, simplify graph topology with the `simplify_graph` function.
+    retain_all
+        If True, return the entire graph even if it is not connected. If
+        False, retain only the largest weakly connected component.
+    custom_filter
+        A custom ways filter to be used instead of the `network_type` presets,
+        e.g. `'["power"~"line"]' or '["highway"~"motorway|trunk"]'`. Only
+        chained tag filter clauses are supported. Also pass in a
+        `network_type` that is in `settings.bidirectional_network_types` if
+        you want the graph to be fully bidirectional.
+    polygon
+        If not None, only retain nodes within this geometry, and the edges
+        between them, dropping the others while the file is read.
+        Coordinates should be in unprojected latitude-longitude degrees
+        (EPSG:4326).
+    bbox
+        If not None, only retain nodes within this bounding box, as `(north,
+        south, east, west)`, and the edges between them. Cannot be passed
+        together with `polygon`.
+
+    Returns
+    -------
+    G
+    """
+    # read the ways matching the filter and their nodes from the PBF file
+    way_filter = (
+        custom_filter if custom_filter is not None else _overpass._get_network_filter(network_type)
+    )
+    response_json = _osm_pbf._overpass_json_from_pbf(filepath, way_filter=way_filter)
+    response_jsons = [_clip_response_json(response_json, polygon, bbox)]
+
+    # create graph using this response JSON
+    bidirectional = network_type in settings.bidirectional_network_types
+    G = _create_graph(response_jsons, bidirectional)
+
+    # keep only the largest weakly connected component if retain_all is False
+    if not retain_all:
+        G = truncate.largest_component(G, strongly=False)
+
+    # simplify the graph topology as the last step
+    if simplify:
+        G = simplification.simplify_graph(G)
+
+    msg = f"graph_from_pbf returned graph with {len(G):,} nodes and {len(G.edges):,} edges"
+    utils.log(msg, level=lg.INFO)
+    return G
+
+
+def _clip_response_json(
+    response_json: dict[str, Any],
+    polygon: Polygon | MultiPolygon | None,
+    bbox: tuple[float, float, float, float] | None,
+) -> dict[str, Any]:
+    """
+    Clip an Overpass-like response's elements to a polygon or bounding box.
+
+    Parameters
+    ----------
+    response_json
+        Overpass-like JSON response, such as one read from a local file.
+    polygon
+        If not None, drop nodes outside this geometry.
+    bbox
+        If not None, drop nodes outside this bounding box, as `(north, south,
+        east, west)`.
+
+    Returns
+    -------
+    response_json
+        The response, with its elements clipped lazily as they are consumed.
+    """
+    if polygon is not None and bbox is not None:
+        msg = "Pass either `polygon` or `bbox`, not both."
+        raise ValueError(msg)
+    if bbox is not None:
+        polygon = utils_geo.bbox_to_poly(bbox)
+    if polygon is None:
+        return response_json
+    return {"elements": _clip_elements(response_json["elements"], polygon)}
+
+
+def _clip_elements(
+    elements: Iterable[dict[str, Any]],
+    polygon: Polygon | MultiPolygon,
+) -> Iterator[dict[str, Any]]:
+    """
+    Drop node elements outside a polygon and way elements entirely outside it.
+
+    Nodes are tested against the polygon in batches as they stream past. Ways
+    with any node inside the polygon are kept whole: `_add_paths` then skips
+    their edges to the nodes that were dropped. This relies on nodes preceding
+    the ways that use them, as they do in sorted OSM XML and PBF files, so it
+    warns if a node follows a dropped way, which may have had nodes inside.
+
+    Parameters
+    ----------
+    elements
+        Overpass-like node, way, and relation elements.
+    polygon
+        Only retain nodes within this geometry.
+
+    Yields
+    ------
+    element
+    """
+    # prepare a copy so the caller's polygon is not modified
+    polygon = copy.copy(polygon)
+    shapely.prepare(polygon)
+    node_ids: set[int] = set()
+    batch: list[dict[str, Any]] = []
+    dropped_way = False
+
+    def _flush() -> list[dict[str, Any]]:
+        x = np.array([node["lon"] for node in batch], dtype=float)
+        y = np.array([node["lat"] for node in batch], dtype=float)
+        inside = [node for node, i in zip(batch, shapely.intersects_xy(polygon, x, y)) if i]
+        node_ids.update(node["id"] for node in inside)
+        batch.clear()
+        return inside
+
+    for element in elements:
+        if element["type"] == "node":
+            if dropped_way:
+                msg = (
+                    "Nodes follow ways in this file, so ways whose nodes were not yet "
+                    "read may have been dropped while clipping it. Sort the file with "
+                    "nodes first (for example, with `osmium sort`) or clip the graph "
+                    "after creating it."
+                )
+                warn(msg, category=UserWarning, stacklevel=2)
+                dropped_way = False
+            batch.append(element)
+            if len(batch) >= _CLIP_BATCH_SIZE:
+                yield from _flush()
+            continue
+
+        if len(batch) > 0:
+            yield from _flush()
+        if element["type"] != "way" or not node_ids.isdisjoint(element["nodes"]):
+            yield element
+        else:
+            dropped_way = True
+
+    if len(batch) > 0:
+        yield from _flush()
+
+
 def _create_graph(
     response_jsons: Iterable[dict[str, Any]],
     bidirectional: bool,  # noqa: FBT001
@@ -818,6 +1021,11 @@ def _add_paths(
         # zip path nodes to get (u, v) tuples like [(0,1), (1,2), (2,3)].
         edges = list(zip(nodes[:-1], nodes[1:]))
 
+        # skip edges to any nodes missing from the data, such as the nodes
+        # outside the area of interest clipped away while parsing a file
+        if not all(node in G for node in nodes):
+            edges = [(u, v) for u, v in edges if u in G and v in G]
+
         # add all the edge tuples and give them the path's tag:value attrs
         path["reversed"] = False
         G.add_edges_from(edges, **path)
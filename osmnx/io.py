@@ -3,15 +3,31 @@
 from __future__ import annotations
 
 import ast
+import bz2
 import contextlib
+import gc
+import gzip
+import json
 import logging as lg
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from itertools import chain
+from itertools import compress
+from itertools import islice
 from pathlib import Path
+from typing import IO
 from typing import TYPE_CHECKING
 from typing import Any
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+from xml.sax.saxutils import quoteattr
 
 import networkx as nx
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
-from shapely import wkt
+import pyproj
+import shapely
 
 from . import _osm_xml
 from . import convert
@@ -19,8 +35,25 @@ from . import settings
 from . import utils
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
     import geopandas as gpd
 
+# pyarrow is an optional dependency for saving/loading graphs as GeoParquet
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+# pyogrio is an optional dependency for faster GeoPackage writing
+try:
+    import pyogrio
+except ImportError:  # pragma: no cover
+    pyogrio = None
+
 
 def save_graph_geopackage(
     G: nx.MultiDiGraph,
@@ -28,10 +61,17 @@ def save_graph_geopackage(
     *,
     directed: bool = False,
     encoding: str = "utf-8",
+    node_attrs: Iterable[str] | None = None,
+    edge_attrs: Iterable[str] | None = None,
 ) -> None:
     """
     Save graph nodes and edges to disk as layers in a GeoPackage file.
 
+    The nodes layer is written in a background thread while the edges are
+    converted to a GeoDataFrame, then the edges layer is written. If pyogrio
+    is installed, it is used to write the layers, via Arrow if pyarrow is
+    also installed and the GDAL version supports it.
+
     Parameters
     ----------
     G
@@ -42,9 +82,16 @@ def save_graph_geopackage(
     directed
         If False, save one edge for each undirected edge in the graph but
         retain original oneway and to/from information as edge attributes. If
-        True, save one edge for each directed edge in the graph.
+        True, save one edge for each directed edge in the graph, which skips
+        the search for reciprocal duplicate edges.
     encoding
         The character encoding of the saved GeoPackage file.
+    node_attrs
+        Names of the node attributes to save. If None, save all of them. Any
+        that the nodes lack are ignored. Geometries are always saved.
+    edge_attrs
+        Names of the edge attributes to save. If None, save all of them. Any
+        that the edges lack are ignored. Geometries are always saved.
 
     Returns
     -------
@@ -56,17 +103,15 @@ def save_graph_geopackage(
     # if save folder does not already exist, create it
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    # convert graph to gdfs and stringify non-numeric columns
-    if directed:
-        gdf_nodes, gdf_edges = convert.graph_to_gdfs(G)
-    else:
-        gdf_nodes, gdf_edges = convert.graph_to_gdfs(convert.to_undirected(G))
-    gdf_nodes = _stringify_nonnumeric_cols(gdf_nodes)
-    gdf_edges = _stringify_nonnumeric_cols(gdf_edges)
-
-    # save the nodes and edges as GeoPackage layers
-    gdf_nodes.to_file(filepath, layer="nodes", driver="GPKG", index=True, encoding=encoding)
-    gdf_edges.to_file(filepath, layer="edges", driver="GPKG", index=True, encoding=encoding)
+    # write the nodes layer in the background while converting the edges. the
+    # layers are written one at a time because they share one SQLite file
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        gdf_nodes = _select_cols(convert.graph_to_gdfs(G, edges=False), node_attrs)
+        future = executor.submit(_write_gpkg_layer, gdf_nodes, filepath, "nodes", encoding)
+        G_edges = G if directed else convert.to_undirected(G)
+        gdf_edges = _select_cols(convert.graph_to_gdfs(G_edges, nodes=False), edge_attrs)
+        future.result()
+    _write_gpkg_layer(gdf_edges, filepath, "edges", encoding)
 
     msg = f"Saved graph as GeoPackage at {filepath!r}"
     utils.log(msg, level=lg.INFO)
@@ -82,13 +127,17 @@ def save_graphml(
     """
     Save graph to disk as GraphML file.
 
+    The graph is streamed to the file in chunks of nodes and edges, with every
+    attribute value saved as a string, so it never gets copied in memory.
+
     Parameters
     ----------
     G
         The graph to save as.
     filepath
         Path to the GraphML file including extension. If None, use default
-        `settings.data_folder/graph.graphml`.
+        `settings.data_folder/graph.graphml`. If the extension is ".gz" or
+        ".bz2", the file will be gzip or bzip2 compressed, respectively.
     gephi
         If True, give each edge a unique key/id for compatibility with Gephi's
         interpretation of the GraphML specification.
@@ -105,30 +154,8 @@ def save_graphml(
     # if save folder does not already exist, create it
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    if gephi:
-        # for gephi compatibility, each edge's key must be unique as an id
-        uvkd = ((u, v, k, d) for k, (u, v, d) in enumerate(G.edges(keys=False, data=True)))
-        G = nx.MultiDiGraph(uvkd)
-
-    else:
-        # make a copy to not mutate original graph object caller passed in
-        G = G.copy()
-
-    # stringify all the graph attribute values
-    for attr, value in G.graph.items():
-        G.graph[attr] = str(value)
-
-    # stringify all the node attribute values
-    for _, data in G.nodes(data=True):
-        for attr, value in data.items():
-            data[attr] = str(value)
-
-    # stringify all the edge attribute values
-    for _, _, data in G.edges(keys=False, data=True):
-        for attr, value in data.items():
-            data[attr] = str(value)
-
-    nx.write_graphml(G, path=filepath, encoding=encoding)
+    with _open_file(filepath, "wb") as f:
+        _write_graphml(G, f, encoding=encoding, gephi=gephi)
     msg = f"Saved graph as GraphML file at {filepath!r}"
     utils.log(msg, level=lg.INFO)
 
@@ -162,7 +189,8 @@ def load_graphml(
     Parameters
     ----------
     filepath
-        Path to the GraphML file.
+        Path to the GraphML file. If the extension is ".gz" or ".bz2", the
+        file will be decompressed with gzip or bzip2, respectively.
     graphml_str
         Valid and decoded string representation of a GraphML file's contents.
     node_dtypes
@@ -216,21 +244,14 @@ def load_graphml(
         default_edge_dtypes.update(edge_dtypes)
 
     if filepath is not None:
-        # read the graphml file from disk
+        # stream-parse the graphml file from disk
         source = filepath
-        G = nx.read_graphml(
-            Path(filepath),
-            node_type=default_node_dtypes["osmid"],
-            force_multigraph=True,
-        )
+        with _open_file(Path(filepath), "rb") as f:
+            G = _parse_graphml(f, node_type=default_node_dtypes["osmid"])
     else:
-        # parse the graphml string
+        # stream-parse the graphml string
         source = "string"
-        G = nx.parse_graphml(
-            graphml_str,
-            node_type=default_node_dtypes["osmid"],
-            force_multigraph=True,
-        )
+        G = _parse_graphml(StringIO(graphml_str), node_type=default_node_dtypes["osmid"])
 
     # convert graph/node/edge attribute data types
     msg = "Converting node, edge, and graph-level attribute data types"
@@ -244,6 +265,375 @@ def load_graphml(
     return G
 
 
+def save_graph_parquet(
+    G: nx.MultiDiGraph,
+    filepath: str | Path | None = None,
+    *,
+    compression: str = "zstd",
+) -> None:
+    """
+    Save graph to disk as a folder of GeoParquet files.
+
+    The graph's nodes and edges are saved as "nodes.parquet" and
+    "edges.parquet" tables in the folder, with the graph-level attributes
+    saved in the tables' metadata. Geometries are saved as WKB in GeoParquet
+    format, with each node also getting a point geometry derived from its `x`
+    and `y` attributes so that the tables can be read by GIS software such as
+    `geopandas.read_parquet`. Lists (and lists mixed with scalars, as in the
+    `osmid` attributes of simplified edges) are saved natively as Parquet list
+    columns. Attributes that cannot be stored natively, such as sets, dicts,
+    or mixed strings and numbers, are saved as strings.
+
+    Requires that pyarrow is installed as an optional dependency. Use the
+    `load_graph_parquet` function to load the saved graph.
+
+    Parameters
+    ----------
+    G
+        The graph to save.
+    filepath
+        Path to the folder to save the GeoParquet files in. If None, use
+        default `settings.data_folder/graph.parquet`.
+    compression
+        Name of the compression codec to use, passed to pyarrow.
+
+    Returns
+    -------
+    None
+    """
+    if pa is None or pq is None:  # pragma: no cover
+        msg = "pyarrow must be installed as an optional dependency to save graphs as GeoParquet."
+        raise ImportError(msg)
+
+    # default filepath if none was provided
+    filepath = Path(settings.data_folder) / "graph.parquet" if filepath is None else Path(filepath)
+
+    # if save folder does not already exist, create it
+    filepath.mkdir(parents=True, exist_ok=True)
+
+    # extract the node and edge attribute columns from the graph
+    crs = G.graph.get("crs")
+    graph_attrs = json.loads(json.dumps(G.graph, default=str))
+    node_ids, node_datas = zip(*G.nodes(data=True)) if len(G) > 0 else ((), ())
+    nodes = {"osmid": list(node_ids), **_attr_columns(node_datas)}
+    edge_tuples = list(G.edges(keys=True, data=True))
+    edges = {
+        "u": [u for u, _, _, _ in edge_tuples],
+        "v": [v for _, v, _, _ in edge_tuples],
+        "key": [k for _, _, k, _ in edge_tuples],
+        **_attr_columns([d for _, _, _, d in edge_tuples]),
+    }
+
+    # give nodes point geometries from their coordinates if they lack them
+    derived_geometry = "geometry" not in nodes and all(
+        c in nodes and None not in nodes[c] for c in ("x", "y")
+    )
+    if derived_geometry:
+        nodes["geometry"] = list(shapely.points(nodes["x"], nodes["y"]))
+
+    # save the nodes and edges as GeoParquet files
+    for name, columns, index in (("nodes", nodes, ["osmid"]), ("edges", edges, ["u", "v", "key"])):
+        meta = {"graph": graph_attrs, "directed": G.is_directed(), "index": index}
+        if name == "nodes":
+            meta["derived_geometry"] = derived_geometry
+        table = _to_arrow_table(columns, crs, meta)
+        pq.write_table(table, filepath / f"{name}.parquet", compression=compression)
+
+    msg = f"Saved graph as GeoParquet files at {filepath!r}"
+    utils.log(msg, level=lg.INFO)
+
+
+def load_graph_parquet(
+    filepath: str | Path | None = None,
+    *,
+    node_columns: Iterable[str] | None = None,
+    edge_columns: Iterable[str] | None = None,
+) -> nx.MultiDiGraph:
+    """
+    Load a graph saved by the `save_graph_parquet` function from disk.
+
+    Only the requested node and edge attribute columns are read from disk,
+    so for example you can load a routable graph without any geometries by
+    passing `edge_columns=["length", "travel_time"]`. Unlike GraphML, the
+    attributes keep their original data types and do not need converting,
+    except for those that were saved as strings: of these, stringified lists,
+    dicts, and sets are evaluated back into containers, as `load_graphml`
+    does. Attributes with null values are omitted from their node or edge.
+
+    Requires that pyarrow is installed as an optional dependency.
+
+    Parameters
+    ----------
+    filepath
+        Path to the folder containing the GeoParquet files. If None, use
+        default `settings.data_folder/graph.parquet`.
+    node_columns
+        Names of the node attributes to load. If None, load all of them. The
+        node IDs are always loaded.
+    edge_columns
+        Names of the edge attributes to load. If None, load all of them. The
+        edges' `u`, `v`, and `key` are always loaded.
+
+    Returns
+    -------
+    G
+    """
+    if pa is None or pq is None:  # pragma: no cover
+        msg = "pyarrow must be installed as an optional dependency to load graphs from GeoParquet."
+        raise ImportError(msg)
+
+    # default filepath if none was provided
+    filepath = Path(settings.data_folder) / "graph.parquet" if filepath is None else Path(filepath)
+
+    # pause garbage collection, which would otherwise repeatedly traverse the
+    # millions of attribute dicts and values created while loading the graph
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # read the requested columns of the nodes and edges tables
+        meta, node_ids, node_datas = _read_arrow_table(filepath / "nodes.parquet", node_columns)
+        _, edge_ids, edge_datas = _read_arrow_table(filepath / "edges.parquet", edge_columns)
+
+        # build the graph from the node and edge attribute dicts
+        G = nx.MultiDiGraph() if meta["directed"] else nx.MultiGraph()
+        G.graph.update(meta["graph"])
+        G.add_nodes_from(zip(node_ids[0], node_datas))
+        G.add_edges_from(zip(*edge_ids, edge_datas))
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    msg = f"Loaded graph with {len(G)} nodes and {len(G.edges)} edges from {str(filepath)!r}"
+    utils.log(msg, level=lg.INFO)
+    return G
+
+
+def save_graph_snapshot(
+    G: nx.MultiDiGraph,
+    filepath: str | Path | None = None,
+    *,
+    weights: Iterable[str] = ("length",),
+) -> None:
+    """
+    Save graph to disk as a snapshot of flat NumPy arrays.
+
+    The snapshot is a folder of ".npy" files holding the node IDs in
+    ascending order, the nodes' `x` and `y` coordinates, the edges in
+    compressed sparse row (CSR) form as offsets into arrays of target node
+    indices and edge keys, and one array of values per edge weight attribute,
+    plus a "snapshot.json" sidecar holding the graph-level attributes and the
+    array manifest. Missing coordinate and weight values are saved as NaN.
+    Node IDs and edge keys must be integers.
+
+    Use the `load_graph_snapshot` function to memory-map the snapshot. Other
+    node and edge attributes are not saved: use `save_graph_parquet` or
+    `save_graphml` to save the full graph.
+
+    Parameters
+    ----------
+    G
+        The graph to save.
+    filepath
+        Path to the folder to save the snapshot in. If None, use default
+        `settings.data_folder/graph.snapshot`.
+    weights
+        Names of the numeric edge attributes to save as weight arrays.
+
+    Returns
+    -------
+    None
+    """
+    # default filepath if none was provided
+    filepath = Path(settings.data_folder) / "graph.snapshot" if filepath is None else Path(filepath)
+
+    # if save folder does not already exist, create it
+    filepath.mkdir(parents=True, exist_ok=True)
+
+    # sort the nodes by ID so that node indices can be found by binary search
+    nodes = np.fromiter(G.nodes, dtype=np.int64, count=len(G))
+    order = np.argsort(nodes, kind="stable")
+    arrays: dict[str, npt.NDArray[Any]] = {"osmid": nodes[order]}
+    for coord in ("x", "y"):
+        values = [data.get(coord, np.nan) for _, data in G.nodes(data=True)]
+        arrays[coord] = np.array(values, dtype=np.float64)[order]
+
+    # extract each edge's source and target node indices, key, and weights
+    # from the adjacency dicts, which hold both directions of undirected edges
+    edges = [
+        (u, v, k, data)
+        for u, nbrs in G.adj.items()
+        for v, keydict in nbrs.items()
+        for k, data in keydict.items()
+    ]
+    us = np.fromiter((u for u, _, _, _ in edges), dtype=np.int64, count=len(edges))
+    vs = np.fromiter((v for _, v, _, _ in edges), dtype=np.int64, count=len(edges))
+    u = np.searchsorted(arrays["osmid"], us)
+    v = np.searchsorted(arrays["osmid"], vs)
+    edge_order = np.argsort(u, kind="stable")
+    dtype = np.int32 if len(nodes) <= np.iinfo(np.int32).max else np.int64
+    counts = np.bincount(u, minlength=len(nodes))
+    arrays["offsets"] = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    arrays["targets"] = v[edge_order].astype(dtype)
+    arrays["keys"] = np.array([k for _, _, k, _ in edges], dtype=np.int64)[edge_order]
+    manifest = {name: f"{name}.npy" for name in arrays}
+    weight_files = {}
+    for i, weight in enumerate(weights):
+        values = [data.get(weight, np.nan) for _, _, _, data in edges]
+        arrays[f"weight_{i}"] = np.array(values, dtype=np.float64)[edge_order]
+        weight_files[weight] = f"weight_{i}.npy"
+
+    # save the arrays then the sidecar describing them
+    for name, array in arrays.items():
+        np.save(filepath / f"{name}.npy", array)
+    sidecar = {
+        "graph": json.loads(json.dumps(G.graph, default=str)),
+        "directed": G.is_directed(),
+        "arrays": manifest,
+        "weights": weight_files,
+    }
+    with (filepath / "snapshot.json").open("w") as f:
+        json.dump(sidecar, f, indent=2)
+
+    msg = f"Saved graph as snapshot at {str(filepath)!r}"
+    utils.log(msg, level=lg.INFO)
+
+
+def load_graph_snapshot(filepath: str | Path | None = None) -> GraphSnapshot:
+    """
+    Memory-map a graph snapshot saved by `save_graph_snapshot` from disk.
+
+    The snapshot's arrays are memory-mapped read-only rather than read into
+    memory, so loading is nearly instant regardless of the graph's size, and
+    all processes that load the same snapshot share its pages in the
+    operating system's page cache. The `routing.shortest_path` and
+    `distance.nearest_nodes` functions accept the returned snapshot in place
+    of a graph.
+
+    Parameters
+    ----------
+    filepath
+        Path to the snapshot folder. If None, use default
+        `settings.data_folder/graph.snapshot`.
+
+    Returns
+    -------
+    snapshot
+    """
+    # default filepath if none was provided
+    filepath = Path(settings.data_folder) / "graph.snapshot" if filepath is None else Path(filepath)
+    snapshot = GraphSnapshot(filepath)
+
+    m = len(snapshot.targets)
+    msg = f"Loaded snapshot with {len(snapshot)} nodes and {m} edges from {str(filepath)!r}"
+    utils.log(msg, level=lg.INFO)
+    return snapshot
+
+
+class GraphSnapshot:
+    """
+    Graph snapshot of flat NumPy arrays memory-mapped read-only from disk.
+
+    Use `load_graph_snapshot` to create one. Nodes are indexed in ascending
+    order of their IDs, and the outgoing edges of the node at index `i` are
+    those at positions `offsets[i]` through `offsets[i + 1] - 1` of the
+    `targets`, `keys`, and weight arrays. For undirected graphs, each edge
+    appears once in each direction. Pickling a snapshot pickles only its
+    filepath, so worker processes re-map the same files rather than copying
+    the arrays.
+
+    Parameters
+    ----------
+    filepath
+        Path to the snapshot folder.
+
+    Attributes
+    ----------
+    filepath
+        Path to the snapshot folder.
+    graph
+        The graph-level attributes.
+    directed
+        Whether the snapshotted graph was directed.
+    osmid
+        Node IDs, in ascending order.
+    x
+        Nodes' x coordinates.
+    y
+        Nodes' y coordinates.
+    offsets
+        Offsets of each node's outgoing edges in the edge arrays.
+    targets
+        Each edge's target node index.
+    keys
+        Each edge's key.
+    weights
+        Dict of edge attribute names:arrays of each edge's values.
+    """
+
+    def __init__(self, filepath: str | Path) -> None:
+        self.filepath = Path(filepath)
+        with (self.filepath / "snapshot.json").open() as f:
+            sidecar = json.load(f)
+        self.graph: dict[str, Any] = sidecar["graph"]
+        self.directed: bool = sidecar["directed"]
+        arrays = {
+            name: np.load(self.filepath / file, mmap_mode="r")
+            for name, file in sidecar["arrays"].items()
+        }
+        self.osmid: npt.NDArray[np.int64] = arrays["osmid"]
+        self.x: npt.NDArray[np.float64] = arrays["x"]
+        self.y: npt.NDArray[np.float64] = arrays["y"]
+        self.offsets: npt.NDArray[np.int64] = arrays["offsets"]
+        self.targets: npt.NDArray[np.integer[Any]] = arrays["targets"]
+        self.keys: npt.NDArray[np.int64] = arrays["keys"]
+        self.weights: dict[str, npt.NDArray[np.float64]] = {
+            name: np.load(self.filepath / file, mmap_mode="r")
+            for name, file in sidecar["weights"].items()
+        }
+
+    def __len__(self) -> int:
+        """
+        Return the number of nodes in the snapshot.
+
+        Returns
+        -------
+        n
+        """
+        return len(self.osmid)
+
+    def __reduce__(self) -> tuple[type[GraphSnapshot], tuple[Path]]:
+        """
+        Pickle the snapshot as its filepath, to re-map the files on unpickling.
+
+        Returns
+        -------
+        reduced
+        """
+        return (GraphSnapshot, (self.filepath,))
+
+    def node_index(self, nodes: Iterable[int]) -> npt.NDArray[np.intp]:
+        """
+        Find the indices of nodes in the snapshot's arrays by binary search.
+
+        Parameters
+        ----------
+        nodes
+            Node IDs to find.
+
+        Returns
+        -------
+        index
+        """
+        ids = np.fromiter(nodes, dtype=np.int64)
+        index = np.searchsorted(self.osmid, ids)
+        found = index < len(self.osmid)
+        found[found] = self.osmid[index[found]] == ids[found]
+        if not found.all():
+            msg = f"Node {ids[~found][0]} is not in the snapshot"
+            raise nx.NodeNotFound(msg)
+        return index
+
+
 def save_graph_xml(
     G: nx.MultiDiGraph,
     filepath: str | Path | None = None,
@@ -335,18 +725,17 @@ def _convert_node_attr_types(G: nx.MultiDiGraph, dtypes: dict[str, Any]) -> nx.M
     -------
     G
     """
-    for _, data in G.nodes(data=True):
-        # first, eval stringified lists, dicts, or sets to convert them to objects
-        # lists, dicts, or sets would be custom attribute types added by a user
-        for attr, value in data.items():
-            if (value.startswith("[") and value.endswith("]")) or (
-                value.startswith("{") and value.endswith("}")
-            ):
-                with contextlib.suppress(SyntaxError, ValueError):
-                    data[attr] = ast.literal_eval(value)
+    datas = [data for _, data in G.nodes(data=True)]
 
-        for attr in data.keys() & dtypes.keys():
-            data[attr] = dtypes[attr](data[attr])
+    # first, eval stringified lists, dicts, or sets to convert them to objects
+    # lists, dicts, or sets would be custom attribute types added by a user
+    _eval_containers(datas)
+
+    # then convert each attribute's values in bulk, one attribute at a time
+    for attr, dtype in dtypes.items():
+        has_attr = [data for data in datas if attr in data]
+        for data, value in zip(has_attr, map(dtype, [data[attr] for data in has_attr])):
+            data[attr] = value
     return G
 
 
@@ -365,37 +754,527 @@ def _convert_edge_attr_types(G: nx.MultiDiGraph, dtypes: dict[str, Any]) -> nx.M
     -------
     G
     """
-    # for each edge in the graph, eval attribute value lists and convert types
-    for _, _, data in G.edges(data=True, keys=False):
-        # remove extraneous "id" attribute added by graphml saving
+    datas = [data for _, _, data in G.edges(data=True, keys=False)]
+
+    # remove extraneous "id" attribute added by graphml saving
+    for data in datas:
         data.pop("id", None)
 
-        # first, eval stringified lists, dicts, or sets to convert them to objects
-        # edge attributes might have a single value, or a list if simplified
-        # dicts or sets would be custom attribute types added by a user
+    # first, eval stringified lists, dicts, or sets to convert them to objects
+    # edge attributes might have a single value, or a list if simplified
+    # dicts or sets would be custom attribute types added by a user
+    _eval_containers(datas)
+
+    # next, convert each attribute's values in bulk, one attribute at a time
+    for attr, dtype in dtypes.items():
+        has_attr = [data for data in datas if attr in data]
+        for data in has_attr:
+            value = data[attr]
+            # if it's a list, convert each item, otherwise the single value
+            data[attr] = (
+                [dtype(item) for item in value] if isinstance(value, list) else dtype(value)
+            )
+
+    # if "geometry" attr exists, convert the well-known text to LineStrings
+    # by parsing all of the edges' geometries in a single vectorized call
+    has_geom = [data for data in datas if "geometry" in data]
+    geoms = shapely.from_wkt([data["geometry"] for data in has_geom])
+    for data, geom in zip(has_geom, geoms):
+        data["geometry"] = geom
+
+    return G
+
+
+def _eval_containers(datas: list[dict[str, Any]]) -> None:
+    """
+    Evaluate stringified lists, dicts, or sets in attribute data dicts.
+
+    Values that fail to evaluate are left as strings. The dicts are modified
+    in place.
+
+    Parameters
+    ----------
+    datas
+        Attribute data dicts of the graph's nodes or edges.
+
+    Returns
+    -------
+    None
+    """
+    for data in datas:
         for attr, value in data.items():
-            if (value.startswith("[") and value.endswith("]")) or (
-                value.startswith("{") and value.endswith("}")
+            if isinstance(value, str) and (
+                (value.startswith("[") and value.endswith("]"))
+                or (value.startswith("{") and value.endswith("}"))
             ):
                 with contextlib.suppress(SyntaxError, ValueError):
                     data[attr] = ast.literal_eval(value)
 
-        # next, convert attribute value types if attribute appears in dtypes
-        for attr in data.keys() & dtypes.keys():
-            if isinstance(data[attr], list):
-                # if it's a list, eval it then convert each item
-                data[attr] = [dtypes[attr](item) for item in data[attr]]
-            else:
-                # otherwise, just convert the single value
-                data[attr] = dtypes[attr](data[attr])
 
-        # if "geometry" attr exists, convert its well-known text to LineString
-        if "geometry" in data:
-            data["geometry"] = wkt.loads(data["geometry"])
+def _attr_columns(datas: Iterable[dict[str, Any]]) -> dict[str, list[Any]]:
+    """
+    Pivot node or edge attribute data dicts into columns of values.
+
+    Parameters
+    ----------
+    datas
+        Attribute data dicts of the graph's nodes or edges.
+
+    Returns
+    -------
+    columns
+        Dict of attribute names:lists of values, with None for missing values.
+    """
+    datas = list(datas)
+    names = dict.fromkeys(chain.from_iterable(datas))
+    return {name: [data.get(name) for data in datas] for name in names}
+
+
+def _to_arrow_table(
+    columns: dict[str, list[Any]],
+    crs: Any,  # noqa: ANN401
+    meta: dict[str, Any],
+) -> pa.Table:
+    """
+    Convert columns of attribute values to a GeoParquet-compatible table.
+
+    Geometries are encoded as WKB. Columns mixing lists and scalars have their
+    scalars wrapped in single-element lists, and columns that pyarrow cannot
+    store natively are stringified. These are recorded in the "osmnx" table
+    metadata, along with `meta`, so they can be restored when loading.
+
+    Parameters
+    ----------
+    columns
+        Dict of column names:lists of values.
+    crs
+        The coordinate reference system of the geometries.
+    meta
+        Metadata to save in the table's "osmnx" metadata.
+
+    Returns
+    -------
+    table
+    """
+    arrays = {}
+    geo_columns = {}
+    wrapped_columns = []
+    string_columns = []
+    for name, values in columns.items():
+        first = next((value for value in values if value is not None), None)
+        if isinstance(first, shapely.Geometry):
+            # encode geometries as WKB for GeoParquet
+            wkb = shapely.to_wkb(np.array(values, dtype=object))
+            arrays[name] = pa.array(wkb, type=pa.binary())
+            crs_json = None if crs is None else pyproj.CRS(crs).to_json_dict()
+            geo_columns[name] = {"encoding": "WKB", "geometry_types": [], "crs": crs_json}
+        elif not any(isinstance(value, (dict, set, tuple)) for value in values):
+            try:
+                arrays[name] = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # wrap scalars in lists if column mixes lists and scalars
+                wrapped = [
+                    value if isinstance(value, (list, type(None))) else [value] for value in values
+                ]
+                with contextlib.suppress(pa.ArrowInvalid, pa.ArrowTypeError):
+                    arrays[name] = pa.array(wrapped)
+                    wrapped_columns.append(name)
+
+        # otherwise stringify the values if pyarrow cannot store them natively
+        if name not in arrays:
+            arrays[name] = pa.array([None if v is None else str(v) for v in values], pa.string())
+            string_columns.append(name)
+
+    meta = {**meta, "wrapped_columns": wrapped_columns, "string_columns": string_columns}
+    metadata = {"osmnx": json.dumps(meta)}
+    if len(geo_columns) > 0:
+        primary = "geometry" if "geometry" in geo_columns else next(iter(geo_columns))
+        geo = {"version": "1.0.0", "primary_column": primary, "columns": geo_columns}
+        metadata["geo"] = json.dumps(geo)
+    return pa.table(arrays, metadata=metadata)
+
+
+def _read_arrow_table(
+    filepath: Path,
+    columns: Iterable[str] | None,
+) -> tuple[dict[str, Any], list[list[Any]], list[dict[str, Any]]]:
+    """
+    Read a node or edge table saved by `_to_arrow_table` from disk.
+
+    Parameters
+    ----------
+    filepath
+        Path to the Parquet file.
+    columns
+        Names of the attribute columns to read. If None, read all of them
+        except any point geometries derived from nodes' coordinates.
+
+    Returns
+    -------
+    meta, ids, datas
+        The table's "osmnx" metadata, the ID columns' values, and the
+        attribute data dicts.
+    """
+    schema = pq.read_schema(filepath)
+    meta = json.loads(schema.metadata[b"osmnx"])
+    geo = schema.metadata.get(b"geo")
+    geo_columns = {} if geo is None else json.loads(geo)["columns"]
+    if columns is None:
+        derived = meta.get("derived_geometry", False)
+        columns = [c for c in schema.names if not (derived and c == "geometry")]
+    else:
+        columns = [*meta["index"], *columns]
+    table = pq.read_table(filepath, columns=columns)
+
+    # convert each column to a list of values, decoding or unwrapping them
+    ids = [table.column(name).to_pylist() for name in meta["index"]]
+    names = [name for name in table.column_names if name not in meta["index"]]
+    values = []
+    for name in names:
+        column = table.column(name).to_pylist()
+        if name in geo_columns:
+            column = shapely.from_wkb(column).tolist()
+        elif name in meta["wrapped_columns"]:
+            column = [v[0] if isinstance(v, list) and len(v) == 1 else v for v in column]
+        elif name in meta["string_columns"]:
+            column = [_eval_container(v) for v in column]
+        values.append(column)
+
+    # zip the columns into data dicts, then remove any null values from them
+    if len(names) == 0:
+        return meta, ids, [{} for _ in range(table.num_rows)]
+    datas = [dict(zip(names, row)) for row in zip(*values)]
+    for name, column in zip(names, values):
+        if table.column(name).null_count > 0:
+            for data, value in zip(datas, column):
+                if value is None:
+                    del data[name]
+    return meta, ids, datas
+
+
+def _eval_container(value: str | None) -> Any:  # noqa: ANN401
+    """
+    Evaluate a stringified list, dict, set, or tuple.
+
+    Unlike `_eval_containers`, this also evaluates tuples, because it is only
+    used on the columns that `_to_arrow_table` stringified, which may hold
+    them.
+
+    Parameters
+    ----------
+    value
+        The stringified value.
+
+    Returns
+    -------
+    value
+        The evaluated container, or the original value if it is not one.
+    """
+    if value is not None and (
+        (value.startswith("[") and value.endswith("]"))
+        or (value.startswith("{") and value.endswith("}"))
+        or (value.startswith("(") and value.endswith(")"))
+    ):
+        with contextlib.suppress(SyntaxError, ValueError):
+            return ast.literal_eval(value)
+    return value
+
+
+def _open_file(filepath: Path, mode: str) -> IO[bytes]:
+    """
+    Open a binary file, (de)compressing it if it has a compressed extension.
+
+    Files with ".gz" or ".gzip" extensions are gzip compressed and files with
+    a ".bz2" extension are bzip2 compressed, as networkx does for GraphML.
+
+    Parameters
+    ----------
+    filepath
+        Path to the file.
+    mode
+        Binary mode to open the file in, either "rb" or "wb".
+
+    Returns
+    -------
+    f
+    """
+    if filepath.suffix in {".gz", ".gzip"}:
+        return gzip.open(filepath, mode)  # type: ignore[return-value]
+    if filepath.suffix == ".bz2":
+        return bz2.open(filepath, mode)  # type: ignore[return-value]
+    return filepath.open(mode)
+
+
+def _write_graphml(
+    G: nx.MultiDiGraph | nx.MultiGraph,
+    f: IO[bytes],
+    *,
+    encoding: str,
+    gephi: bool,
+    chunk_size: int = 10_000,
+) -> None:
+    """
+    Stream-write a graph to a GraphML file with stringified attribute values.
+
+    Writes the graph's nodes and edges to the file incrementally in chunks,
+    rather than building an XML tree of the whole graph in memory, and never
+    copies the graph. Every attribute value is saved as a string: edge
+    geometries are converted to well-known text in bulk for each chunk.
+
+    Parameters
+    ----------
+    G
+        The graph to save.
+    f
+        Binary file object to write to.
+    encoding
+        The character encoding of the saved GraphML file.
+    gephi
+        If True, give each edge a unique key/id.
+    chunk_size
+        How many nodes or edges to serialize before writing to the file.
+
+    Returns
+    -------
+    None
+    """
 
+    def write(lines: list[str]) -> None:
+        f.write("".join(lines).encode(encoding, errors="xmlcharrefreplace"))
+
+    # assign each graph, node, and edge attribute name a GraphML key ID
+    attr_names = {
+        "graph": dict.fromkeys(G.graph),
+        "node": dict.fromkeys(chain.from_iterable(d for _, d in G.nodes(data=True))),
+        "edge": dict.fromkeys(chain.from_iterable(d for _, _, d in G.edges(data=True))),
+    }
+    key_ids: dict[tuple[str, Any], str] = {}
+    lines = [
+        f"<?xml version='1.0' encoding='{encoding}'?>\n",
+        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+        'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n',
+    ]
+    for element, names in attr_names.items():
+        for name in names:
+            key_id = f"d{len(key_ids)}"
+            key_ids[element, name] = key_id
+            lines.append(
+                f'<key id="{key_id}" for="{element}" '
+                f'attr.name={quoteattr(str(name))} attr.type="string"/>\n',
+            )
+
+    # gephi needs directed edges to interpret the unique edge keys as ids
+    edgedefault = "directed" if gephi or G.is_directed() else "undirected"
+    lines.append(f'<graph edgedefault="{edgedefault}">\n')
+    lines.extend(_graphml_data(G.graph, "graph", key_ids))
+    write(lines)
+
+    # write the nodes in chunks
+    for chunk in _chunks(G.nodes(data=True), chunk_size):
+        lines = []
+        for node, data in chunk:
+            lines.append(f"<node id={quoteattr(str(node))}>\n")
+            lines.extend(_graphml_data(data, "node", key_ids))
+            lines.append("</node>\n")
+        write(lines)
+
+    # write the edges in chunks, converting their geometries to WKT in bulk
+    edges: Iterable[tuple[Any, Any, Any, dict[str, Any]]] = G.edges(keys=True, data=True)
+    if gephi:
+        # for gephi compatibility, each edge's key must be unique as an id
+        edges = ((u, v, k, d) for k, (u, v, _, d) in enumerate(edges))
+    for chunk in _chunks(edges, chunk_size):
+        geoms = [d.get("geometry") for _, _, _, d in chunk]
+        is_geom = [isinstance(geom, shapely.Geometry) for geom in geoms]
+        wkts = iter(shapely.to_wkt(list(compress(geoms, is_geom)), rounding_precision=-1).tolist())
+        lines = []
+        for (u, v, k, data), has_geom in zip(chunk, is_geom):
+            lines.append(
+                f"<edge source={quoteattr(str(u))} target={quoteattr(str(v))} "
+                f"id={quoteattr(str(k))}>\n",
+            )
+            if has_geom:
+                data = {**data, "geometry": next(wkts)}  # noqa: PLW2901
+            lines.extend(_graphml_data(data, "edge", key_ids))
+            lines.append("</edge>\n")
+        write(lines)
+
+    write(["</graph>\n", "</graphml>\n"])
+
+
+def _graphml_data(
+    data: dict[str, Any],
+    element: str,
+    key_ids: dict[tuple[str, str], str],
+) -> list[str]:
+    """
+    Serialize an attribute data dict as GraphML data element lines.
+
+    Parameters
+    ----------
+    data
+        The attribute data dict.
+    element
+        Type of element the data belong to: "graph", "node", or "edge".
+    key_ids
+        Dict of (element, attribute name):GraphML key ID.
+
+    Returns
+    -------
+    lines
+    """
+    return [
+        f'  <data key="{key_ids[element, attr]}">{escape(str(value))}</data>\n'
+        for attr, value in data.items()
+    ]
+
+
+def _chunks(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """
+    Yield successive chunks of an iterable as lists.
+
+    Parameters
+    ----------
+    iterable
+        The iterable to chunk.
+    size
+        Number of items in each chunk (except possibly the last).
+
+    Yields
+    ------
+    chunk
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _parse_graphml(source: IO[Any], node_type: Any) -> nx.MultiDiGraph | nx.MultiGraph:  # noqa: ANN401
+    """
+    Stream-parse a GraphML document into a graph.
+
+    Produces the same graph as `nx.read_graphml(..., force_multigraph=True)`
+    for GraphML files saved by `save_graphml`, but parses the XML
+    incrementally and discards each node and edge element once it has been
+    read, rather than building the whole document tree in memory first. Only
+    the first graph in the document is parsed, and yFiles extensions are not
+    supported.
+
+    Parameters
+    ----------
+    source
+        File object to parse the GraphML document from.
+    node_type
+        Type to convert node IDs to.
+
+    Returns
+    -------
+    G
+        MultiDiGraph if the graph's edges default to directed, otherwise
+        MultiGraph.
+    """
+    ns = "{http://graphml.graphdrawing.org/xmlns}"
+    data_tag, edge_tag, graph_tag, key_tag, node_tag = (
+        f"{ns}{tag}" for tag in ("data", "edge", "graph", "key", "node")
+    )
+    python_types = {
+        "boolean": bool,
+        "double": float,
+        "float": float,
+        "int": int,
+        "integer": int,
+        "long": int,
+        "string": str,
+    }
+    keys: dict[str, tuple[str, Any]] = {}
+    graph_data: dict[str, Any] = {}
+    nodes: list[tuple[Any, dict[str, Any]]] = []
+    edges: list[tuple[Any, Any, Any, dict[str, Any]]] = []
+    directed = False
+    graph_element: ElementTree.Element | None = None
+    depth = 0
+
+    for event, element in ElementTree.iterparse(source, events=("start", "end")):  # noqa: S314
+        tag = element.tag
+        if event == "start":
+            # track nesting depth to tell graph-level data from node/edge data
+            depth += 1
+            if tag == graph_tag:
+                if graph_element is not None:
+                    # only parse the first graph in the document
+                    break
+                graph_element = element
+                directed = element.get("edgedefault") == "directed"
+            continue
+
+        depth -= 1
+        if tag == data_tag:
+            # node and edge data get decoded when their parent element ends
+            if depth == 2:  # noqa: PLR2004
+                graph_data.update((_decode_graphml_data(element, keys),))
+        elif tag == node_tag:
+            data = dict(_decode_graphml_data(child, keys) for child in element)
+            nodes.append((node_type(element.get("id")), data))
+            graph_element.clear()  # type: ignore[union-attr]
+        elif tag == edge_tag:
+            data = dict(_decode_graphml_data(child, keys) for child in element)
+            edge_id = element.get("id")
+            if edge_id:
+                with contextlib.suppress(ValueError):
+                    edge_id = int(edge_id)
+            else:
+                edge_id = data.get("key")
+            u = node_type(element.get("source"))
+            v = node_type(element.get("target"))
+            edges.append((u, v, edge_id, data))
+            graph_element.clear()  # type: ignore[union-attr]
+        elif tag == key_tag:
+            python_type = python_types[element.get("attr.type", "string")]
+            keys[element.get("id")] = (element.get("attr.name"), python_type)
+
+    G: nx.MultiDiGraph | nx.MultiGraph = nx.MultiDiGraph() if directed else nx.MultiGraph()
+    G.add_nodes_from(nodes)
+    G.add_edges_from(edges)
+    G.graph.update(graph_data)
     return G
 
 
+def _decode_graphml_data(
+    element: ElementTree.Element,
+    keys: dict[str, tuple[str, Any]],
+) -> tuple[str, Any]:
+    """
+    Decode a GraphML data element's attribute name and typed value.
+
+    Parameters
+    ----------
+    element
+        The GraphML data element.
+    keys
+        Dict of GraphML key IDs:(attribute name, attribute python type).
+
+    Returns
+    -------
+    name, value
+    """
+    key = element.get("key")
+    if key not in keys:
+        msg = f"Bad GraphML data: no key {key}"
+        raise nx.NetworkXError(msg)
+    name, python_type = keys[key]
+    text = element.text
+    if text is None:
+        return name, ""
+    if python_type is str:
+        return name, text
+    if python_type is bool:
+        # case-insensitive like java's Boolean.parseBoolean, as networkx does
+        return name, {"true": True, "false": False, "1": True, "0": False}[text.lower()]
+    return name, python_type(text)
+
+
 def _convert_bool_string(value: bool | str) -> bool:
     """
     Convert a "True" or "False" string literal to corresponding boolean type.
@@ -427,6 +1306,67 @@ def _convert_bool_string(value: bool | str) -> bool:
     raise ValueError(msg)
 
 
+def _select_cols(gdf: gpd.GeoDataFrame, attrs: Iterable[str] | None) -> gpd.GeoDataFrame:
+    """
+    Select a GeoDataFrame's geometry column and any of the attribute columns.
+
+    Parameters
+    ----------
+    gdf
+        GeoDataFrame to select columns from.
+    attrs
+        Names of the attribute columns to select. If None, select all columns.
+
+    Returns
+    -------
+    gdf
+    """
+    if attrs is None:
+        return gdf
+    attrs = set(attrs)
+    return gdf.drop(columns=[c for c in gdf.columns if c not in attrs and c != gdf.geometry.name])
+
+
+def _write_gpkg_layer(
+    gdf: gpd.GeoDataFrame,
+    filepath: Path,
+    layer: str,
+    encoding: str,
+) -> None:
+    """
+    Stringify non-numeric columns then write GeoDataFrame as GeoPackage layer.
+
+    Parameters
+    ----------
+    gdf
+        GeoDataFrame to write.
+    filepath
+        Path to the GeoPackage file.
+    layer
+        Name of the layer to write.
+    encoding
+        The character encoding of the GeoPackage file.
+
+    Returns
+    -------
+    None
+    """
+    kwargs: dict[str, Any] = {}
+    if pyogrio is not None:
+        kwargs["engine"] = "pyogrio"
+        pyogrio_version = tuple(int(v) for v in pyogrio.__version__.split(".")[:2])
+        # pyogrio can only write with arrow if the file is encoded as UTF-8
+        if (
+            pa is not None
+            and pyogrio_version >= (0, 8)
+            and pyogrio.__gdal_version__ >= (3, 8)
+            and encoding.lower() in {"utf-8", "utf8"}
+        ):
+            kwargs["use_arrow"] = True
+    gdf = _stringify_nonnumeric_cols(gdf)
+    gdf.to_file(filepath, layer=layer, driver="GPKG", index=True, encoding=encoding, **kwargs)
+
+
 def _stringify_nonnumeric_cols(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
     Make every non-numeric GeoDataFrame column (besides geometry) a string.
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging as lg
+import math
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 
 import geopandas as gpd
+import numpy as np
+import pyproj
+import shapely
 
-from . import convert
 from . import settings
 from . import utils
 
@@ -33,7 +37,7 @@ def is_projected(crs: Any) -> bool:  # noqa: ANN401
     projected
         True if `crs` is projected, otherwise False
     """
-    return bool(gpd.GeoSeries(crs=crs).crs.is_projected)
+    return bool(_get_crs(crs).is_projected)
 
 
 def project_geometry(
@@ -117,7 +121,7 @@ def project_gdf(
 
     # else if to_crs is None, project gdf to an appropriate UTM zone
     elif to_crs is None:
-        to_crs = gdf.estimate_utm_crs()
+        to_crs = _estimate_utm_crs(gdf.crs, gdf.total_bounds)
 
     # project the gdf
     gdf_proj = gdf.to_crs(to_crs)
@@ -160,31 +164,172 @@ def project_graph(
     if to_latlong:
         to_crs = settings.default_crs
 
-    # STEP 1: PROJECT THE NODES
-    gdf_nodes = convert.graph_to_gdfs(G, edges=False)
+    if len(G) == 0:  # pragma: no cover
+        msg = "Graph contains no nodes."
+        raise ValueError(msg)
 
-    # project the nodes GeoDataFrame and extract the projected x/y values
-    gdf_nodes_proj = project_gdf(gdf_nodes, to_crs=to_crs)
-    gdf_nodes_proj["x"] = gdf_nodes_proj["geometry"].x
-    gdf_nodes_proj["y"] = gdf_nodes_proj["geometry"].y
-    to_crs = gdf_nodes_proj.crs
+    # STEP 1: PROJECT THE NODES
+    # extract the node x/y coordinates into arrays to project them all at
+    # once with a (cached) transformer, without creating node Point objects
+    crs = _get_crs(G.graph["crs"])
+    x = np.array([x for _, x in G.nodes(data="x")], dtype=float)
+    y = np.array([y for _, y in G.nodes(data="y")], dtype=float)
+    if to_crs is None:
+        to_crs = _estimate_utm_crs(crs, (x.min(), y.min(), x.max(), y.max()))
+    to_crs = _get_crs(to_crs)
+    transformer = _get_transformer(crs, to_crs)
+    x_proj, y_proj = transformer.transform(x, y)
+
+    # copy the graph and update the copy's node and edge attributes directly,
+    # rather than rebuilding a new graph from node/edge GeoDataFrames
+    G_proj = G.copy()
+    for (_, data), x_node, y_node in zip(G_proj.nodes(data=True), x_proj, y_proj):
+        data["x"] = x_node
+        data["y"] = y_node
 
     # STEP 2: PROJECT THE EDGES
-    if G.graph.get("simplified"):
-        # if graph has previously been simplified, project the edge geometries
-        gdf_edges = convert.graph_to_gdfs(G, nodes=False, fill_edge_geometry=False)
-        gdf_edges_proj = project_gdf(gdf_edges, to_crs=to_crs)
-    else:
-        # if not, you don't have to project these edges because the nodes
-        # contain all the spatial data in the graph (unsimplified edges have
-        # no geometry attributes)
-        gdf_edges_proj = convert.graph_to_gdfs(G, nodes=False, fill_edge_geometry=False)
-
-    # STEP 3: REBUILD GRAPH
-    # turn projected node/edge gdfs into a graph and update its CRS attribute
-    G_proj = convert.graph_from_gdfs(gdf_nodes_proj, gdf_edges_proj, graph_attrs=G.graph)
+    # unsimplified edges have no geometry attributes because the nodes contain
+    # all the spatial data in the graph. but if graph has previously been
+    # simplified, project all the edge geometries' coordinates at once
+    edges_data = [d for _, _, d in G_proj.edges(data=True) if "geometry" in d]
+    if len(edges_data) > 0:
+        geoms = shapely.transform(
+            [d["geometry"] for d in edges_data],
+            lambda xy: np.column_stack(transformer.transform(xy[:, 0], xy[:, 1])),
+        )
+        for data, geom in zip(edges_data, geoms):
+            data["geometry"] = geom
+
     G_proj.graph["crs"] = to_crs
 
     msg = f"Projected graph with {len(G)} nodes and {len(G.edges)} edges"
     utils.log(msg, level=lg.INFO)
     return G_proj
+
+
+def _get_crs(crs: Any) -> pyproj.CRS:  # noqa: ANN401
+    """
+    Return a CRS object, reusing a cached one if `crs` was seen before.
+
+    Parameters
+    ----------
+    crs
+        Anything accepted by `pyproj.CRS.from_user_input()`.
+
+    Returns
+    -------
+    crs
+    """
+    if isinstance(crs, pyproj.CRS):
+        return crs
+    try:
+        return _get_crs_cached(crs)
+    except TypeError:  # pragma: no cover
+        # crs is unhashable (such as a dict of PROJ parameters) so can't cache
+        return pyproj.CRS.from_user_input(crs)
+
+
+@lru_cache(maxsize=128)
+def _get_crs_cached(crs: Any) -> pyproj.CRS:  # noqa: ANN401
+    """
+    Parse a hashable CRS identifier into a cached CRS object.
+
+    Parameters
+    ----------
+    crs
+        Anything hashable accepted by `pyproj.CRS.from_user_input()`.
+
+    Returns
+    -------
+    crs
+    """
+    return pyproj.CRS.from_user_input(crs)
+
+
+@lru_cache(maxsize=128)
+def _get_transformer(crs: pyproj.CRS, to_crs: pyproj.CRS) -> pyproj.Transformer:
+    """
+    Return a cached transformer from one CRS to another.
+
+    Transformers are keyed by their (source, target) CRS pair so that
+    projecting many graphs between the same CRSs only builds one of them.
+    They always use x/y (lon/lat) axis order.
+
+    Parameters
+    ----------
+    crs
+        The CRS to transform from.
+    to_crs
+        The CRS to transform to.
+
+    Returns
+    -------
+    transformer
+    """
+    return pyproj.Transformer.from_crs(crs, to_crs, always_xy=True)
+
+
+@lru_cache(maxsize=128)
+def _get_utm_crs(zone: int, *, south: bool) -> pyproj.CRS:
+    """
+    Return a cached WGS 84 UTM zone CRS.
+
+    Parameters
+    ----------
+    zone
+        The UTM zone number, from 1 to 60.
+    south
+        If True, return the zone's southern hemisphere CRS, otherwise its
+        northern hemisphere CRS.
+
+    Returns
+    -------
+    crs
+    """
+    return pyproj.CRS.from_epsg((32700 if south else 32600) + zone)
+
+
+def _estimate_utm_crs(
+    crs: Any,  # noqa: ANN401
+    bounds: tuple[float, float, float, float] | np.typing.NDArray[np.float64],
+) -> pyproj.CRS:
+    """
+    Estimate the WGS 84 UTM zone CRS of some bounds' center.
+
+    This matches GeoPandas's `estimate_utm_crs`, but calculates the UTM zone
+    number from the center's coordinates directly instead of querying the
+    PROJ database, which is slow relative to projecting a small graph.
+
+    Parameters
+    ----------
+    crs
+        The CRS of `bounds`.
+    bounds
+        The `(minx, miny, maxx, maxy)` bounds to find the UTM zone of.
+
+    Returns
+    -------
+    utm_crs
+    """
+    crs = _get_crs(crs)
+    minx, miny, maxx, maxy = bounds
+
+    # ensure using geographic coordinates
+    if not crs.is_geographic:
+        transformer = _get_transformer(crs, _get_crs("epsg:4326"))
+        minx, miny, maxx, maxy = transformer.transform_bounds(minx, miny, maxx, maxy)
+    x_center = (minx + maxx) / 2
+    y_center = (miny + maxy) / 2
+
+    # if bounds cross the antimeridian, shift maxx by 360 degrees to find the
+    # center, then shift the center back into the -180 to +180 range
+    if minx > maxx:
+        x_center = ((x_center + 360) % 360) - 180
+
+    # UTM zones are 6 degrees wide from the antimeridian, and only span 80S
+    # to 84N. points on a boundary between two zones belong to the lower one
+    if not -80 <= y_center <= 84:  # noqa: PLR2004
+        msg = "Unable to determine UTM CRS"
+        raise RuntimeError(msg)
+    zone = max(1, math.ceil((x_center + 180) / 6))
+    return _get_utm_crs(zone, south=bool(y_center < 0))
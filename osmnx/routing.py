@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import itertools
 import logging as lg
 import multiprocessing as mp
@@ -19,6 +20,7 @@ import numpy as np
 import pandas as pd
 
 from . import convert
+from . import io
 from . import utils
 
 if TYPE_CHECKING:
@@ -207,96 +209,107 @@ def route_to_gdf(
 # orig/dest int, weight present, cpus present
 @overload
 def shortest_path(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     orig: int,
     dest: int,
     *,
     weight: str,
     cpus: int | None,
+    method: str = ...,
 ) -> list[int] | None: ...
 
 
 # orig/dest int, weight missing, cpus present
 @overload
 def shortest_path(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     orig: int,
     dest: int,
     *,
     cpus: int | None,
+    method: str = ...,
 ) -> list[int] | None: ...
 
 
 # orig/dest int, weight present, cpus missing
 @overload
 def shortest_path(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     orig: int,
     dest: int,
     *,
     weight: str,
+    method: str = ...,
 ) -> list[int] | None: ...
 
 
 # orig/dest int, weight missing, cpus missing
 @overload
 def shortest_path(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     orig: int,
     dest: int,
+    *,
+    method: str = ...,
 ) -> list[int] | None: ...
 
 
 # orig/dest Iterable, weight present, cpus present
 @overload
 def shortest_path(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     orig: Iterable[int],
     dest: Iterable[int],
     *,
     weight: str,
     cpus: int | None,
+    method: str = ...,
 ) -> list[list[int] | None]: ...
 
 
 # orig/dest Iterable, weight missing, cpus present
 @overload
 def shortest_path(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     orig: Iterable[int],
     dest: Iterable[int],
     *,
     cpus: int | None,
+    method: str = ...,
 ) -> list[list[int] | None]: ...
 
 
 # orig/dest Iterable, weight present, cpus missing
 @overload
 def shortest_path(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     orig: Iterable[int],
     dest: Iterable[int],
     *,
     weight: str,
+    method: str = ...,
 ) -> list[list[int] | None]: ...
 
 
 # orig/dest Iterable, weight missing, cpus missing
 @overload
 def shortest_path(
-    G: nx.MultiDiGraph,
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     orig: Iterable[int],
     dest: Iterable[int],
+    *,
+    method: str = ...,
 ) -> list[list[int] | None]: ...
 
 
-def shortest_path(
-    G: nx.MultiDiGraph,
+def shortest_path(  # noqa: PLR0912
+    G: nx.MultiDiGraph | io.GraphSnapshot,
     orig: int | Iterable[int],
     dest: int | Iterable[int],
     *,
     weight: str = "length",
     cpus: int | None = 1,
+    method: str = "dijkstra",
 ) -> list[int] | None | list[list[int] | None]:
     """
     Solve shortest path from origin node(s) to destination node(s).
@@ -306,8 +319,24 @@ def shortest_path(
     them. If `orig` and `dest` are lists of node IDs, this will return a list
     of lists of the nodes constituting the shortest path between each
     origin-destination pair. If a path cannot be solved, this will return None
-    for that path. You can parallelize solving multiple paths with the `cpus`
-    parameter, but be careful to not exceed your available RAM.
+    for that path. Pairs that share the same origin are solved together from
+    a single shortest path tree grown from that origin. You can parallelize
+    solving multiple paths with the `cpus` parameter, but be careful to not
+    exceed your available RAM.
+
+    With `method="bidirectional"`, each path is instead solved by a
+    bidirectional Dijkstra search, which settles far fewer nodes than a
+    unidirectional search on long routes. It runs on a simple DiGraph view of
+    `G` that keeps only the minimum `weight` value among parallel edges. This
+    view is built once per call and shared by all of the call's paths, so
+    solve many paths in one call rather than one path per call.
+
+    If `G` is a `GraphSnapshot` from `io.load_graph_snapshot`, each origin's
+    paths are instead solved by Dijkstra's algorithm directly on the
+    snapshot's memory-mapped arrays, regardless of `method`. In this case,
+    `weight` must be one of the snapshot's saved weights, and any missing
+    weight values are treated as 1. Snapshots are passed to parallel worker
+    processes by filepath, so every worker shares the same mapped pages.
 
     See also `k_shortest_paths` to solve multiple shortest paths between a
     single origin and destination. For additional functionality or different
@@ -316,7 +345,7 @@ def shortest_path(
     Parameters
     ----------
     G
-        Input graph,
+        Input graph or graph snapshot.
     orig
         Origin node ID(s).
     dest
@@ -325,6 +354,11 @@ def shortest_path(
         Edge attribute to minimize when solving shortest path.
     cpus
         How many CPU cores to use. If None, use all available.
+    method
+        {"dijkstra", "bidirectional"}
+        Which search to use: Dijkstra's algorithm on `G` (grouping pairs by
+        origin), or bidirectional Dijkstra on a min-weight DiGraph view of
+        `G`.
 
     Returns
     -------
@@ -332,10 +366,19 @@ def shortest_path(
         The node IDs constituting the shortest path, or, if `orig` and `dest`
         are both iterable, then a list of such paths.
     """
+    if method not in {"dijkstra", "bidirectional"}:
+        msg = f"Invalid shortest path method {method!r}."
+        raise ValueError(msg)
+
     _verify_edge_attribute(G, weight)
 
     # if neither orig nor dest is iterable, just return the shortest path
     if not (isinstance(orig, Iterable) or isinstance(dest, Iterable)):
+        if isinstance(G, io.GraphSnapshot):
+            return _snapshot_shortest_paths(G, orig, [dest], weight)[0]
+        if method == "bidirectional":
+            D = _min_weight_digraph(G, weight)
+            return _bidirectional_shortest_paths(D, orig, [dest], weight)[0]
         return _single_shortest_path(G, orig, dest, weight)
 
     # if only 1 of orig or dest is iterable and the other is not, raise error
@@ -359,15 +402,40 @@ def shortest_path(
     msg = f"Solving {len(orig)} paths with {cpus} CPUs..."
     utils.log(msg, level=lg.INFO)
 
-    # if single-threading, calculate each shortest path one at a time
+    # group the pairs by origin so each distinct origin's destinations can be
+    # solved together rather than one search per pair
+    groups: dict[int, list[int]] = {}
+    for i, o in enumerate(orig):
+        groups.setdefault(o, []).append(i)
+    group_dests = [[dest[i] for i in idxs] for idxs in groups.values()]
+
+    # dijkstra grows one shortest path tree per origin on G itself (or on the
+    # snapshot's arrays), whereas bidirectional searches each pair on the
+    # min-weight DiGraph view
+    solver: Callable[..., list[list[int] | None]]
+    graph: nx.MultiDiGraph | nx.DiGraph | io.GraphSnapshot
+    if isinstance(G, io.GraphSnapshot):
+        solver, graph = _snapshot_shortest_paths, G
+    elif method == "bidirectional":
+        solver, graph = _bidirectional_shortest_paths, _min_weight_digraph(G, weight)
+    else:
+        solver, graph = _single_source_shortest_paths, G
+
+    # if single-threading, calculate each origin's shortest paths one at a time
     if cpus == 1:
-        paths = [_single_shortest_path(G, o, d, weight) for o, d in zip(orig, dest)]
+        results = [solver(graph, o, ds, weight) for o, ds in zip(groups, group_dests)]
 
-    # if multi-threading, calculate shortest paths in parallel
+    # if multi-threading, calculate origins' shortest paths in parallel
     else:
-        args = ((G, o, d, weight) for o, d in zip(orig, dest))
+        args = ((graph, o, ds, weight) for o, ds in zip(groups, group_dests))
         with mp.get_context("spawn").Pool(cpus) as pool:
-            paths = pool.starmap_async(_single_shortest_path, args).get()
+            results = pool.starmap_async(solver, args).get()
+
+    # put each solved path back into the position of its original pair
+    paths: list[list[int] | None] = [None] * len(orig)
+    for idxs, group_paths in zip(groups.values(), results):
+        for i, path in zip(idxs, group_paths):
+            paths[i] = path
 
     return paths
 
@@ -451,17 +519,243 @@ def _single_shortest_path(
         return None
 
 
-def _verify_edge_attribute(G: nx.MultiDiGraph, attr: str) -> None:
+def _min_weight_digraph(G: nx.MultiDiGraph, weight: str) -> nx.DiGraph:
+    """
+    Build a simple DiGraph view of `G` for shortest path solving.
+
+    The view contains every node of `G` and one edge per `(u, v)` pair, whose
+    only attribute is the minimum `weight` value among the parallel edges
+    from `u` to `v` (treating missing values as 1). Resolving parallel edges
+    once here means the search does not have to take a minimum inside each
+    edge relaxation.
+
+    Parameters
+    ----------
+    G
+        Input graph.
+    weight
+        Edge attribute to minimize when choosing between parallel edges.
+
+    Returns
+    -------
+    D
+    """
+    D = nx.DiGraph()
+    D.add_nodes_from(G)
+    D.add_weighted_edges_from(
+        (
+            (u, v, min(data.get(weight, 1) for data in keyed_data.values()))
+            for u, nbrs in G.succ.items()
+            for v, keyed_data in nbrs.items()
+        ),
+        weight=weight,
+    )
+
+    msg = f"Built min-weight DiGraph view of graph by {weight!r}"
+    utils.log(msg, level=lg.INFO)
+    return D
+
+
+def _bidirectional_shortest_paths(
+    D: nx.DiGraph,
+    orig: int,
+    dests: list[int],
+    weight: str,
+) -> list[list[int] | None]:
+    """
+    Solve the shortest paths from an origin node to destination node(s).
+
+    This function solves each path with a bidirectional Dijkstra search on a
+    min-weight DiGraph view from `_min_weight_digraph`. If a path is
+    unsolvable, its entry is None.
+
+    Parameters
+    ----------
+    D
+        Min-weight DiGraph view of the input graph.
+    orig
+        Origin node ID.
+    dests
+        Destination node IDs.
+    weight
+        Edge attribute to minimize when solving shortest paths.
+
+    Returns
+    -------
+    paths
+        The node IDs constituting each shortest path, in the order of `dests`.
+    """
+    paths: list[list[int] | None] = []
+    for dest in dests:
+        try:
+            _, path = nx.bidirectional_dijkstra(D, orig, dest, weight=weight)
+            paths.append(list(path))
+        except nx.exception.NetworkXNoPath:  # noqa: PERF203  # pragma: no cover
+            msg = f"Cannot solve path from {orig} to {dest}"
+            utils.log(msg, level=lg.WARNING)
+            paths.append(None)
+    return paths
+
+
+def _single_source_shortest_paths(
+    G: nx.MultiDiGraph,
+    orig: int,
+    dests: list[int],
+    weight: str,
+) -> list[list[int] | None]:
+    """
+    Solve the shortest paths from an origin node to many destination nodes.
+
+    This function uses Dijkstra's algorithm to grow one shortest path tree
+    from the origin, stopping as soon as every destination has been settled.
+    Like `networkx.shortest_path`, it resolves parallel edges by their minimum
+    `weight` value, treating missing values as 1. If a path is unsolvable,
+    its entry is None.
+
+    Parameters
+    ----------
+    G
+        Input graph.
+    orig
+        Origin node ID.
+    dests
+        Destination node IDs.
+    weight
+        Edge attribute to minimize when solving shortest paths.
+
+    Returns
+    -------
+    paths
+        The node IDs constituting each shortest path, in the order of `dests`.
+    """
+    for node in (orig, *dests):
+        if node not in G:
+            msg = f"Node {node} is not in G"
+            raise nx.NodeNotFound(msg)
+
+    # settled distances, tentative distances, and shortest path tree parents
+    dist: dict[int, float] = {}
+    seen: dict[int, float] = {orig: 0}
+    pred: dict[int, int] = {}
+    unsettled = set(dests)
+    counter = itertools.count()
+    fringe: list[tuple[float, int, int]] = [(0, next(counter), orig)]
+
+    while fringe and unsettled:
+        d, _, v = heapq.heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = d
+        unsettled.discard(v)
+        for u, keyed_data in G.succ[v].items():
+            vu_dist = d + min(data.get(weight, 1) for data in keyed_data.values())
+            if u not in dist and (u not in seen or vu_dist < seen[u]):
+                seen[u] = vu_dist
+                heapq.heappush(fringe, (vu_dist, next(counter), u))
+                pred[u] = v
+
+    # walk back up the tree from each destination to reconstruct its path
+    paths: list[list[int] | None] = []
+    for dest in dests:
+        if dest not in dist:  # pragma: no cover
+            msg = f"Cannot solve path from {orig} to {dest}"
+            utils.log(msg, level=lg.WARNING)
+            paths.append(None)
+            continue
+        path = [dest]
+        while path[-1] != orig:
+            path.append(pred[path[-1]])
+        path.reverse()
+        paths.append(path)
+
+    return paths
+
+
+def _snapshot_shortest_paths(
+    S: io.GraphSnapshot,
+    orig: int,
+    dests: list[int],
+    weight: str,
+) -> list[list[int] | None]:
+    """
+    Solve the shortest paths from an origin node to many destination nodes.
+
+    This function works like `_single_source_shortest_paths` but grows the
+    shortest path tree directly on a graph snapshot's CSR arrays, relaxing
+    each parallel edge separately and treating missing (NaN) `weight` values
+    as 1. If a path is unsolvable, its entry is None.
+
+    Parameters
+    ----------
+    S
+        Input graph snapshot.
+    orig
+        Origin node ID.
+    dests
+        Destination node IDs.
+    weight
+        Edge weight to minimize when solving shortest paths.
+
+    Returns
+    -------
+    paths
+        The node IDs constituting each shortest path, in the order of `dests`.
+    """
+    source, *targets = S.node_index([orig, *dests]).tolist()
+    offsets, nbrs, weights = S.offsets, S.targets, S.weights[weight]
+
+    # settled distances, tentative distances, and shortest path tree parents
+    dist: dict[int, float] = {}
+    seen: dict[int, float] = {source: 0}
+    pred: dict[int, int] = {}
+    unsettled = set(targets)
+    counter = itertools.count()
+    fringe: list[tuple[float, int, int]] = [(0, next(counter), source)]
+
+    while fringe and unsettled:
+        d, _, v = heapq.heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = d
+        unsettled.discard(v)
+        start, end = offsets[v : v + 2].tolist()
+        for u, w in zip(nbrs[start:end].tolist(), weights[start:end].tolist()):
+            vu_dist = d + (1 if w != w else w)  # noqa: PLR0124
+            if u not in dist and (u not in seen or vu_dist < seen[u]):
+                seen[u] = vu_dist
+                heapq.heappush(fringe, (vu_dist, next(counter), u))
+                pred[u] = v
+
+    # walk back up the tree from each destination to reconstruct its path
+    paths: list[list[int] | None] = []
+    for dest, target in zip(dests, targets):
+        if target not in dist:  # pragma: no cover
+            msg = f"Cannot solve path from {orig} to {dest}"
+            utils.log(msg, level=lg.WARNING)
+            paths.append(None)
+            continue
+        path = [target]
+        while path[-1] != source:
+            path.append(pred[path[-1]])
+        path.reverse()
+        paths.append(S.osmid[path].tolist())
+
+    return paths
+
+
+def _verify_edge_attribute(G: nx.MultiDiGraph | io.GraphSnapshot, attr: str) -> None:
     """
     Verify attribute values are numeric and non-null across graph edges.
 
     Raises a ValueError if this attribute contains non-numeric values, and
     issues a UserWarning if this attribute is missing or null on any edges.
+    If `G` is a graph snapshot, only verify that it saved this attribute's
+    values, raising a ValueError if not.
 
     Parameters
     ----------
     G
-        Input graph.
+        Input graph or graph snapshot.
     attr
         Name of the edge attribute to verify.
 
@@ -469,6 +763,12 @@ def _verify_edge_attribute(G: nx.MultiDiGraph, attr: str) -> None:
     -------
     None
     """
+    if isinstance(G, io.GraphSnapshot):
+        if attr not in G.weights:
+            msg = f"The snapshot has no saved edge attribute {attr!r}."
+            raise ValueError(msg)
+        return
+
     try:
         values_float = (np.array(tuple(G.edges(data=attr)))[:, 2]).astype(float)
         if np.isnan(values_float).any():
@@ -13,17 +13,22 @@ You can use NetworkX directly for additional topological network measures.
 
 from __future__ import annotations
 
+import json
 import logging as lg
-from collections import Counter
-from itertools import chain
+import multiprocessing as mp
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 
 import networkx as nx
 import numpy as np
+import numpy.typing as npt
+import pandas as pd
 
+from . import bearing
 from . import convert
 from . import distance
+from . import io
 from . import projection
 from . import simplification
 from . import utils
@@ -31,6 +36,24 @@ from . import utils
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+# the basic_stats measures that don't need the graph's area to calculate
+_BASIC_STATS_MEASURES = (
+    "n",
+    "m",
+    "k_avg",
+    "edge_length_total",
+    "edge_length_avg",
+    "streets_per_node_avg",
+    "streets_per_node_counts",
+    "streets_per_node_proportions",
+    "intersection_count",
+    "street_length_total",
+    "street_segment_count",
+    "street_length_avg",
+    "circuity_avg",
+    "self_loop_proportion",
+)
+
 
 def streets_per_node(G: nx.MultiDiGraph) -> dict[int, int]:
     """
@@ -222,7 +245,7 @@ def self_loop_proportion(Gu: nx.MultiGraph) -> float:
     return float(sum(u == v for u, v, k in Gu.edges) / len(Gu.edges))
 
 
-def circuity_avg(Gu: nx.MultiGraph) -> float | None:
+def circuity_avg(Gu: nx.MultiGraph, *, sl_dist_attr: str | None = None) -> float | None:
     """
     Calculate average street circuity using edges of undirected graph.
 
@@ -235,6 +258,12 @@ def circuity_avg(Gu: nx.MultiGraph) -> float | None:
     ----------
     Gu
         Undirected input graph.
+    sl_dist_attr
+        If not None, cache each edge's straight-line distance as an edge
+        attribute with this name, for reuse by later measures. If every edge
+        already has this attribute, its values are used instead of
+        recalculating the distances (so recalculate them if you have changed
+        the nodes' coordinates since).
 
     Returns
     -------
@@ -245,25 +274,113 @@ def circuity_avg(Gu: nx.MultiGraph) -> float | None:
         msg = "`Gu` must be undirected."
         raise ValueError(msg)
 
-    # extract the edges' endpoint nodes' coordinates
-    n = Gu.nodes
-    coords = np.array([(n[u]["y"], n[u]["x"], n[v]["y"], n[v]["x"]) for u, v, _ in Gu.edges])
-    y1 = coords[:, 0]
-    x1 = coords[:, 1]
-    y2 = coords[:, 2]
-    x2 = coords[:, 3]
-
-    # calculate straight-line distances as euclidean distances if projected or
-    # great-circle distances if unprojected
-    if projection.is_projected(Gu.graph["crs"]):
-        sl_dists = distance.euclidean(y1=y1, x1=x1, y2=y2, x2=x2)
+    u, v, lengths, xy, edge_data = _edge_arrays(Gu)
+    if sl_dist_attr is not None and all(sl_dist_attr in d for d in edge_data):
+        sl_dists = np.array([d[sl_dist_attr] for d in edge_data], dtype=float)
     else:
-        sl_dists = distance.great_circle(lat1=y1, lon1=x1, lat2=y2, lon2=x2)
+        sl_dists = _straight_line_dists(xy, u, v, Gu.graph["crs"])
+        if sl_dist_attr is not None:
+            for d, sl_dist in zip(edge_data, sl_dists.tolist()):
+                d[sl_dist_attr] = sl_dist
+
+    return _circuity_avg(lengths, sl_dists)
+
+
+def _edge_arrays(
+    G: nx.MultiGraph | nx.MultiDiGraph,
+) -> tuple[
+    npt.NDArray[np.int64],
+    npt.NDArray[np.int64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    list[dict[str, Any]],
+]:
+    """
+    Extract a graph's edges' endpoints, lengths, and data in one pass.
+
+    Parameters
+    ----------
+    G
+        Input graph.
+
+    Returns
+    -------
+    u, v, lengths, xy, edge_data
+        The edges' endpoints' positions in the node order of `G`, the edges'
+        lengths, an array of every node's (x, y) coordinates in the node
+        order of `G`, and the edges' attribute data dicts.
+    """
+    node_index = pd.Index(G.nodes)
+    xy = np.array([(d["x"], d["y"]) for _, d in G.nodes(data=True)], dtype=float).reshape(-1, 2)
+
+    edges = list(G.edges(data=True))
+    u = node_index.get_indexer([u for u, _, _ in edges])
+    v = node_index.get_indexer([v for _, v, _ in edges])
+    edge_data = [d for _, _, d in edges]
+    lengths = np.array([d["length"] for d in edge_data], dtype=float)
+    return u, v, lengths, xy, edge_data
+
+
+def _straight_line_dists(
+    xy: npt.NDArray[np.float64],
+    u: npt.NDArray[np.int64],
+    v: npt.NDArray[np.int64],
+    crs: Any,  # noqa: ANN401
+) -> npt.NDArray[np.float64]:
+    """
+    Calculate straight-line distances between edges' endpoints.
+
+    Calculates euclidean distances if `crs` is projected or great-circle
+    distances if it is unprojected.
+
+    Parameters
+    ----------
+    xy
+        Array of every node's (x, y) coordinates.
+    u
+        The edges' origin nodes' positions in `xy`.
+    v
+        The edges' destination nodes' positions in `xy`.
+    crs
+        The coordinate reference system of the coordinates.
+
+    Returns
+    -------
+    sl_dists
+        The straight-line distance between each edge's endpoints.
+    """
+    x1: npt.NDArray[np.float64] = xy[u, 0]
+    y1: npt.NDArray[np.float64] = xy[u, 1]
+    x2: npt.NDArray[np.float64] = xy[v, 0]
+    y2: npt.NDArray[np.float64] = xy[v, 1]
+    if projection.is_projected(crs):
+        return distance.euclidean(y1=y1, x1=x1, y2=y2, x2=x2)
+    return distance.great_circle(lat1=y1, lon1=x1, lat2=y2, lon2=x2)
+
+
+def _circuity_avg(
+    lengths: npt.NDArray[np.float64],
+    sl_dists: npt.NDArray[np.float64],
+) -> float | None:
+    """
+    Calculate average circuity from edges' lengths and straight-line distances.
 
+    Parameters
+    ----------
+    lengths
+        The edges' lengths.
+    sl_dists
+        The straight-line distances between the edges' endpoints.
+
+    Returns
+    -------
+    circuity_avg
+        The edges' average circuity.
+    """
     # return the ratio, handling possible division by zero
     sl_dists_total = sl_dists[~np.isnan(sl_dists)].sum()
     try:
-        return float(edge_length_total(Gu) / sl_dists_total)
+        return float(lengths.sum() / sl_dists_total)
     except ZeroDivisionError:
         return None
 
@@ -298,26 +415,37 @@ def count_streets_per_node(
         Counts of how many physical streets connect to each node, with keys =
         node ids and values = counts.
     """
-    if nodes is None:
-        nodes = G.nodes
-
-    # get one copy of each self-loop edge, because bi-directional self-loops
-    # appear twice in the undirected graph (u,v,0 and u,v,1 where u=v), but
-    # one-way self-loops will appear only once
-    Gu = G.to_undirected(reciprocal=False, as_view=True)
-    self_loop_edges = set(nx.selfloop_edges(Gu, keys=False))
-
-    # get all non-self-loop undirected edges, including parallel edges
-    non_self_loop_edges = [e for e in Gu.edges(keys=False) if e not in self_loop_edges]
-
-    # make list of all unique edges including each parallel edge unless the
-    # parallel edge is a self-loop, in which case we don't double-count it
-    all_unique_edges = non_self_loop_edges + list(self_loop_edges)
-
-    # flatten list of (u, v) edge tuples to count how often each node appears
-    edges_flat = chain.from_iterable(all_unique_edges)
-    counts = Counter(edges_flat)
-    streets_per_node = {node: counts[node] for node in nodes}
+    nodes = list(G.nodes if nodes is None else nodes)
+
+    # encode edges' endpoints as integer positions in the node index and
+    # their keys as integer codes, so everything below is array operations
+    node_index = pd.Index(G.nodes)
+    counts = np.zeros(len(node_index) + 1, dtype=np.int64)
+    uvk = list(G.edges(keys=True))
+    if len(uvk) > 0:
+        us, vs, keys = zip(*uvk)
+        u = node_index.get_indexer(us)
+        v = node_index.get_indexer(vs)
+        is_loop = u == v
+
+        # in the undirected graph, reciprocal directed edges u->v and v->u
+        # with the same key collapse into one edge, so dedupe non-self-loop
+        # edges by their sorted endpoint pair plus key, then count each end
+        edges = pd.DataFrame({"u": np.minimum(u, v), "v": np.maximum(u, v)})
+        edges["key"] = pd.factorize(pd.Series(keys, dtype=object))[0]
+        edges = edges[~is_loop].drop_duplicates()
+        counts[:-1] += np.bincount(edges["u"], minlength=len(node_index))
+        counts[:-1] += np.bincount(edges["v"], minlength=len(node_index))
+
+        # count self-loops only once per node, because bi-directional
+        # self-loops appear twice in the undirected graph but one-way
+        # self-loops appear only once. the self-loop contributes 2 to its
+        # node's count because both of its ends are incident on that node
+        counts[np.unique(u[is_loop])] += 2
+
+    # nodes not in the graph (i.e., index position -1) get the last slot's 0
+    positions = node_index.get_indexer(nodes)
+    streets_per_node = dict(zip(nodes, counts[positions].tolist()))
 
     msg = "Counted undirected street segments incident on each node"
     utils.log(msg, level=lg.INFO)
@@ -377,20 +505,29 @@ def basic_stats(
     Gu = convert.to_undirected(G)
     stats: dict[str, Any] = {}
 
+    # extract the node and edge data that the measures need just once, then
+    # derive every measure from these arrays rather than re-walking the graph
+    # (and its undirected representation) once per measure
+    spn = np.array(list(streets_per_node(G).values()), dtype=np.int64)
+    lengths = [length for _, _, length in G.edges(data="length")]
+    u, v, street_lengths, xy, _ = _edge_arrays(Gu)
+
     stats["n"] = len(G.nodes)
-    stats["m"] = len(G.edges)
+    stats["m"] = len(lengths)
     stats["k_avg"] = 2 * stats["m"] / stats["n"]
-    stats["edge_length_total"] = edge_length_total(G)
+    stats["edge_length_total"] = float(sum(lengths))
     stats["edge_length_avg"] = stats["edge_length_total"] / stats["m"]
-    stats["streets_per_node_avg"] = streets_per_node_avg(G)
-    stats["streets_per_node_counts"] = streets_per_node_counts(G)
-    stats["streets_per_node_proportions"] = streets_per_node_proportions(G)
-    stats["intersection_count"] = intersection_count(G)
-    stats["street_length_total"] = street_length_total(Gu)
-    stats["street_segment_count"] = street_segment_count(Gu)
+    stats["streets_per_node_avg"] = float(spn.sum() / stats["n"])
+    spnc = np.bincount(spn).tolist()
+    stats["streets_per_node_counts"] = dict(enumerate(spnc))
+    stats["streets_per_node_proportions"] = {i: c / stats["n"] for i, c in enumerate(spnc)}
+    stats["intersection_count"] = int((spn >= 2).sum())  # noqa: PLR2004
+    stats["street_length_total"] = float(street_lengths.sum())
+    stats["street_segment_count"] = len(street_lengths)
     stats["street_length_avg"] = stats["street_length_total"] / stats["street_segment_count"]
-    stats["circuity_avg"] = circuity_avg(Gu)
-    stats["self_loop_proportion"] = self_loop_proportion(Gu)
+    sl_dists = _straight_line_dists(xy, u, v, Gu.graph["crs"])
+    stats["circuity_avg"] = _circuity_avg(street_lengths, sl_dists)
+    stats["self_loop_proportion"] = float((u == v).sum() / len(street_lengths))
 
     # calculate clean intersection counts if requested
     if clean_int_tol:
@@ -414,3 +551,213 @@ def basic_stats(
             stats["clean_intersection_density_km"] = stats["clean_intersection_count"] / area_km
 
     return stats
+
+
+def batch_stats(
+    filepaths: Iterable[str | Path],
+    output_path: str | Path,
+    *,
+    metrics: Iterable[str] | None = None,
+    clean_int_tol: float | None = None,
+    cpus: int | None = 1,
+    checkpoint_size: int = 100,
+) -> pd.DataFrame:
+    """
+    Calculate measures of many saved graphs and checkpoint them to a file.
+
+    Loads each GraphML file (saved by `io.save_graphml`) with
+    `io.load_graphml` in a pool of worker processes, calculates the requested
+    measures, and saves the results to `output_path` after every
+    `checkpoint_size` graphs. If `output_path` already exists, any graphs
+    whose filepaths it already contains are skipped, so you can resume an
+    interrupted run by calling this function again with the same arguments.
+    Graphs whose measures cannot be calculated (such as projected graphs'
+    "orientation_entropy") are logged and skipped, so a later run retries them.
+
+    Results are saved as CSV if `output_path` has a ".csv" extension, or as
+    Parquet otherwise (which requires that pyarrow or fastparquet is
+    installed). Each checkpoint writes all the results to a temporary file
+    that then replaces `output_path`, so an interrupted run can't leave a
+    partly written file behind. Dict-valued measures (i.e., streets-per-node
+    counts and proportions) are saved as JSON strings.
+
+    Parameters
+    ----------
+    filepaths
+        Paths to the GraphML files to analyze.
+    output_path
+        Path to the CSV or Parquet file to save the results to.
+    metrics
+        Which measures to calculate. Can include any of the keys returned by
+        `basic_stats` except for the density measures (which need each
+        graph's area), plus "orientation_entropy" to calculate the
+        `bearing.orientation_entropy` of each unprojected graph's undirected
+        representation. If None, calculate all of the `basic_stats` measures
+        (including "clean_intersection_count" if `clean_int_tol` is not None).
+    clean_int_tol
+        Tolerance to pass to `basic_stats` to calculate the
+        "clean_intersection_count" measure.
+    cpus
+        How many CPU cores to use. If None, use all available.
+    checkpoint_size
+        Save the results to `output_path` after every this many graphs.
+
+    Returns
+    -------
+    results
+        One row per graph, indexed by filepath, including any results from
+        previous runs that were already saved in `output_path`.
+    """
+    # validate the requested measures
+    all_metrics = (*_BASIC_STATS_MEASURES, "clean_intersection_count", "orientation_entropy")
+    if metrics is None:
+        metrics = _BASIC_STATS_MEASURES
+        if clean_int_tol is not None:
+            metrics = (*metrics, "clean_intersection_count")
+    metrics = tuple(metrics)
+    invalid = set(metrics) - set(all_metrics)
+    if invalid:
+        msg = f"Invalid metrics {sorted(invalid)}: must be in {all_metrics}."
+        raise ValueError(msg)
+    if "clean_intersection_count" in metrics and clean_int_tol is None:
+        msg = "`clean_int_tol` must be provided to calculate 'clean_intersection_count'."
+        raise ValueError(msg)
+
+    # load any results already saved by a previous run, then skip those graphs
+    output_path = Path(output_path)
+    is_csv = output_path.suffix == ".csv"
+    results = pd.DataFrame(columns=["filepath", *metrics])
+    if output_path.is_file():
+        results = pd.read_csv(output_path) if is_csv else pd.read_parquet(output_path)
+        saved_metrics = [col for col in results.columns if col != "filepath"]
+        if set(saved_metrics) != set(metrics):
+            msg = (
+                f"{str(output_path)!r} already has results for metrics {saved_metrics}: "
+                f"resume with the same metrics or save to a different `output_path`."
+            )
+            raise ValueError(msg)
+    finished = set(results["filepath"])
+    todo = [fp for fp in map(str, filepaths) if fp not in finished]
+
+    if cpus is None:
+        cpus = mp.cpu_count()
+    cpus = min(cpus, mp.cpu_count(), max(len(todo), 1))
+    msg = f"Calculating measures of {len(todo):,} graphs with {cpus} CPUs ({len(finished):,} done)"
+    utils.log(msg, level=lg.INFO)
+
+    # calculate the measures, saving a checkpoint after every chunk of graphs
+    args = [(fp, metrics, clean_int_tol) for fp in todo]
+    chunks = [args[i : i + checkpoint_size] for i in range(0, len(args), checkpoint_size)]
+
+    # if single-threading, calculate each graph's measures one at a time
+    if cpus == 1:
+        for chunk in chunks:
+            rows = [_graph_measures(*arg) for arg in chunk]
+            results = _save_checkpoint(results, rows, output_path, is_csv=is_csv)
+
+    # if multi-threading, calculate each chunk's graphs' measures in parallel
+    else:
+        with mp.get_context("spawn").Pool(cpus) as pool:
+            for chunk in chunks:
+                rows = pool.starmap_async(_graph_measures, chunk).get()
+                results = _save_checkpoint(results, rows, output_path, is_csv=is_csv)
+
+    msg = f"Saved measures of {len(results):,} graphs to {str(output_path)!r}"
+    utils.log(msg, level=lg.INFO)
+    return results.set_index("filepath")
+
+
+def _graph_measures(
+    filepath: str,
+    metrics: tuple[str, ...],
+    clean_int_tol: float | None,
+) -> dict[str, Any]:
+    """
+    Load a saved graph and calculate its measures.
+
+    Parameters
+    ----------
+    filepath
+        Path to the GraphML file to load.
+    metrics
+        Which measures to calculate.
+    clean_int_tol
+        Tolerance to pass to `basic_stats`.
+
+    Returns
+    -------
+    row
+        The graph's filepath and its measures' values, with any dict values
+        serialized as JSON strings. Or if they could not be calculated, the
+        graph's filepath and the error.
+    """
+    # return rather than raise any error, so one bad graph can't abort the
+    # whole batch and lose its unsaved results
+    try:
+        G = io.load_graphml(filepath)
+        measures: dict[str, Any] = {}
+        if any(metric != "orientation_entropy" for metric in metrics):
+            measures.update(basic_stats(G, clean_int_tol=clean_int_tol))
+        if "orientation_entropy" in metrics:
+            Gu = convert.to_undirected(bearing.add_edge_bearings(G))
+            measures["orientation_entropy"] = bearing.orientation_entropy(Gu)
+    except Exception as e:  # noqa: BLE001
+        return {"filepath": filepath, "error": repr(e)}
+
+    row: dict[str, Any] = {"filepath": filepath}
+    for metric in metrics:
+        value = measures[metric]
+        row[metric] = json.dumps(value) if isinstance(value, dict) else value
+    return row
+
+
+def _save_checkpoint(
+    results: pd.DataFrame,
+    rows: list[dict[str, Any]],
+    output_path: Path,
+    *,
+    is_csv: bool,
+) -> pd.DataFrame:
+    """
+    Save a chunk of new rows of results to disk.
+
+    Parameters
+    ----------
+    results
+        The results saved so far.
+    rows
+        The new rows of results to save. Rows with an "error" are logged and
+        not saved.
+    output_path
+        Path to the CSV or Parquet file to save the results to.
+    is_csv
+        If True, save the results as CSV. Otherwise save them as Parquet.
+
+    Returns
+    -------
+    results
+        The results saved so far, including the new rows.
+    """
+    for row in rows:
+        if "error" in row:
+            msg = f"Could not calculate measures of {row['filepath']!r}: {row['error']}"
+            utils.log(msg, level=lg.WARNING)
+    new_results = pd.DataFrame([row for row in rows if "error" not in row], columns=results.columns)
+    if results.empty:
+        results = new_results
+    elif not new_results.empty:
+        results = pd.concat([results, new_results], ignore_index=True)
+
+    # write to a temporary file then rename it, so a crash mid-write can't
+    # corrupt the results previously saved
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(f"{output_path.name}.temp")
+    if is_csv:
+        results.to_csv(temp_path, index=False)
+    else:
+        results.to_parquet(temp_path, index=False)
+    temp_path.replace(output_path)
+
+    msg = f"Saved checkpoint of {len(results):,} graphs' measures to {str(output_path)!r}"
+    utils.log(msg, level=lg.INFO)
+    return results
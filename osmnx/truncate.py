@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import copy
 import logging as lg
+from itertools import chain
 from typing import TYPE_CHECKING
 
 import networkx as nx
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import shapely
 
-from . import convert
 from . import utils
 from . import utils_geo
 
+# scipy is optional dependency for fast connected component labeling
+try:
+    from scipy.sparse import csgraph
+    from scipy.sparse import csr_matrix
+except ImportError:  # pragma: no cover
+    csgraph = None
+    csr_matrix = None
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from shapely import MultiPolygon
     from shapely import Polygon
 
@@ -26,8 +41,9 @@ def truncate_graph_dist(
     """
     Remove from a graph every node beyond some network distance from a node.
 
-    This function must calculate shortest path distances between `source_node`
-    and every other graph node, which can be slow on large graphs.
+    This function calculates shortest path distances outward from
+    `source_node` with Dijkstra's algorithm, but stops searching once it
+    passes `dist`, so it only explores the retained neighborhood.
 
     Parameters
     ----------
@@ -47,16 +63,19 @@ def truncate_graph_dist(
     G
         The truncated graph.
     """
-    # get the shortest distance between the node and every other node
-    distances = nx.shortest_path_length(G, source=source_node, weight=weight)
-
-    # then identify every node further than dist away
-    distant_nodes = {k for k, v in distances.items() if v > dist}
-    unreachable_nodes = G.nodes - distances.keys()
-
-    # make a copy to not mutate original graph object caller passed in
-    G = G.copy()
-    G.remove_nodes_from(distant_nodes | unreachable_nodes)
+    # get the shortest distance between the node and every other node within
+    # dist of it: every node further away or unreachable will be removed
+    distances = nx.single_source_dijkstra_path_length(
+        G,
+        source=source_node,
+        cutoff=dist,
+        weight=weight,
+    )
+
+    # copy just the nodes to keep (and the edges between them) into a new
+    # graph, rather than copying the whole graph then removing nodes from it.
+    # keep them in G's node order rather than in the order they were reached.
+    G = _induced_subgraph(G, (node for node in G if node in distances))
 
     msg = f"Truncated graph by {weight}-weighted network distance"
     utils.log(msg, level=lg.INFO)
@@ -123,37 +142,36 @@ def truncate_graph_polygon(
     msg = "Identifying all nodes that lie outside the polygon..."
     utils.log(msg, level=lg.INFO)
 
-    # first identify all nodes whose point geometries lie within the polygon
-    gs_nodes = convert.graph_to_gdfs(G, edges=False)["geometry"]
-    to_keep = utils_geo._intersect_index_quadrats(gs_nodes, polygon)
+    # first identify all nodes whose coordinates lie within the polygon
+    nodes = pd.Index(G.nodes)
+    x = np.array([x for _, x in G.nodes(data="x")], dtype=float)
+    y = np.array([y for _, y in G.nodes(data="y")], dtype=float)
+    # prepare a copy so the caller's polygon is not modified
+    polygon = copy.copy(polygon)
+    shapely.prepare(polygon)
+    inside = shapely.intersects_xy(polygon, x, y)
 
-    if len(to_keep) == 0:
+    if not inside.any():
         # no graph nodes within the polygon: can't create a graph from that
         msg = "Found no graph nodes within the requested polygon."
         raise ValueError(msg)
 
-    # now identify all nodes whose point geometries lie outside the polygon
-    gs_nodes_outside_poly = gs_nodes[~gs_nodes.index.isin(to_keep)]
-    nodes_outside_poly = set(gs_nodes_outside_poly.index)
-
     if truncate_by_edge:
         # retain nodes outside boundary polygon if at least one of node's
-        # neighbors is within the polygon
-        nodes_to_remove = set()
-        for node in nodes_outside_poly:
-            # if all the neighbors of this node also lie outside polygon, then
-            # mark this node for removal
-            neighbors = set(G.successors(node)) | set(G.predecessors(node))
-            if neighbors.issubset(nodes_outside_poly):
-                nodes_to_remove.add(node)
+        # neighbors is within the polygon: that is, if any incoming or
+        # outgoing edge connects it to a node inside the polygon
+        u_idx = nodes.get_indexer([u for u, _ in G.edges(keys=False)])
+        v_idx = nodes.get_indexer([v for _, v in G.edges(keys=False)])
+        to_keep = inside.copy()
+        to_keep[u_idx[inside[v_idx]]] = True
+        to_keep[v_idx[inside[u_idx]]] = True
     else:
-        nodes_to_remove = nodes_outside_poly
+        to_keep = inside
 
-    # now remove from the graph all those nodes that lie outside the polygon
-    # make a copy to not mutate original graph object caller passed in
-    G = G.copy()
-    G.remove_nodes_from(nodes_to_remove)
-    msg = f"Removed {len(nodes_to_remove):,} nodes outside polygon"
+    # now copy just the nodes to keep (and the edges between them) to a new
+    # graph, so we don't mutate the original graph object caller passed in
+    G = _induced_subgraph(G, nodes[to_keep])
+    msg = f"Removed {len(nodes) - len(G):,} nodes outside polygon"
     utils.log(msg, level=lg.INFO)
 
     msg = "Truncated graph by polygon"
@@ -165,6 +183,9 @@ def largest_component(G: nx.MultiDiGraph, *, strongly: bool = False) -> nx.Multi
     """
     Return `G`'s largest weakly or strongly connected component as a graph.
 
+    If scipy is installed as an optional dependency, this labels components
+    with its sparse graph routines for speed. Otherwise it uses networkx.
+
     Parameters
     ----------
     G
@@ -178,24 +199,100 @@ def largest_component(G: nx.MultiDiGraph, *, strongly: bool = False) -> nx.Multi
     G
         The largest connected component subgraph of the original graph.
     """
-    if strongly:
-        kind = "strongly"
-        is_connected = nx.is_strongly_connected
-        connected_components = nx.strongly_connected_components
+    kind = "strongly" if strongly else "weakly"
+    n = len(G)
+
+    if csgraph is None:  # pragma: no cover
+        # fall back to networkx's pure-python component search if no scipy
+        if strongly:
+            is_connected = nx.is_strongly_connected
+            connected_components = nx.strongly_connected_components
+        else:
+            is_connected = nx.is_weakly_connected
+            connected_components = nx.weakly_connected_components
+        if is_connected(G):
+            return G
+        component = max(connected_components(G), key=len)
+        largest_cc = [node for node in G if node in component]
+
     else:
-        kind = "weakly"
-        is_connected = nx.is_weakly_connected
-        connected_components = nx.weakly_connected_components
+        # label every node's component in one pass, then if there is more
+        # than one component, identify the largest one by its label counts
+        nodes, labels = _component_labels(G, strongly=strongly)
+        if labels.max(initial=0) == 0:
+            return G
+        largest_cc = nodes[labels == np.bincount(labels).argmax()]
+
+    G = _induced_subgraph(G, largest_cc)
+    msg = f"Got largest {kind} connected component ({len(G):,} of {n:,} total nodes)"
+    utils.log(msg, level=lg.INFO)
+    return G
 
-    if not is_connected(G):
-        # get all the connected components in graph then identify the largest
-        largest_cc = max(connected_components(G), key=len)
-        n = len(G)
 
-        # induce (frozen) subgraph then unfreeze it by making new MultiDiGraph
-        G = nx.MultiDiGraph(G.subgraph(largest_cc))
+def _component_labels(
+    G: nx.MultiDiGraph,
+    *,
+    strongly: bool,
+) -> tuple[pd.Index, npt.NDArray[np.int32]]:
+    """
+    Label each node in a graph by the connected component it belongs to.
 
-        msg = f"Got largest {kind} connected component ({len(G):,} of {n:,} total nodes)"
-        utils.log(msg, level=lg.INFO)
+    Encodes the graph's nodes as integers and labels their components with
+    `scipy.sparse.csgraph.connected_components` on the resulting sparse
+    adjacency matrix. Parallel edges are collapsed as they cannot affect
+    connectivity.
 
-    return G
+    Parameters
+    ----------
+    G
+        Input graph.
+    strongly
+        If True, label strongly connected components. Otherwise label weakly
+        connected components.
+
+    Returns
+    -------
+    nodes, labels
+        The graph's nodes, and each node's integer component label.
+    """
+    # encode each node's successors as integer positions in the node index
+    nodes = pd.Index(G.nodes)
+    degrees = np.fromiter(map(len, G.succ.values()), dtype=np.int64, count=len(nodes))
+    u = np.repeat(np.arange(len(nodes)), degrees)
+    v = nodes.get_indexer(list(chain.from_iterable(G.succ.values())))
+    adj = csr_matrix((np.ones(len(u), dtype=np.int8), (u, v)), shape=(len(nodes),) * 2)
+    connection = "strong" if strongly else "weak"
+    _, labels = csgraph.connected_components(adj, directed=True, connection=connection)
+    return nodes, labels
+
+
+def _induced_subgraph(G: nx.MultiDiGraph, nodes: Iterable[int]) -> nx.MultiDiGraph:
+    """
+    Copy the subgraph of `G` induced by some of its nodes into a new graph.
+
+    This copies the same nodes and edges as `nx.MultiDiGraph(G.subgraph(nodes))`
+    or as copying `G` then removing every other node, but it only copies the
+    retained nodes' and edges' attribute dicts and never copies or visits the
+    rest of `G`. The new graph's nodes are in the order of `nodes`.
+
+    Parameters
+    ----------
+    G
+        Input graph.
+    nodes
+        The nodes to retain, in the order to add them to the new graph.
+
+    Returns
+    -------
+    G_sub
+        The induced subgraph, with its own copies of the graph, node, and edge
+        attribute dicts.
+    """
+    keep = dict.fromkeys(nodes)
+    G_sub = G.__class__()
+    G_sub.graph.update(G.graph)
+    G_sub.add_nodes_from((node, G.nodes[node]) for node in keep)
+    G_sub.add_edges_from(
+        (u, v, k, data) for u, v, k, data in G.edges(keep, keys=True, data=True) if v in keep
+    )
+    return G_sub
@@ -19,10 +19,14 @@ from pathlib import Path
 import geopandas as gpd
 import networkx as nx
 import numpy as np
+import osmium
 import pandas as pd
 import pytest
+import shapely
 from lxml import etree
 from requests.exceptions import ConnectionError
+from shapely import LineString
+from shapely import MultiPolygon
 from shapely import Point
 from shapely import Polygon
 from shapely import wkt
@@ -102,7 +106,7 @@ def test_geocoder() -> None:
         _ = ox.geocode_to_gdf("Bunker Hill, Los Angeles, CA, USA")
 
 
-def test_stats() -> None:
+def test_stats() -> None:  # noqa: PLR0915
     """Test generating graph stats."""
     # create graph, add a new node, add bearings, project it
     G = ox.graph_from_place(place1, network_type="all")
@@ -110,12 +114,85 @@ def test_stats() -> None:
     G_proj = ox.project_graph(G)
     G_proj = ox.distance.add_edge_lengths(G_proj, edges=tuple(G_proj.edges)[0:3])
 
+    # projecting back to lat-long recovers the original node coordinates
+    assert ox.projection.is_projected(G_proj.graph["crs"])
+    G_latlong = ox.project_graph(G_proj, to_latlong=True)
+    assert G_latlong.nodes[0]["x"] == pytest.approx(location_point[1])
+    assert G_latlong.nodes[0]["y"] == pytest.approx(location_point[0])
+
+    # projecting a simplified graph also projects its edge geometries, whose
+    # endpoints stay on their projected nodes, without modifying the original
+    Gx = ox.graph_from_xml("tests/input_data/West-Oakland.osm.bz2")
+    u, v, k, geom = next(e for e in Gx.edges(keys=True, data="geometry") if e[3] is not None)
+    Gx_proj = ox.project_graph(Gx)
+    assert list(Gx_proj.nodes) == list(Gx.nodes)
+    assert Gx.edges[u, v, k]["geometry"] is geom
+    geom_proj = Gx_proj.edges[u, v, k]["geometry"]
+    assert len(geom_proj.coords) == len(geom.coords)
+    assert geom_proj.coords[0] == pytest.approx((Gx_proj.nodes[u]["x"], Gx_proj.nodes[u]["y"]))
+    assert geom_proj.coords[-1] == pytest.approx((Gx_proj.nodes[v]["x"], Gx_proj.nodes[v]["y"]))
+
     # calculate stats
     cspn = ox.stats.count_streets_per_node(G)
+    assert cspn[0] == 0
+    H = nx.MultiDiGraph([(1, 2), (2, 1), (2, 3), (3, 3), (3, 3)])
+    cspn = ox.stats.count_streets_per_node(H, nodes=[1, 2, 3, 4])
+    assert cspn == {1: 1, 2: 2, 3: 3, 4: 0}
     stats = ox.basic_stats(G)
     stats = ox.basic_stats(G, area=1000)
     stats = ox.basic_stats(G_proj, area=1000, clean_int_tol=15)
 
+    # basic_stats measures match those of the individual measure functions
+    nx.set_node_attributes(Gx, ox.stats.count_streets_per_node(Gx), name="street_count")
+    stats = ox.basic_stats(Gx)
+    Gxu = ox.convert.to_undirected(Gx)
+    assert stats["m"] == len(Gx.edges)
+    assert stats["edge_length_total"] == pytest.approx(ox.stats.edge_length_total(Gx))
+    assert stats["streets_per_node_avg"] == pytest.approx(ox.stats.streets_per_node_avg(Gx))
+    assert stats["streets_per_node_counts"] == ox.stats.streets_per_node_counts(Gx)
+    assert stats["streets_per_node_proportions"] == ox.stats.streets_per_node_proportions(Gx)
+    assert stats["intersection_count"] == ox.stats.intersection_count(Gx)
+    assert stats["street_length_total"] == pytest.approx(ox.stats.street_length_total(Gxu))
+    assert stats["street_segment_count"] == ox.stats.street_segment_count(Gxu)
+    assert stats["circuity_avg"] == pytest.approx(ox.stats.circuity_avg(Gxu))
+    assert stats["self_loop_proportion"] == ox.stats.self_loop_proportion(Gxu)
+
+    Gu = ox.convert.to_undirected(G_proj)
+    circuity = ox.stats.circuity_avg(Gu, sl_dist_attr="sl_dist")
+    assert all("sl_dist" in d for _, _, d in Gu.edges(data=True))
+    assert ox.stats.circuity_avg(Gu, sl_dist_attr="sl_dist") == circuity
+
+    # reciprocal edges collapse to one undirected edge, but parallel streets
+    # with different geometries are both retained
+    H = nx.MultiDiGraph(crs="epsg:4326")
+    H.add_nodes_from([(1, {"x": 0.0, "y": 0.0}), (2, {"x": 1.0, "y": 0.0})])
+    H.add_edge(1, 2, osmid=5, geometry=LineString([(0, 0), (0.5, 1), (1, 0)]))
+    H.add_edge(2, 1, osmid=5, geometry=LineString([(1, 0), (0.5, 1), (0, 0)]))
+    H.add_edge(2, 1, osmid=5, geometry=LineString([(1, 0), (0.5, -1), (0, 0)]))
+    assert len(ox.convert.to_undirected(H).edges) == 2
+
+    # calculate stats of saved graphs in a batch, then resume the batch
+    fps = [Path(ox.settings.data_folder) / f"graph{i}.graphml" for i in range(3)]
+    for fp in fps:
+        ox.save_graphml(G, fp)
+    output_path = Path(ox.settings.data_folder) / "stats.csv"
+    output_path.unlink(missing_ok=True)
+    results = ox.stats.batch_stats(fps[:2], output_path, metrics=["n", "orientation_entropy"])
+    results = ox.stats.batch_stats(fps, output_path, metrics=["n", "orientation_entropy"], cpus=2)
+    assert results.shape == (3, 2)
+    assert (results["n"] == len(G)).all()
+    with pytest.raises(ValueError, match="Invalid metrics"):
+        ox.stats.batch_stats(fps, output_path, metrics=["x"])
+
+    # graphs whose measures can't be calculated are skipped, and resuming with
+    # different metrics raises an error
+    fp_proj = Path(ox.settings.data_folder) / "graph_proj.graphml"
+    ox.save_graphml(G_proj, fp_proj)
+    results = ox.stats.batch_stats([fp_proj], output_path, metrics=["n", "orientation_entropy"])
+    assert str(fp_proj) not in results.index
+    with pytest.raises(ValueError, match="already has results"):
+        ox.stats.batch_stats(fps, output_path, metrics=["n"])
+
     # test cleaning and rebuilding graph
     G_clean = ox.consolidate_intersections(G_proj, tolerance=10, rebuild_graph=True, dead_ends=True)
     G_clean = ox.consolidate_intersections(
@@ -159,13 +236,24 @@ def test_bearings() -> None:
     fig, ax = ox.plot.plot_orientation(Gu, area=True, title="Title")
     fig, ax = ox.plot.plot_orientation(Gu, ax=ax, area=False, title="Title")
 
+    # calculate entropies of multiple graphs in a batch
+    fp = Path(ox.settings.data_folder) / "graph.graphml"
+    ox.save_graphml(G, fp)
+    entropies = ox.bearing.orientation_entropies([Gu, fp], weight="length", undirected=True)
+    assert entropies.groupby("graph")["entropy"].first().to_numpy() == pytest.approx([entropy] * 2)
+    entropies = ox.bearing.orientation_entropies(iter([Gu, fp]), num_bins=18, cpus=2)
+    assert entropies.shape == (2 * 18, 4)
+    assert list(entropies.columns) == ["graph", "bin", "count", "entropy"]
+
     # test support of edge bearings for directed and undirected graphs
     G = nx.MultiDiGraph(crs="epsg:4326")
     G.add_node("point_1", x=0.0, y=0.0)
     G.add_node("point_2", x=0.0, y=1.0)  # latitude increases northward
     G.add_edge("point_1", "point_2", weight=2.0)
+    G.add_edge("point_1", "point_1", weight=2.0)  # self-loop has no bearing
     G = ox.distance.add_edge_lengths(G)
     G = ox.add_edge_bearings(G)
+    assert "bearing" not in G.edges["point_1", "point_1", 0]
     with pytest.warns(UserWarning, match="edge bearings will be directional"):
         bearings, weights = ox.bearing._extract_edge_bearings(G, min_length=0, weight=None)
     assert list(bearings) == [0.0]  # north
@@ -197,7 +285,7 @@ def test_bearings() -> None:
     assert list(bin_centers) == [0.0, 180.0]
 
 
-def test_osm_xml() -> None:
+def test_osm_xml() -> None:  # noqa: PLR0915
     """Test working with .osm XML data."""
     # test loading a graph from a local .osm xml file
     node_id = 53098262
@@ -211,6 +299,8 @@ def test_osm_xml() -> None:
     for filename in ("tests/input_data/West-Oakland.osm.bz2", temp_filename):
         G = ox.graph_from_xml(filename)
         assert node_id in G.nodes
+        response_json = ox._osm_xml._overpass_json_from_xml(filename, "utf-8")
+        assert response_json["generator"] == "Osmosis 0.46"
 
         for neighbor_id in neighbor_ids:
             edge_key = (node_id, neighbor_id, 0)
@@ -218,6 +308,44 @@ def test_osm_xml() -> None:
             assert edge_key in G.edges
             assert G.edges[edge_key]["name"] in {"8th Street", "Willow Street"}
 
+    # test loading a graph and features from the same data as a .osm.pbf file
+    pbf_filepath = Path(ox.settings.data_folder) / "West-Oakland.osm.pbf"
+    pbf_filepath.parent.mkdir(parents=True, exist_ok=True)
+    writer = osmium.SimpleWriter(str(pbf_filepath), overwrite=True)
+    for obj in osmium.FileProcessor(temp_filename):
+        writer.add(obj)
+    writer.close()
+    G_pbf = ox.graph_from_pbf(pbf_filepath, custom_filter='["highway"]')
+    assert set(G_pbf.edges) == set(G.edges)
+    G_pbf = ox.graph_from_pbf(pbf_filepath, network_type="drive", retain_all=True)
+    assert all(d["highway"] != "footway" for _, _, d in G_pbf.edges(data=True))
+    gdf_pbf = ox.features_from_pbf(pbf_filepath, tags={"building": True})
+    gdf_xml = ox.features_from_xml(temp_filename, tags={"building": True})
+    assert gdf_pbf.index.sort_values().equals(gdf_xml.index.sort_values())
+    with pytest.raises(ValueError, match="unsupported syntax"):
+        ox.graph_from_pbf(pbf_filepath, custom_filter='way["highway"]')
+
+    # test clipping the graph to a bounding box while parsing the file
+    bbox = (37.8120, 37.8040, -122.2940, -122.3060)
+    G_clip = ox.graph_from_xml(temp_filename, bbox=bbox, simplify=False)
+    assert node_id in G_clip.nodes
+    assert all(bbox[1] <= y <= bbox[0] for _, y in G_clip.nodes(data="y"))
+    assert all(bbox[3] <= x <= bbox[2] for _, x in G_clip.nodes(data="x"))
+    G_clip = ox.graph_from_pbf(pbf_filepath, polygon=ox.utils_geo.bbox_to_poly(bbox))
+    assert node_id in G_clip.nodes
+
+    # clipping warns if ways precede their nodes and leaves the polygon unprepared
+    polygon = Polygon([(0, 0), (2, 0), (2, 2), (0, 2)])
+    elements = [
+        {"type": "way", "id": 1, "nodes": [1, 2], "tags": {"highway": "primary"}},
+        {"type": "node", "id": 1, "lat": 1, "lon": 1},
+        {"type": "node", "id": 2, "lat": 1, "lon": 3},
+    ]
+    with pytest.warns(UserWarning, match="Nodes follow ways"):
+        clipped = list(ox.graph._clip_elements(elements, polygon))
+    assert [element["id"] for element in clipped] == [1]
+    assert not shapely.is_prepared(polygon)
+
     Path.unlink(Path(temp_filename))
 
     # test OSM xml saving
@@ -230,6 +358,12 @@ def test_osm_xml() -> None:
     parser = etree.XMLParser(schema=etree.XMLSchema(file=xsd_filepath))
     _ = etree.parse(fp, parser=parser)  # noqa: S320
 
+    # an error while saving leaves no partly written file behind
+    fp_bad = Path(ox.settings.data_folder) / "graph_bad.osm"
+    with pytest.raises(AttributeError):
+        ox.io.save_graph_xml(G, filepath=fp_bad, way_tag_aggs={"name": "first"})
+    assert not fp_bad.exists()
+
     # test roundabout handling
     default_all_oneway = ox.settings.all_oneway
     ox.settings.all_oneway = True
@@ -289,7 +423,7 @@ def test_elevation() -> None:
     G = ox.add_edge_grades(G, add_absolute=True)
 
 
-def test_routing() -> None:
+def test_routing() -> None:  # noqa: PLR0915
     """Test working with speed, travel time, and routing."""
     G = ox.graph_from_address(address=address, dist=500, dist_type="bbox", network_type="bike")
 
@@ -357,6 +491,37 @@ def test_routing() -> None:
     paths3 = ox.shortest_path(G, origs, dests, weight="length", cpus=None)
     assert paths1 == paths2 == paths3
 
+    # test multiple destinations sharing the same origin
+    paths4 = ox.shortest_path(G, [orig_node] * n, dests, weight="length")
+    assert all(
+        path is None or (path[0], path[-1]) == (orig_node, d) for path, d in zip(paths4, dests)
+    )
+
+    # test bidirectional search on the min-weight digraph view
+    paths5 = ox.shortest_path(G, origs, dests, weight="length", method="bidirectional")
+    assert [path is None for path in paths5] == [path is None for path in paths1]
+    route6 = ox.shortest_path(G, orig_node, dest_node, weight="travel_time", method="bidirectional")
+    assert route6 is not None
+
+    # in-place weight edits are respected by later bidirectional searches
+    H = nx.MultiDiGraph()
+    H.add_edges_from([(1, 2, {"hops": 1}), (2, 3, {"hops": 1}), (1, 3, {"hops": 5})])
+    assert ox.shortest_path(H, 1, 3, weight="hops", method="bidirectional") == [1, 2, 3]
+    H.edges[1, 3, 0]["hops"] = 1
+    assert ox.shortest_path(H, 1, 3, weight="hops", method="bidirectional") == [1, 3]
+    with pytest.raises(ValueError, match="Invalid shortest path method"):
+        route6 = ox.shortest_path(G, orig_node, dest_node, method="astar")
+
+    # test routing and nearest node search on a memory-mapped graph snapshot
+    ox.save_graph_snapshot(G, weights=["length", "travel_time"])
+    S = ox.load_graph_snapshot()
+    paths6 = ox.shortest_path(S, origs, dests, weight="length", cpus=2)
+    assert [path is None for path in paths6] == [path is None for path in paths1]
+    assert ox.shortest_path(S, orig_node, dest_node, weight="travel_time") is not None
+    assert int(ox.distance.nearest_nodes(S, orig_x, orig_y)[0]) == orig_node
+    with pytest.raises(ValueError, match="no saved edge attribute"):
+        ox.shortest_path(S, orig_node, dest_node, weight="speed_kph")
+
     # test k shortest paths
     routes = ox.routing.k_shortest_paths(G, orig_node, dest_node, k=2, weight="travel_time")
     fig, ax = ox.plot_graph_routes(G, list(routes))
@@ -515,6 +680,11 @@ def test_save_load() -> None:  # noqa: PLR0915
     _ = list(ox.utils_geo.interpolate_points(gdf_edges2["geometry"].iloc[0], 0.001))
     assert set(gdf_nodes1.index) == set(gdf_nodes2.index) == set(G.nodes) == set(G2.nodes)
     assert set(gdf_edges1.index) == set(gdf_edges2.index) == set(G.edges) == set(G2.edges)
+    ox.save_graph_geopackage(G, filepath=fp, node_attrs=["x", "y"], edge_attrs=["length"])
+    assert set(gpd.read_file(fp, layer="nodes").columns) == {"osmid", "x", "y", "geometry"}
+    assert set(gpd.read_file(fp, layer="edges").columns) == {"u", "v", "key", "length", "geometry"}
+    ox.save_graph_geopackage(G, filepath=fp, directed=True, encoding="latin-1")
+    assert len(gpd.read_file(fp, layer="edges")) == len(G.edges)
 
     # test code branches that should raise exceptions
     with pytest.raises(ValueError, match="You must request nodes or edges or both"):
@@ -522,6 +692,22 @@ def test_save_load() -> None:  # noqa: PLR0915
     with pytest.raises(ValueError, match="Invalid literal for boolean"):
         ox.io._convert_bool_string("T")
 
+    # save/load graph as geoparquet files, optionally loading only some columns
+    ox.save_graph_parquet(G)
+    G2 = ox.load_graph_parquet()
+    assert G2.graph == G.graph
+    assert list(G2.nodes(data=True)) == list(G.nodes(data=True))
+    assert list(G2.edges(keys=True, data=True)) == list(G.edges(keys=True, data=True))
+    G2 = ox.load_graph_parquet(node_columns=["x", "y"], edge_columns=["length"])
+    assert list(G2.edges) == list(G.edges)
+    assert all(set(d) == {"length"} for _, _, d in G2.edges(data=True))
+
+    # tuple attribute values survive the parquet round trip
+    H = G.copy()
+    nx.set_edge_attributes(H, {edge: (1, "a") for edge in list(H.edges)[:2]}, name="pair")
+    ox.save_graph_parquet(H)
+    assert list(ox.load_graph_parquet().edges(data="pair")) == list(H.edges(data="pair"))
+
     # create random boolean graph/node/edge attributes
     attr_name = "test_bool"
     G.graph[attr_name] = False
@@ -585,6 +771,39 @@ def test_save_load() -> None:  # noqa: PLR0915
     data = str(file_bytes.decode())
     G = ox.load_graphml(graphml_str=data, node_dtypes=nd, edge_dtypes=ed)
 
+    # test saving and loading compressed graphml
+    fp = ".temp/data/graph.graphml.gz"
+    ox.save_graphml(G, fp)
+    assert set(ox.load_graphml(fp).nodes) == set(G.nodes)
+
+    # test loading graphml with typed attributes and undirected edges
+    fp = ".temp/data/graph_typed.graphml"
+    nx.write_graphml(nx.MultiGraph([(1, 2, {"w": 1.5, "ok": True}), (1, 2, {"w": 2.0})]), fp)
+    with suppress_type_checks():
+        G = ox.load_graphml(fp)
+    assert not G.is_directed()
+    assert list(G.edges(keys=True, data=True)) == [
+        (1, 2, 0, {"w": 1.5, "ok": True}),
+        (1, 2, 1, {"w": 2.0}),
+    ]
+
+    # test round-tripping parallel edges from a graphml file without edge ids
+    data = (
+        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">'
+        '<key id="d0" for="edge" attr.name="length" attr.type="string"/>'
+        '<graph edgedefault="directed"><node id="1"/><node id="2"/>'
+        '<edge source="1" target="2"><data key="d0">5.0</data></edge>'
+        '<edge source="1" target="2"><data key="d0">7.0</data></edge>'
+        "</graph></graphml>"
+    )
+    G = ox.load_graphml(graphml_str=data)
+    assert list(G.edges(keys=True, data="length")) == [(1, 2, 0, 5.0), (1, 2, 1, 7.0)]
+    ox.save_graphml(G, fp)
+    assert list(ox.load_graphml(fp).edges(keys=True, data="length")) == [
+        (1, 2, 0, 5.0),
+        (1, 2, 1, 7.0),
+    ]
+
 
 def test_graph_from() -> None:
     """Test downloading graphs from Overpass."""
@@ -602,7 +821,20 @@ def test_graph_from() -> None:
     # truncate graph by bounding box
     bbox = ox.utils_geo.bbox_from_point(location_point, dist=400)
     G = ox.truncate.truncate_graph_bbox(G, bbox)
+    north, south, east, west = bbox
+    assert all(south <= y <= north for _, y in G.nodes(data="y"))
+    assert all(west <= x <= east for _, x in G.nodes(data="x"))
+    bbox_poly = ox.utils_geo.bbox_to_poly(bbox)
+    G = ox.truncate.truncate_graph_polygon(G, bbox_poly)
+    assert not shapely.is_prepared(bbox_poly)
     G = ox.truncate.largest_component(G, strongly=True)
+    assert nx.is_strongly_connected(G)
+
+    # truncate graph by network distance from a node
+    node = next(iter(G.nodes))
+    G_dist = ox.truncate.truncate_graph_dist(G, node, dist=300)
+    dists = nx.single_source_dijkstra_path_length(G, node, weight="length")
+    assert list(G_dist.nodes) == [n for n in G.nodes if dists.get(n, np.inf) <= 300]
 
     # graph from address
     G = ox.graph_from_address(address=address, dist=500, dist_type="bbox", network_type="bike")
@@ -693,6 +925,42 @@ def test_features() -> None:
 
     # features_from_xml - tests error handling of clipped XMLs with incomplete geometry
     gdf = ox.features_from_xml("tests/input_data/planet_10.068,48.135_10.071,48.137.osm")
+    gdf2 = ox.features_from_xml(
+        "tests/input_data/planet_10.068,48.135_10.071,48.137.osm",
+        cpus=2,
+    )
+    assert gdf.geometry.geom_equals(gdf2.geometry).all()
+
+    # test building multipolygons from outer rings that touch at one node,
+    # whatever the order of their member ways
+    way_geoms = {
+        1: LineString([(0, 0), (1, 0), (1, 1)]),
+        2: LineString([(1, 1), (0, 1), (0, 0)]),
+        3: LineString([(1, 1), (2, 1), (2, 2)]),
+        4: LineString([(2, 2), (1, 2), (1, 1)]),
+    }
+    for refs in ([1, 3, 4, 2], [1, 2, 3, 4], [3, 1, 2, 4]):
+        members = [{"type": "way", "ref": ref, "role": "outer"} for ref in refs]
+        geom = ox.features._build_relation_geometry(members, way_geoms)
+        assert isinstance(geom, MultiPolygon)
+        assert geom.is_valid
+        assert len(geom.geoms) == 2
+        assert geom.area == 2
+
+    # test subtracting overlapping inner rings from an outer ring
+    way_geoms = {
+        1: Polygon([(0, 0), (4, 0), (4, 4), (0, 4)]),
+        2: Polygon([(1, 1), (2, 1), (2, 2), (1, 2)]),
+        3: Polygon([(1.5, 1.5), (3, 1.5), (3, 3), (1.5, 3)]),
+    }
+    members = [
+        {"type": "way", "ref": 1, "role": "outer"},
+        {"type": "way", "ref": 2, "role": "inner"},
+        {"type": "way", "ref": 3, "role": "inner"},
+    ]
+    geom = ox.features._build_relation_geometry(members, way_geoms)
+    assert geom.is_valid
+    assert geom.area == 16 - way_geoms[2].union(way_geoms[3]).area
 
     # test loading a geodataframe from a local .osm xml file
     with bz2.BZ2File("tests/input_data/West-Oakland.osm.bz2") as f: